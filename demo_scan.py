@@ -5,190 +5,399 @@ This bypasses the solana-py library issues.
 """
 
 import asyncio
-import json
+import base64
+import struct
+import time
 import aiohttp
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 
+from solders.pubkey import Pubkey
 
-async def get_token_info(rpc_url: str, token_address: str):
-    """Get token information from Solana."""
+from src.utils.cache import TTLCache
+from src.utils.event_loop import install_uvloop
+from src.utils.serialization import json_dumps, json_loads
+
+
+# Shared HTTP session so repeated scans reuse pooled TCP/TLS connections
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Get or create the shared HTTP session."""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=10, connect=2)
+        _SESSION = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            json_serialize=json_dumps,
+        )
+    return _SESSION
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session."""
+    global _SESSION
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
+
+
+# Mint info and supply change rarely, so repeat scans reuse them for a while (seconds)
+CACHE_TTLS = {
+    "getAccountInfo": 3600,
+    "getTokenSupply": 60,
+}
+
+# Successful RPC responses keyed by (method, token address)
+_response_cache = TTLCache(maxsize=4096)
+
+# Read-only scan, so confirmed state is fresh enough and much newer than finalized
+COMMITMENT = "confirmed"
+
+# SPL mint account layout: mint authority option + key, supply, decimals,
+# is_initialized, freeze authority option + key (82 bytes)
+MINT_LAYOUT = struct.Struct("<I32sQBBI32s")
+
+# Hedged requests: wait this long for the primary before also asking the next endpoint
+HEDGE_DELAY_SECONDS = 0.05
+
+# Circuit breaker: skip an endpoint for a while after repeated consecutive failures
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN_SECONDS = 30.0
+
+# Per-URL circuit state: consecutive failures and when the endpoint may be retried
+_circuit_failures: Dict[str, int] = {}
+_circuit_open_until: Dict[str, float] = {}
+
+
+def _circuit_open(url: str) -> bool:
+    """Check if an endpoint is currently being skipped."""
+    return _circuit_open_until.get(url, 0.0) > time.monotonic()
+
+
+def _record_success(url: str) -> None:
+    """Reset circuit state for a healthy endpoint."""
+    _circuit_failures.pop(url, None)
+    _circuit_open_until.pop(url, None)
+
+
+def _record_failure(url: str) -> None:
+    """Count a failure and trip the circuit once the threshold is reached."""
+    failures = _circuit_failures.get(url, 0) + 1
+    _circuit_failures[url] = failures
+    if failures >= CIRCUIT_FAILURE_THRESHOLD:
+        _circuit_open_until[url] = time.monotonic() + CIRCUIT_COOLDOWN_SECONDS
+
+
+def _parse_mint(data: bytes) -> Dict[str, Any]:
+    """Decode a raw SPL mint account into the fields jsonParsed would report."""
+    (
+        mint_authority_option,
+        mint_authority,
+        supply,
+        decimals,
+        is_initialized,
+        freeze_authority_option,
+        freeze_authority,
+    ) = MINT_LAYOUT.unpack_from(data)
     
-    async with aiohttp.ClientSession() as session:
-        print(f"\n{'='*60}")
-        print(f"🔍 Scanning Token: {token_address}")
-        print(f"{'='*60}\n")
+    return {
+        "mintAuthority": str(Pubkey(mint_authority)) if mint_authority_option else None,
+        "supply": str(supply),
+        "decimals": decimals,
+        "isInitialized": bool(is_initialized),
+        "freezeAuthority": str(Pubkey(freeze_authority)) if freeze_authority_option else None,
+    }
+
+
+async def _post_json(session: aiohttp.ClientSession, url: str, payload: Any) -> Any:
+    """POST a JSON-RPC payload and return the decoded response."""
+    async with session.post(url, json=payload) as response:
+        response.raise_for_status()
+        return json_loads(await response.read())
+
+
+async def _hedged_post(
+    session: aiohttp.ClientSession,
+    urls: List[str],
+    payload: Any,
+    hedge_delay: float = HEDGE_DELAY_SECONDS,
+) -> Any:
+    """
+    POST to several RPC endpoints and return the first successful response.
+    
+    The request goes to the first healthy endpoint; if it hasn't answered within
+    hedge_delay (or fails), the next endpoint is tried as well. Slower requests
+    are cancelled once one succeeds. Raises ValueError if no URLs are given.
+    """
+    if not urls:
+        raise ValueError("At least one RPC URL is required")
+    
+    remaining = [url for url in urls if not _circuit_open(url)] or list(urls)
+    tasks: Dict["asyncio.Task[Any]", str] = {}
+    pending: set = set()
+    last_error: Optional[BaseException] = None
+    
+    try:
+        while remaining or pending:
+            if remaining:
+                url = remaining.pop(0)
+                task = asyncio.create_task(_post_json(session, url, payload))
+                tasks[task] = url
+                pending.add(task)
+            
+            # Only hedge while there is another endpoint left to try
+            timeout = hedge_delay if remaining else None
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    _record_success(tasks[task])
+                    return task.result()
+                last_error = error
+                _record_failure(tasks[task])
         
-        # Get account info
-        print("📊 Fetching on-chain data...")
-        payload = {
+        raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def get_token_info(
+    rpc_urls: Union[str, List[str]],
+    token_address: str,
+    session: Optional[aiohttp.ClientSession] = None,
+):
+    """Get token information from Solana."""
+    
+    if isinstance(rpc_urls, str):
+        rpc_urls = [rpc_urls]
+    
+    if session is None:
+        session = _get_session()
+    
+    print(f"\n{'='*60}")
+    print(f"🔍 Scanning Token: {token_address}")
+    print(f"{'='*60}\n")
+    
+    # Fetch account info, supply and largest holders in one round trip
+    print("📊 Fetching on-chain data...")
+    payload = [
+        {
             "jsonrpc": "2.0",
             "id": 1,
             "method": "getAccountInfo",
             "params": [
                 token_address,
-                {"encoding": "jsonParsed"}
+                # Only the fixed-size mint header; decoded client-side
+                {
+                    "encoding": "base64",
+                    "dataSlice": {"offset": 0, "length": MINT_LAYOUT.size},
+                    "commitment": COMMITMENT,
+                }
             ]
-        }
-        
-        async with session.post(rpc_url, json=payload) as response:
-            account_data = await response.json()
-        
-        if "result" in account_data and account_data["result"]["value"]:
-            result = account_data["result"]["value"]
-            data = result.get("data", {})
-            
-            if isinstance(data, dict) and "parsed" in data:
-                parsed = data["parsed"]
-                info = parsed.get("info", {})
-                
-                print("\n✅ Token Data Retrieved!")
-                print(f"   Owner: {result.get('owner', 'Unknown')}")
-                print(f"   Lamports: {result.get('lamports', 0):,}")
-                
-                if "decimals" in info:
-                    print(f"   Decimals: {info['decimals']}")
-                if "mintAuthority" in info:
-                    if info['mintAuthority']:
-                        print(f"   ⚠️  Mint Authority: {info['mintAuthority']}")
-                    else:
-                        print(f"   ✅ Mint Authority: Disabled")
-                if "freezeAuthority" in info:
-                    if info['freezeAuthority']:
-                        print(f"   ⚠️  Freeze Authority: {info['freezeAuthority']}")
-                    else:
-                        print(f"   ✅ Freeze Authority: Disabled")
-        
-        # Get token supply
-        print("\n📈 Fetching token supply...")
-        payload = {
+        },
+        {
             "jsonrpc": "2.0",
             "id": 2,
             "method": "getTokenSupply",
-            "params": [token_address]
-        }
-        
-        async with session.post(rpc_url, json=payload) as response:
-            supply_data = await response.json()
-        
-        if "result" in supply_data:
-            result = supply_data["result"]
-            value = result.get("value", {})
-            amount = float(value.get("amount", 0))
-            decimals = int(value.get("decimals", 9))
-            total_supply = amount / (10 ** decimals)
-            
-            print(f"   Total Supply: {total_supply:,.2f}")
-            print(f"   UI Amount: {value.get('uiAmountString', 'N/A')}")
-        
-        # Get largest holders
-        print("\n👥 Fetching top holders...")
-        payload = {
+            "params": [token_address, {"commitment": COMMITMENT}]
+        },
+        {
             "jsonrpc": "2.0",
             "id": 3,
             "method": "getTokenLargestAccounts",
-            "params": [token_address]
-        }
-        
-        async with session.post(rpc_url, json=payload) as response:
-            holders_data = await response.json()
-        
-        if "result" in holders_data:
-            accounts = holders_data["result"].get("value", [])
-            print(f"   Total Holders Tracked: {len(accounts)}")
-            
-            if accounts:
-                print("\n   Top 5 Holders:")
-                for i, account in enumerate(accounts[:5], 1):
-                    amount = float(account.get("amount", 0))
-                    if decimals:
-                        ui_amount = amount / (10 ** decimals)
-                        percent = (ui_amount / total_supply * 100) if total_supply > 0 else 0
-                        print(f"   #{i}: {ui_amount:,.2f} ({percent:.2f}%)")
-        
-        # Calculate simple score
-        print(f"\n{'='*60}")
-        print("🌙 MOON SCORE ANALYSIS")
-        print(f"{'='*60}\n")
-        
-        # Security checks
-        security_score = 0
-        security_checks = []
-        
-        # Initialize defaults
-        accounts = []
-        total_supply = 0
-        decimals = 9
-        
-        # Check mint authority
-        if info.get("mintAuthority") is None:
-            security_score += 25
-            security_checks.append("✅ Mint authority disabled (+25)")
+            "params": [token_address, {"commitment": COMMITMENT}]
+        },
+    ]
+    
+    # Serve what we can from cache and only ask the RPC for the rest
+    responses = {}
+    methods = {}
+    for request in payload:
+        cached = _response_cache.get((request["method"], token_address))
+        if cached is not None:
+            responses[request["id"]] = cached
         else:
-            security_checks.append("❌ Mint authority enabled (0)")
+            methods[request["id"]] = request["method"]
+    
+    if methods:
+        batch_data = await _hedged_post(
+            session,
+            rpc_urls,
+            [request for request in payload if request["id"] in methods],
+        )
         
-        # Check freeze authority  
-        if info.get("freezeAuthority") is None:
-            security_score += 25
-            security_checks.append("✅ Freeze authority disabled (+25)")
-        else:
-            security_checks.append("❌ Freeze authority enabled (0)")
+        # Batch responses may arrive in any order; match them up by id.
+        # A provider that rejects the batch outright returns a single error object.
+        if not isinstance(batch_data, list):
+            batch_data = []
+        for item in batch_data:
+            request_id = item.get("id")
+            responses[request_id] = item
+            
+            method = methods.get(request_id)
+            if "result" in item and method in CACHE_TTLS:
+                _response_cache.set((method, token_address), item, ttl=CACHE_TTLS[method])
+    
+    account_data = responses.get(1, {})
+    supply_data = responses.get(2, {})
+    holders_data = responses.get(3, {})
+    
+    # Initialize defaults
+    info = {}
+    accounts = []
+    amounts = []
+    raw_supply = 0
+    total_supply = 0
+    decimals = 9
+    
+    if "result" in account_data and account_data["result"]["value"]:
+        result = account_data["result"]["value"]
+        data = result.get("data", [])
+        raw = base64.b64decode(data[0]) if data else b""
         
-        # Holder distribution
-        if accounts and total_supply > 0:
-            top_10_amount = sum(float(acc.get("amount", 0)) for acc in accounts[:10])
-            top_10_percent = (top_10_amount / (total_supply * (10 ** decimals))) * 100
+        if len(raw) >= MINT_LAYOUT.size:
+            info = _parse_mint(raw)
             
-            if top_10_percent < 30:
-                security_score += 25
-                security_checks.append(f"✅ Top 10 holders: {top_10_percent:.1f}% (+25)")
-            else:
-                security_checks.append(f"⚠️  Top 10 holders: {top_10_percent:.1f}% (concentrated)")
-        else:
-            security_checks.append("⚪ Holder distribution: Unknown")
+            print("\n✅ Token Data Retrieved!")
+            print(f"   Owner: {result.get('owner', 'Unknown')}")
+            print(f"   Lamports: {result.get('lamports', 0):,}")
+            
+            if "decimals" in info:
+                print(f"   Decimals: {info['decimals']}")
+            if "mintAuthority" in info:
+                if info['mintAuthority']:
+                    print(f"   ⚠️  Mint Authority: {info['mintAuthority']}")
+                else:
+                    print(f"   ✅ Mint Authority: Disabled")
+            if "freezeAuthority" in info:
+                if info['freezeAuthority']:
+                    print(f"   ⚠️  Freeze Authority: {info['freezeAuthority']}")
+                else:
+                    print(f"   ✅ Freeze Authority: Disabled")
+    
+    # Get token supply
+    print("\n📈 Token supply:")
+    if "result" in supply_data:
+        result = supply_data["result"]
+        value = result.get("value", {})
+        raw_supply = int(value.get("amount", 0))
+        decimals = int(value.get("decimals", 9))
+        total_supply = raw_supply / (10 ** decimals)
         
-        # Supply check
-        if total_supply > 0:
-            security_score += 25
-            security_checks.append(f"✅ Has supply: {total_supply:,.0f} tokens (+25)")
+        print(f"   Total Supply: {total_supply:,.2f}")
+        print(f"   UI Amount: {value.get('uiAmountString', 'N/A')}")
+    
+    # Get largest holders
+    print("\n👥 Top holders:")
+    if "result" in holders_data:
+        accounts = holders_data["result"].get("value", [])
+        print(f"   Total Holders Tracked: {len(accounts)}")
         
-        print("Security Checks:")
-        for check in security_checks:
-            print(f"  {check}")
+        # Raw integer amounts (in base units), converted once and reused below
+        amounts = [int(account.get("amount", 0)) for account in accounts]
         
-        print(f"\n📊 Final Security Score: {security_score}/100")
+        if amounts:
+            decimals_div = 10 ** decimals
+            print("\n   Top 5 Holders:")
+            for i, amount in enumerate(amounts[:5], 1):
+                ui_amount = amount / decimals_div
+                percent = (amount / raw_supply * 100) if raw_supply > 0 else 0
+                print(f"   #{i}: {ui_amount:,.2f} ({percent:.2f}%)")
+    
+    # Calculate simple score
+    print(f"\n{'='*60}")
+    print("🌙 MOON SCORE ANALYSIS")
+    print(f"{'='*60}\n")
+    
+    # Security checks
+    security_score = 0
+    security_checks = []
+    
+    # Check mint authority
+    if info.get("mintAuthority") is None:
+        security_score += 25
+        security_checks.append("✅ Mint authority disabled (+25)")
+    else:
+        security_checks.append("❌ Mint authority enabled (0)")
+    
+    # Check freeze authority  
+    if info.get("freezeAuthority") is None:
+        security_score += 25
+        security_checks.append("✅ Freeze authority disabled (+25)")
+    else:
+        security_checks.append("❌ Freeze authority enabled (0)")
+    
+    # Holder distribution
+    if amounts and raw_supply > 0:
+        top_10_percent = sum(amounts[:10]) / raw_supply * 100
         
-        if security_score >= 75:
-            rating = "🚀 STRONG"
-        elif security_score >= 50:
-            rating = "✨ MODERATE"
+        if top_10_percent < 30:
+            security_score += 25
+            security_checks.append(f"✅ Top 10 holders: {top_10_percent:.1f}% (+25)")
         else:
-            rating = "⚠️  WEAK"
-        
-        print(f"🎯 Rating: {rating}")
-        
-        print(f"\n{'='*60}")
-        print("✅ Scan Complete!")
-        print(f"{'='*60}\n")
-        
-        return {
-            "token": token_address,
-            "supply": total_supply,
-            "holders": len(accounts),
-            "security_score": security_score,
-            "rating": rating
-        }
+            security_checks.append(f"⚠️  Top 10 holders: {top_10_percent:.1f}% (concentrated)")
+    else:
+        security_checks.append("⚪ Holder distribution: Unknown")
+    
+    # Supply check
+    if total_supply > 0:
+        security_score += 25
+        security_checks.append(f"✅ Has supply: {total_supply:,.0f} tokens (+25)")
+    
+    print("Security Checks:")
+    for check in security_checks:
+        print(f"  {check}")
+    
+    print(f"\n📊 Final Security Score: {security_score}/100")
+    
+    if security_score >= 75:
+        rating = "🚀 STRONG"
+    elif security_score >= 50:
+        rating = "✨ MODERATE"
+    else:
+        rating = "⚠️  WEAK"
+    
+    print(f"🎯 Rating: {rating}")
+    
+    print(f"\n{'='*60}")
+    print("✅ Scan Complete!")
+    print(f"{'='*60}\n")
+    
+    return {
+        "token": token_address,
+        "supply": total_supply,
+        "holders": len(accounts),
+        "security_score": security_score,
+        "rating": rating
+    }
 
 
 async def main():
-    # Configuration
-    RPC_URL = "https://mainnet.helius-rpc.com/?api-key=800bfb0a-c49f-4134-9991-74169c35b056"
+    # Configuration (primary first; later endpoints are used for hedging/failover)
+    RPC_URLS = [
+        "https://mainnet.helius-rpc.com/?api-key=800bfb0a-c49f-4134-9991-74169c35b056",
+        "https://api.mainnet-beta.solana.com",
+    ]
     
     print("\n🌙 SOLANA MOON SCANNER - DEMO MODE")
     print("="*60)
     
     # Scan USDC (well-known token)
     token = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
-    result = await get_token_info(RPC_URL, token)
+    try:
+        result = await get_token_info(RPC_URLS, token)
+    finally:
+        await close_session()
     
     print("\n💡 What This Shows:")
     print("   - Real on-chain data from Solana blockchain")
@@ -200,4 +409,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -5,7 +5,8 @@ import asyncio
 import sys
 sys.path.insert(0, '/home/user/solana-moon-scanner')
 
-from demo_scan import get_token_info
+from demo_scan import close_session, get_token_info
+from src.utils.event_loop import install_uvloop
 
 
 async def main():
@@ -18,7 +19,10 @@ async def main():
     # BONK token address
     bonk_token = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
     
-    result = await get_token_info(RPC_URL, bonk_token)
+    try:
+        result = await get_token_info(RPC_URL, bonk_token)
+    finally:
+        await close_session()
     
     print("\n" + "="*60)
     print("📈 COMPARISON: What Makes a Good Token?")
@@ -53,4 +57,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
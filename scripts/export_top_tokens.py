@@ -8,10 +8,14 @@ Usage:
 
 import asyncio
 import csv
+import heapq
+import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional, Tuple
 
 import click
 
@@ -20,39 +24,91 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.dex_monitor import TokenPair
 from src.scanner import MoonScanner
+from src.utils.event_loop import install_uvloop
 
 
-async def export_tokens(output_path: str, limit: int = 100):
+CSV_FIELDNAMES = [
+    'token_address',
+    'symbol',
+    'name',
+    'dex',
+    'moon_score',
+    'rating',
+    'age_minutes',
+    'liquidity_usd',
+    'volume_24h',
+    'holders',
+    'transactions_24h',
+    'buy_pressure',
+    'social_momentum',
+    'dev_behavior',
+    'validation_status',
+    'passed_checks',
+    'failed_checks',
+    'red_flags',
+    'timestamp',
+    'solscan_url',
+]
+
+# Rows are plain tuples in CSV_FIELDNAMES order; positions used for the summary
+_SYMBOL = CSV_FIELDNAMES.index('symbol')
+_MOON_SCORE = CSV_FIELDNAMES.index('moon_score')
+_RATING = CSV_FIELDNAMES.index('rating')
+
+# Number of best-scoring tokens summarized after the export
+TOP_N_SUMMARY = 5
+
+# Report progress every this many processed tokens
+PROGRESS_INTERVAL = 10
+
+# Script output goes through a queue so the event loop never blocks on the terminal
+output = logging.getLogger("export_top_tokens")
+output.propagate = False
+
+
+def _start_output() -> QueueListener:
     """
-    Export top-scoring tokens to CSV.
+    Route script output to stdout from a background thread.
     
-    Args:
-        output_path: Output CSV file path
-        limit: Maximum number of tokens to export
+    Returns:
+        Started listener; stop it to flush pending output
     """
-    scanner = MoonScanner()
-    await scanner._initialize_components()
-    
-    # Get active pairs from monitor
-    if not scanner.dex_monitor:
-        print("Error: DEX monitor not initialized")
-        return
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
     
-    active_pairs = scanner.dex_monitor.get_active_pairs()
+    output.handlers = [QueueHandler(records)]
+    output.setLevel(logging.INFO)
     
-    if not active_pairs:
-        print("No active token pairs found")
-        return
-    
-    # Score and validate each token
-    results = []
-    
-    print(f"Processing {len(active_pairs)} tokens...")
+    listener = QueueListener(records, handler)
+    listener.start()
+    return listener
+
+
+def _write_row(writer, csvfile, row: Tuple[Any, ...]) -> None:
+    """Write and flush a single CSV row."""
+    writer.writerow(row)
+    csvfile.flush()
+
+
+async def _process_pair(
+    scanner: MoonScanner,
+    pair: TokenPair,
+    semaphore: asyncio.Semaphore,
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Score and validate a single token pair.
     
-    for i, pair in enumerate(active_pairs[:limit], 1):
+    Args:
+        scanner: Initialized scanner instance
+        pair: Token pair to process
+        semaphore: Semaphore bounding concurrent lookups
+        
+    Returns:
+        CSV row for the token, or None if processing failed
+    """
+    async with semaphore:
         try:
-            print(f"[{i}/{min(len(active_pairs), limit)}] Processing {pair.token_address}...")
-            
             # Fetch metrics
             metrics = await scanner.metrics_fetcher.fetch_metrics(
                 pair.token_address,
@@ -74,52 +130,115 @@ async def export_tokens(output_path: str, limit: int = 100):
             # Validate
             validation = await scanner.validator.validate(metrics, pair.pair_address)
             
-            # Add to results
-            results.append({
-                'token_address': pair.token_address,
-                'symbol': metrics.symbol,
-                'name': metrics.name,
-                'dex': pair.dex,
-                'moon_score': moon_score.total_score,
-                'rating': scanner.score_calculator.get_rating(moon_score.total_score),
-                'age_minutes': metrics.age_minutes,
-                'liquidity_usd': metrics.liquidity_usd,
-                'volume_24h': metrics.volume_24h,
-                'holders': metrics.total_holders,
-                'transactions_24h': metrics.transactions_24h,
-                'buy_pressure': moon_score.components.buy_pressure,
-                'social_momentum': moon_score.components.social_momentum,
-                'dev_behavior': moon_score.components.dev_behavior_score,
-                'validation_status': validation.overall_status.value,
-                'passed_checks': validation.passed_checks,
-                'failed_checks': validation.failed_checks,
-                'red_flags': len(validation.red_flags),
-                'timestamp': datetime.now().isoformat(),
-                'solscan_url': f"https://solscan.io/token/{pair.token_address}",
-            })
+            return (
+                pair.token_address,
+                metrics.symbol,
+                metrics.name,
+                pair.dex,
+                moon_score.total_score,
+                scanner.score_calculator.get_rating(moon_score.total_score),
+                metrics.age_minutes,
+                metrics.liquidity_usd,
+                metrics.volume_24h,
+                metrics.total_holders,
+                metrics.transactions_24h,
+                moon_score.components.buy_pressure,
+                moon_score.components.social_momentum,
+                moon_score.components.dev_behavior_score,
+                validation.overall_status.value,
+                validation.passed_checks,
+                validation.failed_checks,
+                len(validation.red_flags),
+                datetime.now().isoformat(),
+                f"https://solscan.io/token/{pair.token_address}",
+            )
         
         except Exception as e:
-            print(f"Error processing {pair.token_address}: {e}")
-            continue
+            output.error(f"Error processing {pair.token_address}: {e}")
+            return None
+
+
+async def export_tokens(output_path: str, limit: int = 100, concurrency: Optional[int] = None):
+    """
+    Export top-scoring tokens to CSV.
     
-    # Sort by moon_score descending
-    results.sort(key=lambda x: x['moon_score'], reverse=True)
+    Rows are written as soon as each token is scored, so the file can be
+    followed while a long export is running. Rows appear in completion
+    order rather than sorted by score.
     
-    # Write to CSV
-    if results:
-        fieldnames = list(results[0].keys())
-        
-        with open(output_path, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
+    Args:
+        output_path: Output CSV file path
+        limit: Maximum number of tokens to export
+        concurrency: Maximum number of tokens processed at once
+            (defaults to max_concurrent_requests from config)
+    """
+    listener = _start_output()
+    try:
+        await _export(output_path, limit, concurrency)
+    finally:
+        listener.stop()
+
+
+async def _export(output_path: str, limit: int, concurrency: Optional[int]):
+    """Run the export; see export_tokens."""
+    scanner = MoonScanner()
+    await scanner._initialize_components()
+    
+    # Get active pairs from monitor
+    if not scanner.dex_monitor:
+        output.error("Error: DEX monitor not initialized")
+        return
+    
+    active_pairs = scanner.dex_monitor.get_active_pairs()
+    
+    if not active_pairs:
+        output.info("No active token pairs found")
+        return
+    
+    pairs = active_pairs[:limit]
+    semaphore = asyncio.Semaphore(concurrency or scanner.config.max_concurrent_requests)
+    
+    output.info(f"Processing {len(pairs)} tokens...")
+    
+    # Best-scoring rows seen so far, as a min-heap of (score, sequence, row)
+    top_tokens: List[Tuple[float, int, Tuple[Any, ...]]] = []
+    exported = 0
+    processed = 0
+    
+    with open(output_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        await asyncio.to_thread(writer.writerow, CSV_FIELDNAMES)
         
-        print(f"\n✅ Exported {len(results)} tokens to {output_path}")
-        print(f"Top 5 tokens by MoonScore:")
-        for i, token in enumerate(results[:5], 1):
-            print(f"  {i}. {token['symbol']} - Score: {token['moon_score']:.2f} ({token['rating']})")
+        # Score and validate tokens concurrently, writing each row as it completes
+        tasks = [_process_pair(scanner, pair, semaphore) for pair in pairs]
+        for next_result in asyncio.as_completed(tasks):
+            row = await next_result
+            processed += 1
+            if processed % PROGRESS_INTERVAL == 0:
+                output.info(f"Processed {processed}/{len(pairs)} tokens...")
+            
+            if row is None:
+                continue
+            
+            # File writes run in a worker thread so in-flight lookups keep progressing
+            await asyncio.to_thread(_write_row, writer, csvfile, row)
+            exported += 1
+            
+            entry = (row[_MOON_SCORE], exported, row)
+            if len(top_tokens) < TOP_N_SUMMARY:
+                heapq.heappush(top_tokens, entry)
+            else:
+                heapq.heappushpop(top_tokens, entry)
+    
+    if exported:
+        output.info(f"\n✅ Exported {exported} tokens to {output_path}")
+        output.info(f"Top {TOP_N_SUMMARY} tokens by MoonScore:")
+        for i, (_, _, token) in enumerate(sorted(top_tokens, reverse=True), 1):
+            output.info(
+                f"  {i}. {token[_SYMBOL]} - Score: {token[_MOON_SCORE]:.2f} ({token[_RATING]})"
+            )
     else:
-        print("No results to export")
+        output.info("No results to export")
     
     await scanner.stop()
 
@@ -138,9 +257,17 @@ async def export_tokens(output_path: str, limit: int = 100):
     type=int,
     help='Maximum number of tokens to process',
 )
-def main(output: str, limit: int):
+@click.option(
+    '--concurrency',
+    '-c',
+    default=None,
+    type=int,
+    help='Maximum number of tokens processed concurrently (defaults to MAX_CONCURRENT_REQUESTS)',
+)
+def main(output: str, limit: int, concurrency: Optional[int]):
     """Export top-scoring tokens to CSV."""
-    asyncio.run(export_tokens(output, limit))
+    install_uvloop()
+    asyncio.run(export_tokens(output, limit, concurrency))
 
 
 if __name__ == '__main__':
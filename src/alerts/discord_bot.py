@@ -1,32 +1,103 @@
 """Discord webhook alerter."""
 
-from typing import Dict, Optional
+import asyncio
+import random
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 import aiohttp
 
 from ..utils.config import get_config
 from ..utils.logger import LoggerMixin
+from ..utils.serialization import json_dumps
 from ..utils.metrics import alerts_sent, alert_delivery_duration
 from ..scoring.moon_score import MoonScoreResult
 from ..scoring.validators import ValidationResult
 
 
+# Score thresholds and the embed color/rating for each bucket they delimit
+_RATING_THRESHOLDS = (60, 70, 80, 90)
+_EMBED_COLORS = (
+    0x808080,  # Gray
+    0x1E90FF,  # Dodger blue
+    0x32CD32,  # Lime green
+    0x00FF00,  # Green
+    0xFFD700,  # Gold
+)
+_RATINGS = ("📊 MODERATE", "✨ PROMISING", "💎 STRONG", "🚀 VERY STRONG", "🌕 MOON SHOT")
+
+# Static (name, inline) layout of the per-alert embed fields, in display order
+_EMBED_FIELD_LAYOUT = (
+    ("📊 MoonScore", False),
+    ("🏦 DEX", True),
+    ("⏱️ Age", True),
+    ("💰 Liquidity", True),
+    ("📈 Volume 24h", True),
+    ("👥 Holders", True),
+    ("📊 Transactions 24h", True),
+    ("🎯 Buy Pressure", True),
+    ("💎 Social Momentum", True),
+    ("👨‍💻 Dev Behavior", True),
+    ("✅ Validation", False),
+)
+
+# Discord limits: embeds per message and total embed characters per message
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_EMBED_CHARS = 6000
+
+# How long to wait for more alerts before posting a batch (seconds)
+DISCORD_BATCH_WINDOW = 0.5
+
+# Retries for rate-limited (429) webhook posts
+DISCORD_MAX_RETRIES = 3
+DISCORD_RETRY_BASE_DELAY = 1.0
+
+# Fail fast on connect/read so a slow endpoint doesn't stall the alert pipeline
+_DISCORD_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=2, sock_connect=2, sock_read=5)
+
+
 class DiscordAlerter(LoggerMixin):
     """Send alerts via Discord webhook."""
     
     def __init__(self):
         self.config = get_config()
         self.session: Optional[aiohttp.ClientSession] = None
+        
+        # Pending (embed, token address, result future) tuples, posted in batches
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def initialize(self) -> None:
-        """Initialize HTTP session."""
+        """Initialize HTTP session and batch flusher."""
         if not self.session:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = aiohttp.ClientSession(
+                timeout=_DISCORD_TIMEOUT,
+                json_serialize=json_dumps,
+            )
+        
+        if not self._flush_task or self._flush_task.done():
+            self._queue = asyncio.Queue()
+            self._flush_task = asyncio.create_task(self._flush_loop())
     
     async def close(self) -> None:
-        """Close HTTP session."""
+        """Stop the batch flusher and close HTTP session."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        # Fail alerts that never made it out
+        if self._queue:
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_result(False)
+            self._queue = None
+        
         if self.session:
             await self.session.close()
             self.session = None
@@ -40,6 +111,9 @@ class DiscordAlerter(LoggerMixin):
         """
         Send alert to Discord.
         
+        Alerts arriving close together are coalesced into a single webhook
+        message with multiple embeds.
+        
         Args:
             moon_score: MoonScore calculation result
             validation: Validation result
@@ -58,27 +132,150 @@ class DiscordAlerter(LoggerMixin):
         await self.initialize()
         
         try:
+            payload = self._format_webhook_payload(moon_score, validation, dex)
+            
+            assert self._queue is not None
+            future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+            await self._queue.put((payload["embeds"][0], moon_score.token_address, future))
+            return await future
+        
+        except Exception as e:
+            self.logger.error(f"Failed to send Discord alert: {e}")
+            alerts_sent.labels(channel="discord", status="error").inc()
+            return False
+    
+    async def _flush_loop(self) -> None:
+        """Collect queued alerts and post them in batches."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        assert queue is not None
+        
+        while True:
+            batch = [await queue.get()]
+            
+            try:
+                await self._flush_batch(batch, loop.time() + DISCORD_BATCH_WINDOW)
+            except asyncio.CancelledError:
+                # Closed mid-batch: alerts already taken off the queue weren't sent
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(False)
+                raise
+    
+    async def _flush_batch(
+        self,
+        batch: List[Tuple[Dict, str, asyncio.Future]],
+        deadline: float,
+    ) -> None:
+        """
+        Fill a batch with alerts arriving until the deadline, then post it.
+        
+        Args:
+            batch: Queued alerts, extended in place
+            deadline: Event loop time at which to stop waiting for more alerts
+        """
+        loop = asyncio.get_running_loop()
+        assert self._queue is not None
+        
+        # Gather whatever else arrives within the batch window
+        while len(batch) < DISCORD_MAX_EMBEDS:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        
+        for chunk in self._split_batch(batch):
+            try:
+                success = await self._post_embeds([embed for embed, _, _ in chunk])
+            except Exception as e:
+                self.logger.error(f"Failed to send Discord alert: {e}")
+                success = False
+            
+            for _, token_address, future in chunk:
+                if success:
+                    alerts_sent.labels(channel="discord", status="success").inc()
+                    self.logger.info(f"Discord alert sent for {token_address}")
+                else:
+                    alerts_sent.labels(channel="discord", status="error").inc()
+                if not future.done():
+                    future.set_result(success)
+    
+    def _split_batch(
+        self,
+        batch: List[Tuple[Dict, str, asyncio.Future]],
+    ) -> List[List[Tuple[Dict, str, asyncio.Future]]]:
+        """Split queued alerts into messages that fit Discord's embed character limit."""
+        chunks: List[List[Tuple[Dict, str, asyncio.Future]]] = []
+        current: List[Tuple[Dict, str, asyncio.Future]] = []
+        current_chars = 0
+        
+        for item in batch:
+            chars = self._embed_length(item[0])
+            if current and current_chars + chars > DISCORD_MAX_EMBED_CHARS:
+                chunks.append(current)
+                current = []
+                current_chars = 0
+            current.append(item)
+            current_chars += chars
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
+    @staticmethod
+    def _embed_length(embed: Dict) -> int:
+        """Count the characters Discord counts towards the per-message embed limit."""
+        length = len(embed.get("title", "")) + len(embed.get("description", ""))
+        length += len(embed.get("footer", {}).get("text", ""))
+        for embed_field in embed.get("fields", []):
+            length += len(embed_field["name"]) + len(embed_field["value"])
+        return length
+    
+    async def _post_embeds(self, embeds: List[Dict]) -> bool:
+        """
+        Post embeds in a single webhook message, honoring rate limits.
+        
+        Args:
+            embeds: Embeds to send
+            
+        Returns:
+            True if sent successfully
+        """
+        payload = {
+            "embeds": embeds,
+            "username": "Moon Scanner Bot",
+        }
+        
+        for attempt in range(DISCORD_MAX_RETRIES + 1):
+            # Time the POST alone, not the batch window or rate limit backoff
             with alert_delivery_duration.labels(channel="discord").time():
-                payload = self._format_webhook_payload(moon_score, validation, dex)
-                
                 async with self.session.post(
                     self.config.discord_webhook_url,
                     json=payload,
                 ) as response:
                     if response.status in [200, 204]:
-                        alerts_sent.labels(channel="discord", status="success").inc()
-                        self.logger.info(f"Discord alert sent for {moon_score.token_address}")
                         return True
-                    else:
+                    
+                    if response.status != 429 or attempt == DISCORD_MAX_RETRIES:
                         error_text = await response.text()
-                        self.logger.error(f"Discord webhook failed: {response.status} - {error_text}")
-                        alerts_sent.labels(channel="discord", status="error").inc()
+                        self.logger.error(
+                            f"Discord webhook failed: {response.status} - {error_text}"
+                        )
                         return False
+                    
+                    retry_after = float(response.headers.get("Retry-After", 0) or 0)
+            
+            # Exponential backoff with jitter, never shorter than Discord asks for
+            delay = max(retry_after, DISCORD_RETRY_BASE_DELAY * 2 ** attempt)
+            delay += random.uniform(0, DISCORD_RETRY_BASE_DELAY)
+            self.logger.warning(f"Discord rate limited, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
         
-        except Exception as e:
-            self.logger.error(f"Failed to send Discord alert: {e}")
-            alerts_sent.labels(channel="discord", status="error").inc()
-            return False
+        return False
     
     def _format_webhook_payload(
         self,
@@ -103,6 +300,21 @@ class DiscordAlerter(LoggerMixin):
         # Determine embed color based on score
         color = self._get_embed_color(moon_score.total_score)
         
+        # Values for each field in _EMBED_FIELD_LAYOUT
+        values = (
+            f"**{moon_score.total_score:.2f}/100** {self._get_rating(moon_score.total_score)}",
+            dex.upper(),
+            f"{metrics.age_minutes:.1f} min",
+            f"${metrics.liquidity_usd:,.2f}",
+            f"${metrics.volume_24h:,.2f}",
+            str(metrics.total_holders),
+            str(metrics.transactions_24h),
+            f"{components.buy_pressure:.1f}/100",
+            f"{components.social_momentum:.1f}/100",
+            f"{components.dev_behavior_score:.1f}/100",
+            f"{validation.passed_checks}/{validation.passed_checks + validation.failed_checks} checks passed",
+        )
+        
         # Build embed
         embed = {
             "title": "🚀 New Token Alert",
@@ -110,61 +322,8 @@ class DiscordAlerter(LoggerMixin):
             "color": color,
             "timestamp": datetime.now().isoformat(),
             "fields": [
-                {
-                    "name": "📊 MoonScore",
-                    "value": f"**{moon_score.total_score:.2f}/100** {self._get_rating(moon_score.total_score)}",
-                    "inline": False,
-                },
-                {
-                    "name": "🏦 DEX",
-                    "value": dex.upper(),
-                    "inline": True,
-                },
-                {
-                    "name": "⏱️ Age",
-                    "value": f"{metrics.age_minutes:.1f} min",
-                    "inline": True,
-                },
-                {
-                    "name": "💰 Liquidity",
-                    "value": f"${metrics.liquidity_usd:,.2f}",
-                    "inline": True,
-                },
-                {
-                    "name": "📈 Volume 24h",
-                    "value": f"${metrics.volume_24h:,.2f}",
-                    "inline": True,
-                },
-                {
-                    "name": "👥 Holders",
-                    "value": str(metrics.total_holders),
-                    "inline": True,
-                },
-                {
-                    "name": "📊 Transactions 24h",
-                    "value": str(metrics.transactions_24h),
-                    "inline": True,
-                },
-                {
-                    "name": "🎯 Buy Pressure",
-                    "value": f"{components.buy_pressure:.1f}/100",
-                    "inline": True,
-                },
-                {
-                    "name": "💎 Social Momentum",
-                    "value": f"{components.social_momentum:.1f}/100",
-                    "inline": True,
-                },
-                {
-                    "name": "👨‍💻 Dev Behavior",
-                    "value": f"{components.dev_behavior_score:.1f}/100",
-                    "inline": True,
-                },
-                {
-                    "name": "✅ Validation",
-                    "value": f"{validation.passed_checks}/{validation.passed_checks + validation.failed_checks} checks passed",
-                    "inline": False,
-                },
+                {"name": name, "value": value, "inline": inline}
+                for (name, inline), value in zip(_EMBED_FIELD_LAYOUT, values)
             ],
             "footer": {
                 "text": "Solana Moon Scanner",
@@ -211,29 +370,11 @@ class DiscordAlerter(LoggerMixin):
     
     def _get_embed_color(self, score: float) -> int:
         """Get Discord embed color based on score."""
-        if score >= 90:
-            return 0xFFD700  # Gold
-        elif score >= 80:
-            return 0x00FF00  # Green
-        elif score >= 70:
-            return 0x32CD32  # Lime green
-        elif score >= 60:
-            return 0x1E90FF  # Dodger blue
-        else:
-            return 0x808080  # Gray
+        return _EMBED_COLORS[bisect_right(_RATING_THRESHOLDS, score)]
     
     def _get_rating(self, score: float) -> str:
         """Get rating emoji for score."""
-        if score >= 90:
-            return "🌕 MOON SHOT"
-        elif score >= 80:
-            return "🚀 VERY STRONG"
-        elif score >= 70:
-            return "💎 STRONG"
-        elif score >= 60:
-            return "✨ PROMISING"
-        else:
-            return "📊 MODERATE"
+        return _RATINGS[bisect_right(_RATING_THRESHOLDS, score)]
     
     async def __aenter__(self):
         """Async context manager entry."""
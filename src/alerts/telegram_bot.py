@@ -1,10 +1,10 @@
 """Telegram bot for sending alerts."""
 
+from bisect import bisect_right
 from typing import Optional
 import html
 
-from telegram import Bot
-from telegram.error import TelegramError
+import aiohttp
 
 from ..utils.config import get_config
 from ..utils.logger import LoggerMixin
@@ -13,16 +13,66 @@ from ..scoring.moon_score import MoonScoreResult
 from ..scoring.validators import ValidationResult
 
 
+TELEGRAM_API_URL = "https://api.telegram.org"
+
+# Fail fast on connect so a slow endpoint doesn't stall the alert pipeline
+_TELEGRAM_TIMEOUT = aiohttp.ClientTimeout(total=12, connect=2, sock_read=8)
+
+# Score thresholds and the rating/emoji for each bucket they delimit
+_RATING_THRESHOLDS = (60, 70, 80, 90)
+_RATINGS = ("MODERATE", "PROMISING", "STRONG", "VERY STRONG", "MOON SHOT")
+_RATING_EMOJIS = ("📊", "✨", "💎", "🚀", "🌕")
+
+# Alert message layout, filled in per alert with format_map
+_MESSAGE_TEMPLATE = "\n".join([
+    "🚀 <b>NEW TOKEN ALERT</b> 🚀",
+    "",
+    "<b>MoonScore:</b> {total_score:.2f}/100",
+    "<b>Rating:</b> {rating_emoji} {rating}",
+    "",
+    "<b>📊 Token Info</b>",
+    "<b>Name:</b> {name}",
+    "<b>Symbol:</b> {symbol}",
+    "<b>DEX:</b> {dex}",
+    "<b>Age:</b> {age_minutes:.1f} min",
+    "",
+    "<b>💰 Metrics</b>",
+    "<b>Liquidity:</b> ${liquidity_usd:,.2f}",
+    "<b>Volume 24h:</b> ${volume_24h:,.2f}",
+    "<b>Holders:</b> {total_holders}",
+    "<b>Transactions 24h:</b> {transactions_24h}",
+    "",
+    "<b>📈 Score Breakdown</b>",
+    "Buy Pressure: {buy_pressure:.1f}/100",
+    "Volume/Liquidity: {volume_liquidity_ratio:.1f}/100",
+    "Social Momentum: {social_momentum:.1f}/100",
+    "Holder Growth: {holder_growth_rate:.1f}/100",
+    "Dev Behavior: {dev_behavior_score:.1f}/100",
+    "",
+    "<b>✅ Validation</b>",
+    "Status: {summary}",
+    "Passed: {passed_checks}/{total_checks}",
+])
+
+_LINKS_TEMPLATE = (
+    "\n\n<b>🔗 Links</b>\n"
+    "<a href='https://solscan.io/token/{token_addr}'>Solscan</a> | "
+    "<a href='https://birdeye.so/token/{token_addr}'>Birdeye</a> | "
+    "<a href='https://dexscreener.com/solana/{token_addr}'>DexScreener</a>"
+)
+
+
 class TelegramAlerter(LoggerMixin):
     """Send alerts via Telegram bot."""
     
     def __init__(self):
         self.config = get_config()
-        self.bot: Optional[Bot] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._send_url: Optional[str] = None
         self._initialized = False
     
-    def initialize(self) -> None:
-        """Initialize Telegram bot."""
+    async def initialize(self) -> None:
+        """Initialize Telegram Bot API session and warm up its connection."""
         if self._initialized:
             return
         
@@ -35,11 +85,31 @@ class TelegramAlerter(LoggerMixin):
             return
         
         try:
-            self.bot = Bot(token=self.config.telegram_bot_token)
+            # Keep connections alive so consecutive alerts reuse one TLS connection
+            connector = aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=_TELEGRAM_TIMEOUT)
+            bot_url = f"{TELEGRAM_API_URL}/bot{self.config.telegram_bot_token}"
+            self._send_url = f"{bot_url}/sendMessage"
             self._initialized = True
             self.logger.info("Telegram bot initialized")
         except Exception as e:
             self.logger.error(f"Failed to initialize Telegram bot: {e}")
+            return
+        
+        # Open the TLS connection now so the first alert doesn't pay for the handshake
+        try:
+            async with self.session.get(f"{bot_url}/getMe") as response:
+                if response.status != 200:
+                    self.logger.warning(f"Telegram getMe failed: {response.status}")
+        except Exception as e:
+            self.logger.warning(f"Telegram connection warm-up failed: {e}")
+    
+    async def close(self) -> None:
+        """Close HTTP session."""
+        if self.session:
+            await self.session.close()
+            self.session = None
+        self._initialized = False
     
     async def send_alert(
         self,
@@ -62,30 +132,31 @@ class TelegramAlerter(LoggerMixin):
             return False
         
         if not self._initialized:
-            self.initialize()
+            await self.initialize()
         
-        if not self.bot:
+        if not self.session or not self._send_url:
             return False
         
         try:
             with alert_delivery_duration.labels(channel="telegram").time():
                 message = self._format_message(moon_score, validation, dex)
+                payload = {
+                    "chat_id": self.config.telegram_chat_id,
+                    "text": message,
+                    "parse_mode": "HTML",
+                    "disable_web_page_preview": False,
+                }
                 
-                await self.bot.send_message(
-                    chat_id=self.config.telegram_chat_id,
-                    text=message,
-                    parse_mode="HTML",
-                    disable_web_page_preview=False,
-                )
-            
-            alerts_sent.labels(channel="telegram", status="success").inc()
-            self.logger.info(f"Telegram alert sent for {moon_score.token_address}")
-            return True
-        
-        except TelegramError as e:
-            self.logger.error(f"Telegram error: {e}")
-            alerts_sent.labels(channel="telegram", status="error").inc()
-            return False
+                async with self.session.post(self._send_url, json=payload) as response:
+                    if response.status == 200:
+                        alerts_sent.labels(channel="telegram", status="success").inc()
+                        self.logger.info(f"Telegram alert sent for {moon_score.token_address}")
+                        return True
+                    else:
+                        error_text = await response.text()
+                        self.logger.error(f"Telegram error: {response.status} - {error_text}")
+                        alerts_sent.labels(channel="telegram", status="error").inc()
+                        return False
         
         except Exception as e:
             self.logger.error(f"Failed to send Telegram alert: {e}")
@@ -111,90 +182,52 @@ class TelegramAlerter(LoggerMixin):
         """
         metrics = moon_score.metrics
         components = moon_score.components
-        
-        # Escape HTML
-        token_addr = html.escape(metrics.token_address)
-        symbol = html.escape(metrics.symbol or "Unknown")
-        name = html.escape(metrics.name or "Unknown Token")
-        
-        # Build message
-        lines = [
-            "🚀 <b>NEW TOKEN ALERT</b> 🚀",
-            "",
-            f"<b>MoonScore:</b> {moon_score.total_score:.2f}/100",
-            f"<b>Rating:</b> {self._get_rating_emoji(moon_score.total_score)} {self._get_rating(moon_score.total_score)}",
-            "",
-            "<b>📊 Token Info</b>",
-            f"<b>Name:</b> {name}",
-            f"<b>Symbol:</b> {symbol}",
-            f"<b>DEX:</b> {dex.upper()}",
-            f"<b>Age:</b> {metrics.age_minutes:.1f} min",
-            "",
-            "<b>💰 Metrics</b>",
-            f"<b>Liquidity:</b> ${metrics.liquidity_usd:,.2f}",
-            f"<b>Volume 24h:</b> ${metrics.volume_24h:,.2f}",
-            f"<b>Holders:</b> {metrics.total_holders}",
-            f"<b>Transactions 24h:</b> {metrics.transactions_24h}",
-            "",
-            "<b>📈 Score Breakdown</b>",
-            f"Buy Pressure: {components.buy_pressure:.1f}/100",
-            f"Volume/Liquidity: {components.volume_liquidity_ratio:.1f}/100",
-            f"Social Momentum: {components.social_momentum:.1f}/100",
-            f"Holder Growth: {components.holder_growth_rate:.1f}/100",
-            f"Dev Behavior: {components.dev_behavior_score:.1f}/100",
-            "",
-            "<b>✅ Validation</b>",
-            f"Status: {validation.get_summary()}",
-            f"Passed: {validation.passed_checks}/{validation.passed_checks + validation.failed_checks}",
-        ]
+        score = moon_score.total_score
+        
+        message = _MESSAGE_TEMPLATE.format_map({
+            "total_score": score,
+            "rating_emoji": self._get_rating_emoji(score),
+            "rating": self._get_rating(score),
+            # Escape HTML
+            "name": html.escape(metrics.name or "Unknown Token"),
+            "symbol": html.escape(metrics.symbol or "Unknown"),
+            "dex": dex.upper(),
+            "age_minutes": metrics.age_minutes,
+            "liquidity_usd": metrics.liquidity_usd,
+            "volume_24h": metrics.volume_24h,
+            "total_holders": metrics.total_holders,
+            "transactions_24h": metrics.transactions_24h,
+            "buy_pressure": components.buy_pressure,
+            "volume_liquidity_ratio": components.volume_liquidity_ratio,
+            "social_momentum": components.social_momentum,
+            "holder_growth_rate": components.holder_growth_rate,
+            "dev_behavior_score": components.dev_behavior_score,
+            "summary": validation.get_summary(),
+            "passed_checks": validation.passed_checks,
+            "total_checks": validation.passed_checks + validation.failed_checks,
+        })
         
         # Add red flags
         if validation.red_flags:
-            lines.append("")
-            lines.append("<b>🚨 Red Flags:</b>")
+            message += "\n\n<b>🚨 Red Flags:</b>"
             for flag in validation.red_flags[:3]:
-                lines.append(f"• {html.escape(flag)}")
+                message += f"\n• {html.escape(flag)}"
         
         # Add warnings
         if validation.warnings:
-            lines.append("")
-            lines.append("<b>⚠️ Warnings:</b>")
+            message += "\n\n<b>⚠️ Warnings:</b>"
             for warning in validation.warnings[:3]:
-                lines.append(f"• {html.escape(warning)}")
+                message += f"\n• {html.escape(warning)}"
         
         # Add links
-        lines.extend([
-            "",
-            "<b>🔗 Links</b>",
-            f"<a href='https://solscan.io/token/{token_addr}'>Solscan</a> | "
-            f"<a href='https://birdeye.so/token/{token_addr}'>Birdeye</a> | "
-            f"<a href='https://dexscreener.com/solana/{token_addr}'>DexScreener</a>",
-        ])
+        message += _LINKS_TEMPLATE.format(token_addr=html.escape(metrics.token_address))
         
-        return "\n".join(lines)
+        return message
     
     def _get_rating(self, score: float) -> str:
         """Get rating text for score."""
-        if score >= 90:
-            return "MOON SHOT"
-        elif score >= 80:
-            return "VERY STRONG"
-        elif score >= 70:
-            return "STRONG"
-        elif score >= 60:
-            return "PROMISING"
-        else:
-            return "MODERATE"
+        return _RATINGS[bisect_right(_RATING_THRESHOLDS, score)]
     
     def _get_rating_emoji(self, score: float) -> str:
         """Get emoji for score."""
-        if score >= 90:
-            return "🌕"
-        elif score >= 80:
-            return "🚀"
-        elif score >= 70:
-            return "💎"
-        elif score >= 60:
-            return "✨"
-        else:
-            return "📊"
+        return _RATING_EMOJIS[bisect_right(_RATING_THRESHOLDS, score)]
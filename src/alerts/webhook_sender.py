@@ -1,35 +1,116 @@
 """Generic webhook sender for custom integrations."""
 
+import asyncio
 import hmac
 import hashlib
-import json
-from typing import Dict, Optional
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 import aiohttp
 
 from ..utils.config import get_config
 from ..utils.logger import LoggerMixin
+from ..utils.serialization import json_dumps_bytes
 from ..utils.metrics import alerts_sent, alert_delivery_duration
 from ..scoring.moon_score import MoonScoreResult
 from ..scoring.validators import ValidationResult
 
 
+# Score thresholds and the rating for each bucket they delimit
+_RATING_THRESHOLDS = (60, 70, 80, 90)
+_RATINGS = ("MODERATE", "PROMISING", "STRONG", "VERY_STRONG", "MOON_SHOT")
+
+# Token page URL prefixes for the payload links
+_SOLSCAN_TOKEN_URL = "https://solscan.io/token/"
+_BIRDEYE_TOKEN_URL = "https://birdeye.so/token/"
+_DEXSCREENER_TOKEN_URL = "https://dexscreener.com/solana/"
+
+# Alerts arriving within this window (seconds) are signed and posted as one burst
+WEBHOOK_BATCH_WINDOW = 0.01
+WEBHOOK_BATCH_MAX = 32
+
+# Bytes of a failed response body to read for the error log
+ERROR_BODY_LIMIT = 512
+
+# Connection pool shared by every WebhookSender on the running event loop, so
+# short-lived senders don't pay for fresh DNS lookups and TLS handshakes
+_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+_CONNECTOR_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_connector() -> aiohttp.TCPConnector:
+    """Get or create the shared connector for the running event loop."""
+    global _CONNECTOR, _CONNECTOR_LOOP
+    loop = asyncio.get_running_loop()
+    if _CONNECTOR is None or _CONNECTOR.closed or _CONNECTOR_LOOP is not loop:
+        _CONNECTOR = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        _CONNECTOR_LOOP = loop
+    return _CONNECTOR
+
+
+async def close_connector() -> None:
+    """Close the shared webhook connection pool."""
+    global _CONNECTOR, _CONNECTOR_LOOP
+    if _CONNECTOR is not None:
+        await _CONNECTOR.close()
+        _CONNECTOR = None
+        _CONNECTOR_LOOP = None
+
+
 class WebhookSender(LoggerMixin):
     """Send alerts via generic webhook with HMAC signature."""
     
     def __init__(self):
         self.config = get_config()
         self.session: Optional[aiohttp.ClientSession] = None
+        
+        # Keyed HMAC state for the current secret; copied per signature
+        self._hmac_secret: Optional[str] = None
+        self._hmac_template: Optional[hmac.HMAC] = None
+        
+        # Pending (moon_score, validation, dex, result future) tuples, sent in bursts
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def initialize(self) -> None:
-        """Initialize HTTP session."""
+        """Initialize HTTP session on the shared connection pool and batch flusher."""
         if not self.session:
             timeout = aiohttp.ClientTimeout(total=10)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = aiohttp.ClientSession(
+                connector=_get_connector(),
+                connector_owner=False,
+                timeout=timeout,
+            )
+        
+        if not self._flush_task or self._flush_task.done():
+            self._queue = asyncio.Queue()
+            self._flush_task = asyncio.create_task(self._flush_loop())
     
     async def close(self) -> None:
-        """Close HTTP session."""
+        """Stop the batch flusher and close HTTP session (the shared pool stays open)."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        # Fail alerts that never made it out
+        if self._queue:
+            while not self._queue.empty():
+                *_, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_result(False)
+            self._queue = None
+        
         if self.session:
             await self.session.close()
             self.session = None
@@ -43,6 +124,8 @@ class WebhookSender(LoggerMixin):
         """
         Send alert via webhook.
         
+        Alerts arriving close together are signed and posted as one burst.
+        
         Args:
             moon_score: MoonScore calculation result
             validation: Validation result
@@ -61,26 +144,162 @@ class WebhookSender(LoggerMixin):
         await self.initialize()
         
         try:
-            with alert_delivery_duration.labels(channel="webhook").time():
-                payload = self._format_payload(moon_score, validation, dex)
-                
-                # Generate HMAC signature if secret is configured
-                headers = {"Content-Type": "application/json"}
-                if self.config.webhook_secret:
-                    signature = self._generate_signature(payload)
-                    headers["X-Webhook-Signature"] = signature
+            assert self._queue is not None
+            future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+            await self._queue.put((moon_score, validation, dex, future))
+            return await future
+        
+        except Exception as e:
+            self.logger.error(f"Failed to send webhook alert: {e}")
+            alerts_sent.labels(channel="webhook", status="error").inc()
+            return False
+    
+    async def send_alerts_batch(
+        self,
+        alerts: List[Tuple[MoonScoreResult, ValidationResult, str]],
+    ) -> List[bool]:
+        """
+        Send several alerts via webhook.
+        
+        All payloads are serialized and signed up front, then delivered
+        concurrently over the shared session.
+        
+        Args:
+            alerts: (moon_score, validation, dex) tuples
+            
+        Returns:
+            Per-alert success flags, in input order
+        """
+        if not self.config.webhook_enabled or not alerts:
+            return [False] * len(alerts)
+        
+        if not self.config.webhook_url:
+            self.logger.warning("Webhook URL not configured")
+            return [False] * len(alerts)
+        
+        await self.initialize()
+        return await self._deliver_batch(alerts)
+    
+    async def _flush_loop(self) -> None:
+        """Collect queued alerts and deliver them in bursts."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        assert queue is not None
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + WEBHOOK_BATCH_WINDOW
+            
+            try:
+                # Gather whatever else arrives within the batch window
+                while len(batch) < WEBHOOK_BATCH_MAX:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
                 
+                results = await self._deliver_batch([alert[:3] for alert in batch])
+            except asyncio.CancelledError:
+                # Closed mid-batch: alerts already taken off the queue weren't sent
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_result(False)
+                raise
+            
+            for (*_, future), success in zip(batch, results):
+                if not future.done():
+                    future.set_result(success)
+    
+    async def _deliver_batch(
+        self,
+        alerts: List[Tuple[MoonScoreResult, ValidationResult, str]],
+    ) -> List[bool]:
+        """
+        Sign and post alerts concurrently.
+        
+        Args:
+            alerts: (moon_score, validation, dex) tuples
+            
+        Returns:
+            Per-alert success flags, in input order
+        """
+        # Sign everything before any network I/O so hashing runs back to back
+        deliveries = []
+        for moon_score, validation, dex in alerts:
+            try:
+                body, headers = self._prepare_request(moon_score, validation, dex)
+                deliveries.append(self._deliver(body, headers, moon_score.token_address))
+            except Exception as e:
+                self.logger.error(f"Failed to send webhook alert: {e}")
+                alerts_sent.labels(channel="webhook", status="error").inc()
+                deliveries.append(asyncio.sleep(0, result=False))
+        
+        return list(await asyncio.gather(*deliveries))
+    
+    def _prepare_request(
+        self,
+        moon_score: MoonScoreResult,
+        validation: ValidationResult,
+        dex: str,
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Build the request body and headers for an alert.
+        
+        Args:
+            moon_score: MoonScore result
+            validation: Validation result
+            dex: DEX name
+            
+        Returns:
+            Serialized payload and request headers
+        """
+        payload = self._format_payload(moon_score, validation, dex)
+        
+        # Serialize once; the signature covers exactly the bytes that are sent.
+        # Canonical key order only matters when the body is signed.
+        signed = bool(self.config.webhook_secret)
+        payload_bytes = json_dumps_bytes(payload, sort_keys=signed)
+        
+        # Generate HMAC signature if secret is configured
+        headers = {"Content-Type": "application/json"}
+        if signed:
+            headers["X-Webhook-Signature"] = self._generate_signature(payload_bytes)
+        
+        return payload_bytes, headers
+    
+    async def _deliver(self, body: bytes, headers: Dict[str, str], token_address: str) -> bool:
+        """
+        Post a prepared alert to the webhook URL.
+        
+        Args:
+            body: Serialized payload
+            headers: Request headers
+            token_address: Token address (for logging)
+            
+        Returns:
+            True if sent successfully
+        """
+        try:
+            # Time the POST alone, not the batch window
+            with alert_delivery_duration.labels(channel="webhook").time():
                 async with self.session.post(
                     self.config.webhook_url,
-                    json=payload,
+                    data=body,
                     headers=headers,
                 ) as response:
                     if response.status in [200, 201, 202, 204]:
                         alerts_sent.labels(channel="webhook", status="success").inc()
-                        self.logger.info(f"Webhook alert sent for {moon_score.token_address}")
+                        self.logger.info(f"Webhook alert sent for {token_address}")
                         return True
                     else:
-                        error_text = await response.text()
+                        # Only read the start of the body; it's just for the log
+                        error_body = await response.content.read(ERROR_BODY_LIMIT + 1)
+                        error_text = error_body[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
+                        if len(error_body) > ERROR_BODY_LIMIT:
+                            error_text += "…"
                         self.logger.error(f"Webhook failed: {response.status} - {error_text}")
                         alerts_sent.labels(channel="webhook", status="error").inc()
                         return False
@@ -107,6 +326,9 @@ class WebhookSender(LoggerMixin):
         Returns:
             Payload dictionary
         """
+        metrics = moon_score.metrics
+        token_address = metrics.token_address
+        
         return {
             "event": "token_alert",
             "timestamp": datetime.now().isoformat(),
@@ -117,54 +339,45 @@ class WebhookSender(LoggerMixin):
                 "components": moon_score.components.to_dict(),
             },
             "token": {
-                "address": moon_score.metrics.token_address,
-                "symbol": moon_score.metrics.symbol,
-                "name": moon_score.metrics.name,
-                "age_minutes": moon_score.metrics.age_minutes,
+                "address": token_address,
+                "symbol": metrics.symbol,
+                "name": metrics.name,
+                "age_minutes": metrics.age_minutes,
             },
-            "metrics": moon_score.metrics.to_dict(),
+            "metrics": metrics.to_dict(),
             "validation": validation.to_dict(),
             "social": moon_score.social_metrics,
             "links": {
-                "solscan": f"https://solscan.io/token/{moon_score.metrics.token_address}",
-                "birdeye": f"https://birdeye.so/token/{moon_score.metrics.token_address}",
-                "dexscreener": f"https://dexscreener.com/solana/{moon_score.metrics.token_address}",
+                "solscan": _SOLSCAN_TOKEN_URL + token_address,
+                "birdeye": _BIRDEYE_TOKEN_URL + token_address,
+                "dexscreener": _DEXSCREENER_TOKEN_URL + token_address,
             },
         }
     
-    def _generate_signature(self, payload: Dict) -> str:
+    def _generate_signature(self, payload_bytes: bytes) -> str:
         """
         Generate HMAC signature for payload.
         
         Args:
-            payload: Payload dictionary
+            payload_bytes: Serialized payload
             
         Returns:
             Hex-encoded HMAC signature
         """
-        payload_bytes = json.dumps(payload, sort_keys=True).encode()
-        secret_bytes = self.config.webhook_secret.encode()
-        
-        signature = hmac.new(
-            secret_bytes,
-            payload_bytes,
-            hashlib.sha256,
-        ).hexdigest()
+        # Rebuild the keyed template only when the secret changes. hashlib.sha256 is
+        # OpenSSL's, which selects SHA-NI/AVX2 code paths at runtime on supporting CPUs.
+        secret = self.config.webhook_secret
+        if self._hmac_template is None or secret != self._hmac_secret:
+            self._hmac_template = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+            self._hmac_secret = secret
         
-        return signature
+        signer = self._hmac_template.copy()
+        signer.update(payload_bytes)
+        return signer.hexdigest()
     
     def _get_rating(self, score: float) -> str:
         """Get rating text for score."""
-        if score >= 90:
-            return "MOON_SHOT"
-        elif score >= 80:
-            return "VERY_STRONG"
-        elif score >= 70:
-            return "STRONG"
-        elif score >= 60:
-            return "PROMISING"
-        else:
-            return "MODERATE"
+        return _RATINGS[bisect_right(_RATING_THRESHOLDS, score)]
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -13,13 +13,36 @@ from rich.table import Table
 from rich.panel import Panel
 from rich import print as rprint
 
-from .scanner import MoonScanner
 from .utils.config import load_config, get_config
+from .utils.event_loop import install_uvloop
 from .utils.logger import setup_logger
 
 
 console = Console()
 
+# (header, style) column layouts for the CLI tables
+_CONFIG_COLUMNS = (("Setting", "yellow"), ("Value", "green"))
+_TOKEN_INFO_COLUMNS = (("Property", "cyan"), ("Value", "white"))
+_COMPONENT_COLUMNS = (("Component", "cyan"), ("Score", "green"))
+
+# Scan result panel bodies, filled in with format_map
+_SCORE_PANEL_TEMPLATE = (
+    "[bold yellow]MoonScore:[/bold yellow] [bold green]{score:.2f}/100[/bold green]\n"
+    "[bold yellow]Rating:[/bold yellow] {rating}"
+)
+_VALIDATION_PANEL_TEMPLATE = (
+    "[bold yellow]Status:[/bold yellow] {status}\n"
+    "[bold yellow]Passed:[/bold yellow] {passed}/{total}"
+)
+
+
+def _make_table(title: str, columns, **kwargs) -> Table:
+    """Create a table with the given (header, style) columns."""
+    table = Table(title=title, **kwargs)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
 
 @click.group()
 @click.option(
@@ -45,6 +68,9 @@ def cli(config: Optional[str], log_level: str):
     
     # Setup logging
     setup_logger(log_level=log_level)
+    
+    # Commands below run their coroutines on uvloop when it is available
+    install_uvloop()
 
 
 @cli.command()
@@ -56,6 +82,9 @@ def monitor():
         border_style="cyan"
     ))
     
+    # Imported here so light commands (config, version) skip the network stack
+    from .scanner import MoonScanner
+    
     scanner = MoonScanner()
     
     try:
@@ -79,6 +108,8 @@ def scan(token_address: str, output: Optional[str]):
     """Scan a specific token address."""
     console.print(f"[cyan]Scanning token: {token_address}[/cyan]")
     
+    from .scanner import MoonScanner
+    
     scanner = MoonScanner()
     
     async def _scan():
@@ -109,14 +140,18 @@ def config():
     """Display current configuration."""
     cfg = get_config()
     
-    table = Table(title="Configuration", show_header=True, header_style="bold cyan")
-    table.add_column("Setting", style="yellow")
-    table.add_column("Value", style="green")
+    table = _make_table(
+        "Configuration",
+        _CONFIG_COLUMNS,
+        show_header=True,
+        header_style="bold cyan",
+    )
     
     # RPC settings
     table.add_section()
     table.add_row("RPC Provider", cfg.primary_rpc_provider.upper())
-    table.add_row("RPC URL", cfg.get_rpc_url()[:50] + "..." if len(cfg.get_rpc_url()) > 50 else cfg.get_rpc_url())
+    rpc_url = cfg.get_rpc_url()
+    table.add_row("RPC URL", rpc_url[:50] + "..." if len(rpc_url) > 50 else rpc_url)
     
     # Monitoring settings
     table.add_section()
@@ -147,6 +182,7 @@ def test_alerts():
     console.print("[cyan]Testing alert channels...[/cyan]")
     
     # Create sample data
+    from .scanner import MoonScanner
     from .scoring.metrics_fetcher import TokenMetrics
     from .scoring.moon_score import MoonScoreCalculator, MoonScoreComponents
     from .scoring.validators import ValidationResult, ValidationStatus, ValidationCheck
@@ -219,17 +255,14 @@ def _display_scan_results(result: dict):
     rating = result["rating"]
     
     score_panel = Panel.fit(
-        f"[bold yellow]MoonScore:[/bold yellow] [bold green]{score_value:.2f}/100[/bold green]\n"
-        f"[bold yellow]Rating:[/bold yellow] {rating}",
+        _SCORE_PANEL_TEMPLATE.format_map({"score": score_value, "rating": rating}),
         title="🌙 Moon Score",
         border_style="green" if score_value >= 70 else "yellow"
     )
     console.print(score_panel)
     
     # Token info table
-    token_table = Table(title="Token Information", show_header=False)
-    token_table.add_column("Property", style="cyan")
-    token_table.add_column("Value", style="white")
+    token_table = _make_table("Token Information", _TOKEN_INFO_COLUMNS, show_header=False)
     
     metrics = moon_score["metrics"]
     token_table.add_row("Address", result["token_address"])
@@ -244,9 +277,7 @@ def _display_scan_results(result: dict):
     console.print(token_table)
     
     # Score components table
-    components_table = Table(title="Score Components", show_header=True)
-    components_table.add_column("Component", style="cyan")
-    components_table.add_column("Score", style="green")
+    components_table = _make_table("Score Components", _COMPONENT_COLUMNS, show_header=True)
     
     components = moon_score["components"]
     for key, value in components.items():
@@ -261,8 +292,11 @@ def _display_scan_results(result: dict):
     validation_status = validation["overall_status"]
     
     validation_panel = Panel.fit(
-        f"[bold yellow]Status:[/bold yellow] {validation_status.upper()}\n"
-        f"[bold yellow]Passed:[/bold yellow] {validation['passed_checks']}/{validation['passed_checks'] + validation['failed_checks']}",
+        _VALIDATION_PANEL_TEMPLATE.format_map({
+            "status": validation_status.upper(),
+            "passed": validation["passed_checks"],
+            "total": validation["passed_checks"] + validation["failed_checks"],
+        }),
         title="✅ Validation",
         border_style="green" if validation_status == "pass" else "yellow"
     )
@@ -1,30 +1,103 @@
 """DEX monitor for detecting new token pairs on Raydium, Orca, and Jupiter."""
 
 import asyncio
+import time
+from bisect import bisect_left, insort
+from functools import partial
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 
+from ..utils.cache import BoundedSet
 from ..utils.config import get_config
 from ..utils.logger import LoggerMixin
 from ..utils.metrics import tokens_scanned, active_monitors, last_scan_timestamp
+from .dex_parsers import (
+    ORCA_WHIRLPOOL_INITIALIZE_POOL,
+    ORCA_WHIRLPOOL_INITIALIZE_POOL_V2,
+    RAYDIUM_CLMM_CREATE_POOL,
+    RAYDIUM_V4_INITIALIZE2,
+    instruction_data,
+    parse_orca_whirlpool,
+    parse_raydium_clmm,
+    parse_raydium_v4,
+)
 from .rpc_client import RPCClient
 from .websocket_manager import WebSocketManager
 
 
 # Known DEX program IDs on Solana
-DEX_PROGRAM_IDS = {
+DEX_PROGRAM_IDS = MappingProxyType({
     "raydium": "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # Raydium AMM v4
     "raydium_v3": "CAMMCzo5YL8w4VFF8KVHrK22GGUsp5VTaW7grrKgrWqK",  # Raydium CLMM
     "orca": "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc",  # Orca Whirlpool
     "orca_v2": "9W959DqEETiGZocYWCQPaJ6sBmUzgfxXfqGeTEdp3aQP",  # Orca v2
     "jupiter": "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4",  # Jupiter v6
+})
+
+# Program ID -> DEX name (version suffix removed)
+_PROGRAM_ID_TO_DEX = {pid: name.split("_")[0] for name, pid in DEX_PROGRAM_IDS.items()}
+
+# Program ID -> parser reading pool accounts from that DEX's known instruction layout
+_POOL_PARSERS = {
+    DEX_PROGRAM_IDS["raydium"]: parse_raydium_v4,
+    DEX_PROGRAM_IDS["raydium_v3"]: parse_raydium_clmm,
+    DEX_PROGRAM_IDS["orca"]: parse_orca_whirlpool,
+}
+
+# Program ID -> instruction data prefixes of its pool creation instructions
+_POOL_CREATION_DISCRIMINATORS = {
+    DEX_PROGRAM_IDS["raydium"]: (RAYDIUM_V4_INITIALIZE2,),
+    DEX_PROGRAM_IDS["raydium_v3"]: (RAYDIUM_CLMM_CREATE_POOL,),
+    DEX_PROGRAM_IDS["orca"]: (ORCA_WHIRLPOOL_INITIALIZE_POOL, ORCA_WHIRLPOOL_INITIALIZE_POOL_V2),
+}
+
+# Known system accounts that are never token mints
+SYSTEM_ACCOUNTS = frozenset({
+    "11111111111111111111111111111111",  # System Program
+    "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",  # Token Program
+    "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL",  # Associated Token Program
+})
+
+# Number of recent transaction signatures remembered for de-duplication
+SEEN_SIGNATURES_MAXSIZE = 100_000
+
+# New pairs waiting for callbacks, and the workers that deliver them
+CALLBACK_QUEUE_MAXSIZE = 1024
+CALLBACK_WORKERS = 4
+
+# Lowercased substrings of parsed instruction types that indicate pool creation
+_INITIALIZE_MARKER = "initialize"
+_CREATE_MARKER = "create"
+
+# Program ID -> prefixes of the log lines its pool creation instructions emit
+_POOL_CREATION_LOG_MARKERS = {
+    DEX_PROGRAM_IDS["raydium"]: ("Program log: initialize2",),
+    DEX_PROGRAM_IDS["raydium_v3"]: ("Program log: Instruction: CreatePool",),
+    # Also matches "InitializePoolV2"
+    DEX_PROGRAM_IDS["orca"]: ("Program log: Instruction: InitializePool",),
 }
 
+# Runtime log lines are "Program <id> <event>"; logged messages are "Program log: ..."
+_PROGRAM_PREFIX = "Program "
+_INVOKE_EVENT = "invoke ["
+_SUCCESS_EVENT = "success"
+_FAILED_EVENT = "failed"
+# Logged by the runtime in place of lines past the log size limit
+_LOG_TRUNCATED = "Log truncated"
+
+# How many leading account keys are searched for token mints
+MAX_MINT_CANDIDATES = 10
+
+# Shared read-only defaults for missing transaction fields
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_SEQUENCE = ()
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class TokenPair:
-    """Represents a DEX token pair."""
+    """Represents a DEX token pair (identity is the token address)."""
     
     token_address: str
     pair_address: str
@@ -43,13 +116,13 @@ class TokenPair:
             return False
         return self.token_address == other.token_address
     
-    def age_minutes(self) -> float:
-        """Get age of pair in minutes."""
-        return (datetime.now() - self.created_at).total_seconds() / 60
+    def age_minutes(self, now: Optional[datetime] = None) -> float:
+        """Get age of pair in minutes (relative to now, if given)."""
+        return ((now or datetime.now()) - self.created_at).total_seconds() / 60
     
-    def is_eligible(self, max_age_minutes: int = 60) -> bool:
+    def is_eligible(self, max_age_minutes: int = 60, now: Optional[datetime] = None) -> bool:
         """Check if pair is eligible for monitoring (age <= max_age_minutes)."""
-        return self.age_minutes() <= max_age_minutes
+        return self.age_minutes(now) <= max_age_minutes
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -78,16 +151,29 @@ class DEXMonitor(LoggerMixin):
         self.rpc_client = rpc_client
         self.ws_manager = WebSocketManager()
         
-        # Track discovered pairs
+        # Track discovered pairs, plus an index of (created_at, token address) sorted by age
         self.discovered_pairs: Dict[str, TokenPair] = {}
-        self.seen_signatures: Set[str] = set()
-        
-        # Callbacks for new pair events
+        self._pairs_by_age: List[Tuple[datetime, str]] = []
+        self.seen_signatures = BoundedSet(maxsize=SEEN_SIGNATURES_MAXSIZE)
+        # Newest signature polled per program, so the next poll only asks for newer ones
+        self._last_signatures: Dict[str, str] = {}
+        # Bounds in-flight transaction fetches so bursts don't trip RPC rate limits
+        self._tx_fetch_semaphore = asyncio.Semaphore(self.config.max_concurrent_tx_fetches)
+        
+        # Callbacks for new pair events, run by worker tasks off a queue
         self.callbacks: List[Callable] = []
+        self._callback_queue: asyncio.Queue = asyncio.Queue(maxsize=CALLBACK_QUEUE_MAXSIZE)
+        self._callback_workers: List[asyncio.Task] = []
         
         # Monitoring state
         self.running = False
+        # Monotonic time of the last fully processed WebSocket event; polling stands
+        # down while it's recent, unless an event was lost (failed fetch or dropped)
+        self._last_ws_event = float("-inf")
+        self._ws_gap = False
+        self._ws_dropped_events = 0
         self.monitored_dexs = self.config.get_monitored_dexs()
+        self._program_ids = self._compute_program_ids()
         
         self.logger.info(f"Initialized DEX monitor for: {', '.join(self.monitored_dexs)}")
     
@@ -111,6 +197,12 @@ class DEXMonitor(LoggerMixin):
         active_monitors.inc()
         self.logger.info("Starting DEX monitor...")
         
+        # Start callback workers so slow callbacks don't hold up discovery
+        self._callback_workers = [
+            asyncio.create_task(self._callback_worker())
+            for _ in range(CALLBACK_WORKERS)
+        ]
+        
         # Start WebSocket monitoring if enabled
         if self.config.enable_websocket:
             asyncio.create_task(self._start_websocket_monitoring())
@@ -128,6 +220,11 @@ class DEXMonitor(LoggerMixin):
         self.running = False
         active_monitors.dec()
         await self.ws_manager.stop()
+        
+        for worker in self._callback_workers:
+            worker.cancel()
+        await asyncio.gather(*self._callback_workers, return_exceptions=True)
+        self._callback_workers = []
         self.logger.info("DEX monitor stopped")
     
     async def _start_websocket_monitoring(self) -> None:
@@ -135,10 +232,23 @@ class DEXMonitor(LoggerMixin):
         try:
             program_ids = self._get_program_ids()
             
-            await self.ws_manager.subscribe_logs(
-                program_ids,
-                self._handle_log_event,
-            )
+            if self.config.helius_enhanced_websocket:
+                # Full transactions are pushed, so no getTransaction round trip per event
+                await self.ws_manager.subscribe_transactions(
+                    program_ids,
+                    self._handle_transaction_event,
+                )
+            else:
+                # One subscription per program so each event knows which program fired it
+                for program_id in program_ids:
+                    await self.ws_manager.subscribe_logs(
+                        [program_id],
+                        partial(self._handle_log_event, program_id=program_id),
+                    )
+            
+            if self.config.websocket_blockhash_feed:
+                # Keep the latest blockhash in memory instead of polling for it
+                await self.ws_manager.subscribe_blocks(self.rpc_client.handle_block_event)
             
             # Start WebSocket listener
             await self.ws_manager.listen()
@@ -154,6 +264,11 @@ class DEXMonitor(LoggerMixin):
         
         while self.running:
             try:
+                # WebSocket events are flowing, so a poll would only re-fetch what they delivered
+                if self._websocket_covering():
+                    await asyncio.sleep(self.config.scan_interval_seconds)
+                    continue
+                
                 await self._scan_dexs()
                 last_scan_timestamp.set(datetime.now().timestamp())
                 
@@ -164,55 +279,100 @@ class DEXMonitor(LoggerMixin):
                 self.logger.error(f"Polling monitoring error: {e}")
                 await asyncio.sleep(5)
     
+    def _websocket_covering(self) -> bool:
+        """
+        Check whether WebSocket events currently make polling redundant.
+        
+        Clears the record of lost events, since the poll that follows catches up on them.
+        
+        Returns:
+            True if events were processed recently and none were lost since the last poll
+        """
+        dropped_events = self.ws_manager.dropped_events
+        lost_events = self._ws_gap or dropped_events != self._ws_dropped_events
+        self._ws_gap = False
+        self._ws_dropped_events = dropped_events
+        
+        if lost_events:
+            return False
+        return time.monotonic() - self._last_ws_event < self.config.scan_interval_seconds * 2
+    
     async def _scan_dexs(self) -> None:
         """Scan all monitored DEXs for new pairs."""
         program_ids = self._get_program_ids()
         
-        for program_id in program_ids:
-            try:
-                await self._scan_program(program_id)
-            except Exception as e:
-                self.logger.error(f"Error scanning program {program_id}: {e}")
+        # Signatures newer than the last poll, for every program in one round trip
+        try:
+            signature_lists = await self.rpc_client.get_signatures_for_addresses(
+                program_ids,
+                limit=50,
+                until=self._last_signatures,
+            )
+        except Exception as e:
+            self.logger.error(f"Error fetching program signatures: {e}")
+            return
+        
+        for program_id, signatures in zip(program_ids, signature_lists):
+            if signatures:
+                self._last_signatures[program_id] = signatures[0]["signature"]
+        
+        # Programs are independent, so fetch and parse their transactions concurrently
+        results = await asyncio.gather(
+            *(
+                self._scan_program(program_id, signatures)
+                for program_id, signatures in zip(program_ids, signature_lists)
+            ),
+            return_exceptions=True,
+        )
+        
+        for program_id, result in zip(program_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error scanning program {program_id}: {result}")
     
-    async def _scan_program(self, program_id: str) -> None:
+    async def _scan_program(self, program_id: str, signatures: List[Dict]) -> None:
         """
-        Scan a specific program for new pairs.
+        Scan a program's recent transactions for new pairs.
         
         Args:
             program_id: Program ID to scan
+            signatures: Recent signature info for the program
         """
         try:
-            # Get recent signatures
-            signatures = await self.rpc_client.get_signatures_for_address(
-                program_id,
-                limit=50,
-            )
-            
+            # Skip signatures already seen
+            new_signatures = []
             for sig_info in signatures:
                 signature = sig_info["signature"]
-                
-                # Skip if already seen
                 if signature in self.seen_signatures:
                     continue
                 
                 self.seen_signatures.add(signature)
                 
-                # Get transaction details
-                tx = await self.rpc_client.get_transaction(signature)
-                
-                if not tx or "result" not in tx:
+                # Failed transactions never create pools, so don't fetch them
+                if sig_info.get("err"):
+                    continue
+                new_signatures.append(signature)
+            
+            if not new_signatures:
+                return
+            
+            # Get transaction details for all new signatures in one batch request
+            async with self._tx_fetch_semaphore:
+                txs = await self.rpc_client.get_transactions_batch(new_signatures)
+            
+            for signature, tx in zip(new_signatures, txs):
+                if not tx.get("result"):
                     continue
                 
                 # Parse transaction for pair creation
-                pair = await self._parse_transaction(tx["result"], program_id, signature)
+                pair = self._parse_transaction(tx["result"], program_id, signature)
                 
                 if pair:
                     await self._handle_new_pair(pair)
         
         except Exception as e:
-            self.logger.error(f"Error in _scan_program: {e}")
+            self.logger.error("Error in _scan_program: %s", e)
     
-    async def _parse_transaction(
+    def _parse_transaction(
         self,
         tx_data: Dict,
         program_id: str,
@@ -225,36 +385,38 @@ class DEXMonitor(LoggerMixin):
             tx_data: Transaction data
             program_id: Program ID
             signature: Transaction signature
-            
+        
         Returns:
             TokenPair if found, None otherwise
         """
         try:
             # Check if transaction was successful
-            if tx_data.get("meta", {}).get("err"):
+            if tx_data.get("meta", _EMPTY_MAPPING).get("err"):
                 return None
             
             # Get block time
+            now = datetime.now()
             block_time = tx_data.get("blockTime")
             if not block_time:
-                created_at = datetime.now()
+                created_at = now
             else:
                 created_at = datetime.fromtimestamp(block_time)
             
             # Only process recent transactions
-            age_minutes = (datetime.now() - created_at).total_seconds() / 60
+            age_minutes = (now - created_at).total_seconds() / 60
             if age_minutes > self.config.max_token_age_minutes:
                 return None
             
             # Parse instructions to find pair creation
-            instructions = tx_data.get("transaction", {}).get("message", {}).get("instructions", [])
+            message = tx_data.get("transaction", _EMPTY_MAPPING).get("message", _EMPTY_MAPPING)
+            accounts = message.get("accountKeys", _EMPTY_SEQUENCE)
             
-            for instruction in instructions:
+            for instruction in message.get("instructions", _EMPTY_SEQUENCE):
                 # Look for initialize pool instructions
                 if self._is_pool_creation_instruction(instruction, program_id):
-                    pair = await self._extract_pair_info(
+                    pair = self._extract_pair_info(
                         instruction,
-                        tx_data,
+                        accounts,
                         program_id,
                         signature,
                         created_at,
@@ -265,7 +427,7 @@ class DEXMonitor(LoggerMixin):
             return None
         
         except Exception as e:
-            self.logger.error(f"Error parsing transaction: {e}")
+            self.logger.error("Error parsing transaction: %s", e)
             return None
     
     def _is_pool_creation_instruction(self, instruction: Dict, program_id: str) -> bool:
@@ -275,35 +437,83 @@ class DEXMonitor(LoggerMixin):
         Args:
             instruction: Instruction data
             program_id: Program ID
-            
+        
         Returns:
             True if pool creation instruction
         """
-        # This is a simplified check - actual implementation would need
-        # detailed instruction parsing for each DEX
         program_id_key = instruction.get("programId", "")
         
         # Check if instruction is from the DEX program
         if program_id_key != program_id:
             return False
         
-        # Check for common pool creation patterns
-        parsed = instruction.get("parsed", {})
-        instruction_type = parsed.get("type", "")
+        # Known DEX instructions arrive unparsed; match their discriminator
+        discriminators = _POOL_CREATION_DISCRIMINATORS.get(program_id)
+        if discriminators:
+            return instruction_data(instruction).startswith(discriminators)
         
-        pool_creation_types = [
-            "initialize",
-            "initializePool",
-            "initializeWhirlpool",
-            "createPool",
-        ]
+        # This is a simplified check for other programs - actual implementation
+        # would need detailed instruction parsing for each DEX
+        instruction_type = instruction.get("parsed", _EMPTY_MAPPING).get("type")
+        if not instruction_type:
+            return False
         
-        return any(t in instruction_type.lower() for t in ["initialize", "create"])
+        instruction_type = instruction_type.lower()
+        return _INITIALIZE_MARKER in instruction_type or _CREATE_MARKER in instruction_type
     
-    async def _extract_pair_info(
+    @staticmethod
+    def _logs_mention_pool_creation(logs: List[str], program_id: str) -> bool:
+        """
+        Check whether transaction logs could belong to a pool creation.
+        
+        Only lines logged inside the program's own invoke frames are considered,
+        so token and associated token program logs ("InitializeAccount3",
+        "Create") emitted by ordinary swaps don't match.
+        
+        Args:
+            logs: Log messages from a logs notification
+            program_id: Program whose subscription delivered the logs
+        
+        Returns:
+            True if the program logged one of its pool creation instructions,
+            or the logs were truncated
+        """
+        markers = _POOL_CREATION_LOG_MARKERS.get(program_id)
+        frames: List[bool] = []  # Whether each open invoke frame is the program's
+        
+        for line in logs:
+            if line == _LOG_TRUNCATED:
+                # The creation line may be among those cut off
+                return True
+            
+            if line.startswith(_PROGRAM_PREFIX):
+                source, _, event = line[len(_PROGRAM_PREFIX):].partition(" ")
+                if not source.endswith(":"):
+                    # Runtime line for a program: track invoke frames, skip the rest
+                    if event.startswith(_INVOKE_EVENT):
+                        frames.append(source == program_id)
+                    elif (event == _SUCCESS_EVENT or event.startswith(_FAILED_EVENT)) and frames:
+                        frames.pop()
+                    continue
+            
+            if not frames or not frames[-1]:
+                continue
+            
+            if markers:
+                if line.startswith(markers):
+                    return True
+            else:
+                # No known log format, so look for any initialize/create instruction
+                lowered = line.lower()
+                if _INITIALIZE_MARKER in lowered or _CREATE_MARKER in lowered:
+                    return True
+        
+        return False
+    
+    def _extract_pair_info(
         self,
         instruction: Dict,
-        tx_data: Dict,
+        accounts: Sequence,
         program_id: str,
         signature: str,
         created_at: datetime,
@@ -313,28 +523,42 @@ class DEXMonitor(LoggerMixin):
         
         Args:
             instruction: Pool creation instruction
-            tx_data: Full transaction data
+            accounts: Account keys of the transaction message
             program_id: Program ID
             signature: Transaction signature
             created_at: Transaction timestamp
-            
+        
         Returns:
             TokenPair if successfully extracted
         """
         try:
-            # Extract account keys
-            accounts = tx_data.get("transaction", {}).get("message", {}).get("accountKeys", [])
+            dex_name = self._get_dex_name(program_id)
+            
+            # Read the accounts directly where the DEX's instruction layout is known
+            parser = _POOL_PARSERS.get(program_id)
+            if parser:
+                pool_accounts = parser(instruction)
+                if not pool_accounts:
+                    return None
+                
+                pair_address, token_mint, quote_mint = pool_accounts
+                return TokenPair(
+                    token_address=token_mint,
+                    pair_address=pair_address,
+                    dex=dex_name,
+                    base_token=token_mint,
+                    quote_token=quote_mint,
+                    created_at=created_at,
+                    signature=signature,
+                )
             
             if not accounts or len(accounts) < 3:
                 return None
             
-            # Simplified extraction - actual implementation needs DEX-specific logic
-            # For now, we'll create a basic pair structure
-            dex_name = self._get_dex_name(program_id)
-            
-            # Try to identify token mints
+            # Otherwise fall back to a heuristic scan of the transaction's accounts
+            # Try to identify token mints; only the first two are used
             token_mints = []
-            for account in accounts[:10]:  # Check first 10 accounts
+            for account in accounts[:MAX_MINT_CANDIDATES]:
                 if isinstance(account, dict):
                     pubkey = account.get("pubkey", "")
                 elif isinstance(account, str):
@@ -343,8 +567,10 @@ class DEXMonitor(LoggerMixin):
                     continue
                 
                 # Basic heuristic: exclude known system accounts
-                if pubkey and len(pubkey) > 30 and not self._is_system_account(pubkey):
+                if pubkey and len(pubkey) > 30 and pubkey not in SYSTEM_ACCOUNTS:
                     token_mints.append(pubkey)
+                    if len(token_mints) == 2:
+                        break
             
             if len(token_mints) < 2:
                 return None
@@ -363,27 +589,23 @@ class DEXMonitor(LoggerMixin):
             return pair
         
         except Exception as e:
-            self.logger.error(f"Error extracting pair info: {e}")
+            self.logger.error("Error extracting pair info: %s", e)
             return None
     
     def _get_dex_name(self, program_id: str) -> str:
         """Get DEX name from program ID."""
-        for dex_name, pid in DEX_PROGRAM_IDS.items():
-            if pid == program_id:
-                return dex_name.split("_")[0]  # Remove version suffix
-        return "unknown"
+        return _PROGRAM_ID_TO_DEX.get(program_id, "unknown")
     
     def _is_system_account(self, pubkey: str) -> bool:
         """Check if account is a known system account."""
-        system_accounts = [
-            "11111111111111111111111111111111",  # System Program
-            "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",  # Token Program
-            "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL",  # Associated Token Program
-        ]
-        return pubkey in system_accounts
+        return pubkey in SYSTEM_ACCOUNTS
     
     def _get_program_ids(self) -> List[str]:
-        """Get list of program IDs to monitor based on config."""
+        """Get list of program IDs to monitor (computed once from config)."""
+        return self._program_ids
+    
+    def _compute_program_ids(self) -> List[str]:
+        """Compute list of program IDs to monitor based on config."""
         program_ids = []
         
         for dex in self.monitored_dexs:
@@ -402,35 +624,105 @@ class DEXMonitor(LoggerMixin):
         
         return program_ids
     
-    async def _handle_log_event(self, event: Dict) -> None:
+    async def _handle_log_event(self, event: Dict, program_id: Optional[str] = None) -> None:
         """
         Handle log event from WebSocket.
         
         Args:
             event: Log event data
+            program_id: Program whose log subscription fired (all monitored
+                programs are tried if unknown)
         """
         try:
-            signature = event.get("signature")
+            # logsNotification results wrap the log entry in "value"
+            value = event.get("value", event)
+            signature = value.get("signature")
             if not signature or signature in self.seen_signatures:
                 return
             
             self.seen_signatures.add(signature)
             
+            # The logs are already here; only fetch transactions that could create a pool
+            logs = value.get("logs")
+            if value.get("err") or (
+                logs is not None
+                and program_id
+                and not self._logs_mention_pool_creation(logs, program_id)
+            ):
+                self._last_ws_event = time.monotonic()
+                return
+            
             # Get full transaction
-            tx = await self.rpc_client.get_transaction(signature)
+            try:
+                async with self._tx_fetch_semaphore:
+                    tx = await self.rpc_client.get_transaction(signature)
+            except Exception:
+                tx = None
             
-            if not tx or "result" not in tx:
+            if not tx or not tx.get("result"):
+                # Leave the signature to the next poll
+                self.logger.warning("Failed to fetch transaction %s", signature)
+                self.seen_signatures.discard(signature)
+                self._ws_gap = True
                 return
             
-            # Try to parse as pair creation
-            for program_id in self._get_program_ids():
-                pair = await self._parse_transaction(tx["result"], program_id, signature)
-                if pair:
-                    await self._handle_new_pair(pair)
-                    break
+            await self._process_transaction(
+                tx["result"],
+                signature,
+                [program_id] if program_id else None,
+            )
+            self._last_ws_event = time.monotonic()
         
         except Exception as e:
-            self.logger.error(f"Error handling log event: {e}")
+            self.logger.error("Error handling log event: %s", e)
+            self._ws_gap = True
+    
+    async def _handle_transaction_event(self, event: Dict) -> None:
+        """
+        Handle pushed transaction event from Helius Enhanced WebSocket.
+        
+        Args:
+            event: Transaction event data
+        """
+        try:
+            signature = event.get("signature")
+            if not signature or signature in self.seen_signatures:
+                return
+            
+            self.seen_signatures.add(signature)
+            
+            tx_data = event.get("transaction")
+            if not tx_data:
+                self.seen_signatures.discard(signature)
+                self._ws_gap = True
+                return
+            
+            await self._process_transaction(tx_data, signature)
+            self._last_ws_event = time.monotonic()
+        
+        except Exception as e:
+            self.logger.error("Error handling transaction event: %s", e)
+            self._ws_gap = True
+    
+    async def _process_transaction(
+        self,
+        tx_data: Dict,
+        signature: str,
+        program_ids: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Try to parse a transaction as a pair creation for any monitored program.
+        
+        Args:
+            tx_data: Transaction data
+            signature: Transaction signature
+            program_ids: Programs to try (defaults to all monitored programs)
+        """
+        for program_id in program_ids or self._get_program_ids():
+            pair = self._parse_transaction(tx_data, program_id, signature)
+            if pair:
+                await self._handle_new_pair(pair)
+                break
     
     async def _handle_new_pair(self, pair: TokenPair) -> None:
         """
@@ -445,16 +737,31 @@ class DEXMonitor(LoggerMixin):
         
         # Store pair
         self.discovered_pairs[pair.token_address] = pair
+        insort(self._pairs_by_age, (pair.created_at, pair.token_address))
         tokens_scanned.inc()
         
-        self.logger.info(f"New pair discovered: {pair.token_address} on {pair.dex}")
+        self.logger.info("New pair discovered: %s on %s", pair.token_address, pair.dex)
         
-        # Notify callbacks
-        for callback in self.callbacks:
-            try:
-                await callback(pair)
-            except Exception as e:
-                self.logger.error(f"Error in callback {callback.__name__}: {e}")
+        # Hand off to the callback workers; drop the oldest pending pair if they fall behind
+        if self._callback_queue.full():
+            dropped = self._callback_queue.get_nowait()
+            self.logger.warning("Callback queue full, dropping pair %s", dropped.token_address)
+        self._callback_queue.put_nowait(pair)
+    
+    async def _callback_worker(self) -> None:
+        """Run registered callbacks for queued pairs."""
+        while True:
+            pair = await self._callback_queue.get()
+            callbacks = list(self.callbacks)
+            
+            results = await asyncio.gather(
+                *(callback(pair) for callback in callbacks),
+                return_exceptions=True,
+            )
+            
+            for callback, result in zip(callbacks, results):
+                if isinstance(result, Exception):
+                    self.logger.error("Error in callback %s: %s", callback.__name__, result)
     
     async def _cleanup_old_pairs(self) -> None:
         """Remove old pairs from memory to prevent memory leaks."""
@@ -464,13 +771,12 @@ class DEXMonitor(LoggerMixin):
                 
                 cutoff = datetime.now() - timedelta(minutes=self.config.max_token_age_minutes * 2)
                 
-                old_pairs = [
-                    token_addr
-                    for token_addr, pair in self.discovered_pairs.items()
-                    if pair.created_at < cutoff
-                ]
+                # The age index is sorted, so expired pairs are exactly its prefix
+                expired = bisect_left(self._pairs_by_age, (cutoff,))
+                old_pairs = self._pairs_by_age[:expired]
+                del self._pairs_by_age[:expired]
                 
-                for token_addr in old_pairs:
+                for _, token_addr in old_pairs:
                     del self.discovered_pairs[token_addr]
                 
                 if old_pairs:
@@ -479,14 +785,23 @@ class DEXMonitor(LoggerMixin):
             except Exception as e:
                 self.logger.error(f"Error in cleanup task: {e}")
     
+    def _first_active_index(self) -> int:
+        """Get the position in the age index of the oldest pair still eligible."""
+        cutoff = datetime.now() - timedelta(minutes=self.config.max_token_age_minutes)
+        return bisect_left(self._pairs_by_age, (cutoff,))
+    
     def get_active_pairs(self) -> List[TokenPair]:
-        """Get list of currently active pairs."""
+        """Get list of currently active pairs, oldest first."""
+        discovered_pairs = self.discovered_pairs
         return [
-            pair
-            for pair in self.discovered_pairs.values()
-            if pair.is_eligible(self.config.max_token_age_minutes)
+            discovered_pairs[token_addr]
+            for _, token_addr in self._pairs_by_age[self._first_active_index():]
         ]
     
+    def count_active_pairs(self) -> int:
+        """Get the number of currently active pairs."""
+        return len(self._pairs_by_age) - self._first_active_index()
+    
     async def __aenter__(self):
         """Async context manager entry."""
         await self.start()
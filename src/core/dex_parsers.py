@@ -0,0 +1,173 @@
+"""Layout-specific parsers for DEX pool creation instructions."""
+
+import hashlib
+from typing import Dict, Optional, Tuple
+
+
+# Wrapped SOL mint; pools pairing a new token with it quote in SOL
+WRAPPED_SOL_MINT = "So11111111111111111111111111111111111111112"
+
+# (pool address, token mint, quote mint)
+PoolAccounts = Tuple[str, str, str]
+
+# Alphabet of the base58 encoding used for unparsed instruction data
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_INDEX = {char: index for index, char in enumerate(_BASE58_ALPHABET)}
+
+
+def _anchor_discriminator(name: str) -> bytes:
+    """Get the 8-byte discriminator Anchor programs prefix an instruction with."""
+    return hashlib.sha256(f"global:{name}".encode()).digest()[:8]
+
+
+# Instruction data prefixes identifying each pool creation instruction
+RAYDIUM_V4_INITIALIZE2 = b"\x01"
+RAYDIUM_CLMM_CREATE_POOL = _anchor_discriminator("create_pool")
+ORCA_WHIRLPOOL_INITIALIZE_POOL = _anchor_discriminator("initialize_pool")
+ORCA_WHIRLPOOL_INITIALIZE_POOL_V2 = _anchor_discriminator("initialize_pool_v2")
+
+# Raydium AMM v4 initialize2 account positions
+RAYDIUM_V4_POOL = 4
+RAYDIUM_V4_COIN_MINT = 8
+RAYDIUM_V4_PC_MINT = 9
+
+# Raydium CLMM create_pool account positions
+RAYDIUM_CLMM_POOL = 2
+RAYDIUM_CLMM_MINT_0 = 3
+RAYDIUM_CLMM_MINT_1 = 4
+
+# Orca Whirlpool initialize_pool account positions
+ORCA_WHIRLPOOL_MINT_A = 1
+ORCA_WHIRLPOOL_MINT_B = 2
+ORCA_WHIRLPOOL_POOL = 4
+
+# Orca Whirlpool initialize_pool_v2 puts token badges and the funder before the pool
+ORCA_WHIRLPOOL_V2_POOL = 6
+
+
+def b58decode(data: str) -> bytes:
+    """
+    Decode a base58 string.
+    
+    Args:
+        data: Base58-encoded string
+    
+    Returns:
+        Decoded bytes
+    
+    Raises:
+        ValueError: If the string contains characters outside the alphabet
+    """
+    number = 0
+    for char in data:
+        index = _BASE58_INDEX.get(char)
+        if index is None:
+            raise ValueError(f"Invalid base58 character: {char!r}")
+        number = number * 58 + index
+    
+    # Leading "1"s encode leading zero bytes
+    leading_zeros = len(data) - len(data.lstrip("1"))
+    return b"\x00" * leading_zeros + number.to_bytes((number.bit_length() + 7) // 8, "big")
+
+
+def instruction_data(instruction: Dict) -> bytes:
+    """
+    Get the raw data of an unparsed instruction.
+    
+    Args:
+        instruction: Instruction without a "parsed" field (jsonParsed encoding)
+    
+    Returns:
+        Decoded instruction data, or empty bytes if missing or malformed
+    """
+    data = instruction.get("data")
+    if not isinstance(data, str):
+        return b""
+    try:
+        return b58decode(data)
+    except ValueError:
+        return b""
+
+
+def _pool_accounts(pool: str, mint_a: str, mint_b: str) -> PoolAccounts:
+    """Order a pool's mints so the quote side is wrapped SOL when present."""
+    if mint_a == WRAPPED_SOL_MINT:
+        return pool, mint_b, mint_a
+    return pool, mint_a, mint_b
+
+
+def parse_raydium_v4(instruction: Dict) -> Optional[PoolAccounts]:
+    """
+    Read pool accounts from a Raydium AMM v4 initialize2 instruction.
+    
+    Args:
+        instruction: Pool creation instruction (jsonParsed encoding)
+    
+    Returns:
+        Pool accounts, or None if the instruction isn't an initialize2
+    """
+    if not instruction_data(instruction).startswith(RAYDIUM_V4_INITIALIZE2):
+        return None
+    
+    accounts = instruction.get("accounts")
+    if not accounts or len(accounts) <= RAYDIUM_V4_PC_MINT:
+        return None
+    
+    return _pool_accounts(
+        accounts[RAYDIUM_V4_POOL],
+        accounts[RAYDIUM_V4_COIN_MINT],
+        accounts[RAYDIUM_V4_PC_MINT],
+    )
+
+
+def parse_raydium_clmm(instruction: Dict) -> Optional[PoolAccounts]:
+    """
+    Read pool accounts from a Raydium CLMM create_pool instruction.
+    
+    Args:
+        instruction: Pool creation instruction (jsonParsed encoding)
+    
+    Returns:
+        Pool accounts, or None if the instruction isn't a create_pool
+    """
+    if not instruction_data(instruction).startswith(RAYDIUM_CLMM_CREATE_POOL):
+        return None
+    
+    accounts = instruction.get("accounts")
+    if not accounts or len(accounts) <= RAYDIUM_CLMM_MINT_1:
+        return None
+    
+    return _pool_accounts(
+        accounts[RAYDIUM_CLMM_POOL],
+        accounts[RAYDIUM_CLMM_MINT_0],
+        accounts[RAYDIUM_CLMM_MINT_1],
+    )
+
+
+def parse_orca_whirlpool(instruction: Dict) -> Optional[PoolAccounts]:
+    """
+    Read pool accounts from an Orca Whirlpool initialize_pool(_v2) instruction.
+    
+    Args:
+        instruction: Pool creation instruction (jsonParsed encoding)
+    
+    Returns:
+        Pool accounts, or None if the instruction isn't an initialize_pool
+    """
+    data = instruction_data(instruction)
+    if data.startswith(ORCA_WHIRLPOOL_INITIALIZE_POOL):
+        pool_index = ORCA_WHIRLPOOL_POOL
+    elif data.startswith(ORCA_WHIRLPOOL_INITIALIZE_POOL_V2):
+        pool_index = ORCA_WHIRLPOOL_V2_POOL
+    else:
+        return None
+    
+    accounts = instruction.get("accounts")
+    if not accounts or len(accounts) <= pool_index:
+        return None
+    
+    return _pool_accounts(
+        accounts[pool_index],
+        accounts[ORCA_WHIRLPOOL_MINT_A],
+        accounts[ORCA_WHIRLPOOL_MINT_B],
+    )
@@ -1,25 +1,44 @@
 """Solana RPC client with support for QuickNode and Helius providers."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import random
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple, TypeVar
 
 import aiohttp
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
-from solders.pubkey import Pubkey
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
+from solana.rpc.commitment import Commitment
 
 from ..utils.config import get_config
 from ..utils.logger import LoggerMixin
+from ..utils.serialization import json_dumps, json_dumps_bytes, json_loads
 from ..utils.metrics import rpc_requests, rpc_request_duration
 
 
+T = TypeVar("T")
+
+# Keep-alive pool for RPC traffic: a few long-lived TLS connections per provider
+RPC_CONNECTIONS_PER_HOST = 16
+RPC_KEEPALIVE_TIMEOUT = 60
+
+# Single calls made within this window (seconds) are sent together as one batch request
+RPC_BATCH_WINDOW = 0.005
+RPC_BATCH_MAX = 100
+
+# Largest batch raced against the backup when slow (rpc_hedge_delay_ms); bigger batches
+# normally take longer than the hedge delay, so they only fall back to the backup on failure
+RPC_HEDGE_MAX_CALLS = 4
+
+# Transport failures worth retrying, and the cap on the jittered backoff between attempts
+RPC_RETRYABLE_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+RPC_MAX_RETRY_DELAY = 10
+
+# A pushed blockhash older than this (seconds) means the block feed has stalled
+BLOCKHASH_FEED_MAX_AGE = 10.0
+# How long after startup get_recent_blockhash waits for the first pushed block
+BLOCKHASH_FEED_STARTUP_WAIT = 1.0
+
+
 class RPCClient(LoggerMixin):
     """
     Solana RPC client with automatic retry logic and provider switching.
@@ -33,20 +52,48 @@ class RPCClient(LoggerMixin):
         self.backup_client: Optional[AsyncClient] = None
         self.session: Optional[aiohttp.ClientSession] = None
         self._initialized = False
+        self._started_at = 0.0
+        
+        # Latest confirmed blockhash pushed by the block feed (see handle_block_event)
+        self._latest_blockhash: Optional[str] = None
+        self._blockhash_updated_at = 0.0
+        self._blockhash_event = asyncio.Event()
+        
+        # Pending (method, params, future) calls, coalesced into batch requests
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        # Identical calls in flight share one request: (method, serialized params) -> future
+        self._inflight: Dict[Tuple[str, bytes], asyncio.Future] = {}
+        
+        # Per-call options for the default commitment, built once and shared by every call
+        self._commitment_options = {"commitment": self.config.rpc_commitment}
+        self._parsed_options = {"encoding": "jsonParsed", "commitment": self.config.rpc_commitment}
     
     async def initialize(self) -> None:
         """Initialize RPC clients and HTTP session."""
         if self._initialized:
             return
         
-        # Create HTTP session
+        # Create HTTP session; all RPC requests share its persistent connections
         timeout = aiohttp.ClientTimeout(total=self.config.rpc_timeout)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        connector = aiohttp.TCPConnector(
+            limit_per_host=RPC_CONNECTIONS_PER_HOST,
+            keepalive_timeout=RPC_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            json_serialize=json_dumps,
+        )
+        
+        commitment = Commitment(self.config.rpc_commitment)
         
         # Initialize primary client
         primary_url = self.config.get_rpc_url()
         if primary_url:
-            self.primary_client = AsyncClient(primary_url, commitment=Confirmed)
+            self.primary_client = AsyncClient(primary_url, commitment=commitment)
             self.logger.info(f"Initialized primary RPC client: {self.config.primary_rpc_provider}")
         else:
             self.logger.error("No primary RPC URL configured")
@@ -54,17 +101,37 @@ class RPCClient(LoggerMixin):
         
         # Initialize backup client
         if self.config.primary_rpc_provider == "quicknode" and self.config.helius_rpc_url:
-            self.backup_client = AsyncClient(self.config.helius_rpc_url, commitment=Confirmed)
+            self.backup_client = AsyncClient(self.config.helius_rpc_url, commitment=commitment)
             self.logger.info("Initialized backup RPC client: helius")
         elif self.config.primary_rpc_provider == "helius" and self.config.quicknode_rpc_url:
-            self.backup_client = AsyncClient(self.config.quicknode_rpc_url, commitment=Confirmed)
+            self.backup_client = AsyncClient(self.config.quicknode_rpc_url, commitment=commitment)
             self.logger.info("Initialized backup RPC client: quicknode")
         
+        self._queue = asyncio.Queue()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        
         self._initialized = True
+        self._started_at = time.monotonic()
         self.logger.info("RPC client initialization complete")
     
     async def close(self) -> None:
         """Close RPC clients and HTTP session."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        # Fail calls that never made it into a batch
+        if self._queue:
+            while not self._queue.empty():
+                *_, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(ConnectionError("RPC client closed"))
+            self._queue = None
+        
         if self.primary_client:
             await self.primary_client.close()
         if self.backup_client:
@@ -74,14 +141,9 @@ class RPCClient(LoggerMixin):
         self._initialized = False
         self.logger.info("RPC client closed")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
-    )
     async def _make_request(
         self,
-        client: AsyncClient,
+        url: str,
         method: str,
         params: List[Any],
         provider: str,
@@ -90,7 +152,7 @@ class RPCClient(LoggerMixin):
         Make RPC request with retry logic and metrics tracking.
         
         Args:
-            client: Solana RPC client
+            url: RPC endpoint URL
             method: RPC method name
             params: Method parameters
             provider: Provider name (for metrics)
@@ -98,33 +160,491 @@ class RPCClient(LoggerMixin):
         Returns:
             RPC response
         """
-        start_time = datetime.now()
+        assert self.session is not None
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        attempts = max(1, self.config.rpc_max_retries)
+        
+        for attempt in range(1, attempts + 1):
+            start_time = time.monotonic()
+            
+            try:
+                # Make RPC request over the shared session
+                async with self.session.post(url, json=request) as response:
+                    response.raise_for_status()
+                    data: Dict[str, Any] = json_loads(await response.read())
+                
+                # Track metrics
+                duration = time.monotonic() - start_time
+                rpc_request_duration.labels(provider=provider, method=method).observe(duration)
+                rpc_requests.labels(provider=provider, method=method, status="success").inc()
+                
+                return data
+            
+            except Exception as e:
+                # Track error metrics
+                duration = time.monotonic() - start_time
+                rpc_request_duration.labels(provider=provider, method=method).observe(duration)
+                rpc_requests.labels(provider=provider, method=method, status="error").inc()
+                
+                self.logger.error(f"RPC request failed: {method} - {e}")
+                if attempt == attempts or not isinstance(e, RPC_RETRYABLE_ERRORS):
+                    raise
+            
+            await asyncio.sleep(self._retry_delay(attempt))
+        
+        raise AssertionError("unreachable: the last attempt returns or raises")
+    
+    async def _make_batch_request(
+        self,
+        url: str,
+        calls: List[Tuple[str, List[Any]]],
+        provider: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several RPC calls in a single JSON-RPC batch request.
+        
+        Args:
+            url: RPC endpoint URL
+            calls: (method, params) for each call
+            provider: Provider name (for metrics)
+            
+        Returns:
+            One response per call, in the same order
+            (empty dict if the node returned nothing for that call)
+        """
+        batch = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in enumerate(calls)
+        ]
+        
+        # Metrics are labelled by method; batches mixing methods are labelled "batch"
+        methods = {method for method, _ in calls}
+        method = methods.pop() if len(methods) == 1 else "batch"
+        assert self.session is not None
+        attempts = max(1, self.config.rpc_max_retries)
+        
+        for attempt in range(1, attempts + 1):
+            start_time = time.monotonic()
+            
+            try:
+                async with self.session.post(url, json=batch) as response:
+                    response.raise_for_status()
+                    data = json_loads(await response.read())
+                
+                duration = time.monotonic() - start_time
+                rpc_request_duration.labels(provider=provider, method=method).observe(duration)
+                rpc_requests.labels(provider=provider, method=method, status="success").inc()
+                break
+            
+            except Exception as e:
+                duration = time.monotonic() - start_time
+                rpc_request_duration.labels(provider=provider, method=method).observe(duration)
+                rpc_requests.labels(provider=provider, method=method, status="error").inc()
+                
+                self.logger.error(f"RPC batch request failed: {method} x{len(batch)} - {e}")
+                if attempt == attempts or not isinstance(e, RPC_RETRYABLE_ERRORS):
+                    raise
+            
+            await asyncio.sleep(self._retry_delay(attempt))
+        
+        # Batch responses may arrive in any order; match them up by id.
+        # A node that rejects the batch outright returns a single error object.
+        responses = {item.get("id"): item for item in data} if isinstance(data, list) else {}
+        return [responses.get(request_id, {}) for request_id in range(len(batch))]
+    
+    @staticmethod
+    def _request_key(method: str, params: List[Any]) -> Tuple[str, bytes]:
+        """Identify a call by its method and canonically serialized params."""
+        return method, json_dumps_bytes(params, sort_keys=True)
+    
+    def _commitment_param(self, commitment: Optional[str]) -> Dict[str, str]:
+        """Get the {"commitment": ...} options for a call, sharing the default one."""
+        if commitment is None or commitment == self.config.rpc_commitment:
+            return self._commitment_options
+        return {"commitment": commitment}
+    
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Jittered exponential backoff before the next attempt.
+        
+        Args:
+            attempt: Number of the attempt that just failed (starting at 1)
         
+        Returns:
+            Delay in seconds
+        """
+        base = self.config.rpc_retry_delay
+        return random.uniform(base, min(RPC_MAX_RETRY_DELAY, base * 2 ** attempt))
+    
+    async def _batch_request(self, method: str, params_list: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Call one RPC method several times in a single batch request.
+        
+        Args:
+            method: RPC method name
+            params_list: Parameters for each call
+            
+        Returns:
+            One response per entry in params_list, in the same order
+        """
+        return await self._send_batch([(method, params) for params in params_list])
+    
+    async def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Dict[str, Any]]:
+        """
+        Make several RPC calls in a single batch request (see _send_batch).
+        
+        Args:
+            calls: (method, params) for each call
+            
+        Returns:
+            One response per call, in the same order
+            (empty dict for calls that failed)
+        """
         try:
-            # Make RPC request
-            response = await client._provider.make_request(method, params)
+            return await self._send_batch(calls)
+        except Exception:
+            return [{} for _ in calls]
+    
+    async def _call(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        """Make a single RPC call on the primary provider, hedged with the backup."""
+        return await self._hedged(
+            lambda: self._make_request(
+                self.config.get_rpc_url(),
+                method,
+                params,
+                self.config.primary_rpc_provider,
+            ),
+            self._backup_call(method, params),
+        )
+    
+    def _backup_call(
+        self,
+        method: str,
+        params: List[Any],
+    ) -> Optional[Callable[[], Coroutine[Any, Any, Dict[str, Any]]]]:
+        """Get a function that makes this request on the backup endpoint, if configured."""
+        backup = self._backup_endpoint()
+        if not backup:
+            return None
+        
+        provider, url = backup
+        return lambda: self._make_request(url, method, params, provider)
+    
+    def _backup_endpoint(self) -> Optional[Tuple[str, str]]:
+        """Get the (provider, URL) of the backup RPC endpoint, if configured."""
+        if not self.backup_client:
+            return None
+        if self.config.primary_rpc_provider == "quicknode":
+            return "helius", self.config.helius_rpc_url
+        return "quicknode", self.config.quicknode_rpc_url
+    
+    async def _send_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send a batch request to the primary provider, falling back to the backup.
+        
+        The backup is raced against the primary if the primary fails, or
+        for batches of up to RPC_HEDGE_MAX_CALLS calls, if it is slow (see
+        _hedged); if only some calls fail on the primary, just those are
+        re-sent to the backup. Calls still unanswered after that (e.g. on
+        endpoints without batch support, or when the batch request itself
+        failed) are sent individually, concurrently.
+        
+        Args:
+            calls: (method, params) for each call
             
-            # Track metrics
-            duration = (datetime.now() - start_time).total_seconds()
-            rpc_request_duration.labels(provider=provider, method=method).observe(duration)
-            rpc_requests.labels(provider=provider, method=method, status="success").inc()
+        Returns:
+            One response per call, in the same order
+            (empty dict for calls that failed)
+        
+        Raises:
+            Exception: The batch request's error, if the batch and every
+                individual call failed
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        if not calls:
+            return []
+        
+        backup = self._backup_endpoint()
+        
+        async def send(provider: str, url: str) -> Tuple[str, List[Dict[str, Any]]]:
+            return provider, await self._make_batch_request(url, calls, provider)
+        
+        batch_error: Optional[Exception] = None
+        try:
+            answered_by, responses = await self._hedged(
+                lambda: send(self.config.primary_rpc_provider, self.config.get_rpc_url()),
+                (lambda: send(*backup)) if backup else None,
+                hedge=len(calls) <= RPC_HEDGE_MAX_CALLS,
+            )
+        except Exception as e:
+            self.logger.warning(f"Batch of {len(calls)} calls failed, sending individually: {e}")
+            batch_error = e
+            answered_by, responses = "", [{}] * len(calls)
+        
+        failed = [index for index, response in enumerate(responses) if "result" not in response]
+        if failed and batch_error is None and backup and answered_by != backup[0]:
+            provider, url = backup
+            try:
+                retried = await self._make_batch_request(url, [calls[i] for i in failed], provider)
+            except Exception as e:
+                self.logger.error(f"Failed to retry {len(failed)} calls on backup: {e}")
+            else:
+                for index, response in zip(failed, retried):
+                    if "result" in response:
+                        responses[index] = response
+        
+        # A node that rejects batches answers with a single error object, leaving every
+        # slot empty; calls that got an error of their own are not resent
+        unanswered = [index for index, response in enumerate(responses) if not response]
+        if unanswered:
+            if batch_error is None:
+                self.logger.warning(
+                    f"{len(unanswered)} of {len(calls)} batched calls unanswered, "
+                    "sending individually"
+                )
+            results = await asyncio.gather(
+                *(self._call(*calls[index]) for index in unanswered),
+                return_exceptions=True,
+            )
+            if batch_error is not None and all(
+                isinstance(result, BaseException) for result in results
+            ):
+                raise batch_error
+            for index, result in zip(unanswered, results):
+                responses[index] = {} if isinstance(result, BaseException) else result
+        
+        return responses
+    
+    async def _hedged(
+        self,
+        primary: Callable[[], Coroutine[Any, Any, T]],
+        backup: Optional[Callable[[], Coroutine[Any, Any, T]]],
+        hedge: bool = True,
+    ) -> T:
+        """
+        Run a request on the primary provider, racing the backup if the primary is slow.
+        
+        The backup request starts once the primary has taken longer than
+        rpc_hedge_delay_ms (if hedge is set), or as soon as it fails. The
+        first successful response wins and the other request is cancelled.
+        
+        Args:
+            primary: Starts the request on the primary provider
+            backup: Starts the request on the backup provider (None if not configured)
+            hedge: Whether to race the backup against a slow primary, rather
+                than only falling back to it on failure
             
-            return response
+        Returns:
+            First successful response
+        """
+        if backup is None:
+            return await primary()
+        
+        primary_task = asyncio.create_task(primary())
+        tasks = {primary_task}
         
+        try:
+            hedge_delay = self.config.rpc_hedge_delay_ms / 1000 if hedge else None
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if done and primary_task.exception() is None:
+                return primary_task.result()
+            
+            error = primary_task.exception() if done else None
+            if done:
+                self.logger.warning(f"Primary RPC failed, trying backup: {error}")
+                tasks = set()
+            tasks.add(asyncio.create_task(backup()))
+            
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            
+            assert error is not None
+            raise error
+        
+        finally:
+            for task in tasks:
+                task.cancel()
+            if not primary_task.done():
+                primary_task.cancel()
+    
+    async def _coalesced_request(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        """
+        Make an RPC call that is batched with other calls made at about the same time.
+        
+        A call identical to one already in flight waits for that call's
+        response instead of being sent again.
+        
+        Args:
+            method: RPC method name
+            params: Method parameters
+            
+        Returns:
+            RPC response
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        key = self._request_key(method, params)
+        future = self._inflight.get(key)
+        
+        if future is None:
+            assert self._queue is not None
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+            await self._queue.put((method, params, future))
+        
+        # Shielded so one cancelled caller doesn't cancel the call for everyone sharing it
+        response: Dict[str, Any] = await asyncio.shield(future)
+        return response
+    
+    async def _flush_loop(self) -> None:
+        """Collect queued calls and send them as batch requests."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        assert queue is not None
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + RPC_BATCH_WINDOW
+            
+            # Gather whatever else arrives within the batch window
+            while len(batch) < RPC_BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Keep collecting the next batch while this one is in flight
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _dispatch_batch(self, batch: List[Tuple[str, List[Any], asyncio.Future]]) -> None:
+        """Send a batch of queued calls and hand each caller its response."""
+        try:
+            responses = await self._send_batch([(method, params) for method, params, _ in batch])
         except Exception as e:
-            # Track error metrics
-            duration = (datetime.now() - start_time).total_seconds()
-            rpc_request_duration.labels(provider=provider, method=method).observe(duration)
-            rpc_requests.labels(provider=provider, method=method, status="error").inc()
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (*_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+    
+    async def get_transactions_batch(
+        self,
+        signatures: List[str],
+        max_supported_transaction_version: int = 0,
+        commitment: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get details for several transactions in one round trip.
+        
+        Args:
+            signatures: Transaction signatures
+            max_supported_transaction_version: Max transaction version to support
+            commitment: Commitment level (defaults to rpc_commitment from config)
             
-            self.logger.error(f"RPC request failed: {method} - {e}")
-            raise
+        Returns:
+            Transaction responses, in the same order as signatures
+        """
+        options = {
+            "encoding": "jsonParsed",
+            "maxSupportedTransactionVersion": max_supported_transaction_version,
+            "commitment": commitment or self.config.rpc_commitment,
+        }
+        return await self._batch_request(
+            "getTransaction",
+            [[signature, options] for signature in signatures],
+        )
+    
+    async def get_signatures_for_addresses(
+        self,
+        addresses: List[str],
+        limit: int = 100,
+        commitment: Optional[str] = None,
+        until: Optional[Dict[str, str]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get recent transaction signatures for several addresses in one round trip.
+        
+        Args:
+            addresses: Account addresses
+            limit: Maximum number of signatures to return per address
+            commitment: Commitment level (defaults to rpc_commitment from config)
+            until: Per-address signature to stop at; only newer signatures
+                are returned for those addresses
+            
+        Returns:
+            Signature lists, in the same order as addresses
+        """
+        options = {"limit": limit, "commitment": commitment or self.config.rpc_commitment}
+        params_list = []
+        for address in addresses:
+            until_signature = until.get(address) if until else None
+            if until_signature:
+                params_list.append([address, {**options, "until": until_signature}])
+            else:
+                params_list.append([address, options])
+        
+        responses = await self._batch_request("getSignaturesForAddress", params_list)
+        return [response.get("result") or [] for response in responses]
+    
+    async def handle_block_event(self, event: Dict[str, Any]) -> None:
+        """
+        Record the blockhash from a blockSubscribe notification.
+        
+        Args:
+            event: Block notification result
+        """
+        block = (event.get("value") or {}).get("block")
+        if not block or not block.get("blockhash"):
+            return
+        
+        self._latest_blockhash = block["blockhash"]
+        self._blockhash_updated_at = time.monotonic()
+        self._blockhash_event.set()
     
     async def get_recent_blockhash(self) -> str:
-        """Get recent blockhash."""
+        """
+        Get recent blockhash.
+        
+        Served from memory while the block feed (websocket_blockhash_feed)
+        keeps it fresh; otherwise fetched over RPC.
+        
+        Returns:
+            Base58 blockhash
+        """
         if not self._initialized:
             await self.initialize()
         
+        if self.config.websocket_blockhash_feed:
+            # Give the feed a moment to deliver its first block right after startup
+            startup_wait = self._started_at + BLOCKHASH_FEED_STARTUP_WAIT - time.monotonic()
+            if startup_wait > 0 and not self._blockhash_event.is_set():
+                try:
+                    await asyncio.wait_for(self._blockhash_event.wait(), timeout=startup_wait)
+                except asyncio.TimeoutError:
+                    pass
+            
+            if (
+                self._latest_blockhash
+                and time.monotonic() - self._blockhash_updated_at < BLOCKHASH_FEED_MAX_AGE
+            ):
+                return self._latest_blockhash
+        
         try:
             response = await self.primary_client.get_latest_blockhash()
             return str(response.value.blockhash)
@@ -136,82 +656,54 @@ class RPCClient(LoggerMixin):
                 return str(response.value.blockhash)
             raise
     
-    async def get_token_account_info(self, token_address: str) -> Dict[str, Any]:
+    async def get_token_account_info(
+        self,
+        token_address: str,
+        commitment: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Get token account information.
         
         Args:
             token_address: Token mint address
+            commitment: Commitment level (defaults to rpc_commitment from config)
             
         Returns:
             Token account info
         """
-        if not self._initialized:
-            await self.initialize()
+        if commitment is None or commitment == self.config.rpc_commitment:
+            options = self._parsed_options
+        else:
+            options = {"encoding": "jsonParsed", "commitment": commitment}
+        params = [token_address, options]
         
         try:
-            # Convert string address to Pubkey object
-            pubkey = Pubkey.from_string(token_address)
-            params = [pubkey, {"encoding": "jsonParsed"}]
-            response = await self._make_request(
-                self.primary_client,
-                "getAccountInfo",
-                params,
-                self.config.primary_rpc_provider,
-            )
-            return response
+            return await self._coalesced_request("getAccountInfo", params)
         except Exception as e:
             self.logger.error(f"Failed to get token account info: {e}")
-            if self.backup_client:
-                self.logger.info("Trying backup client...")
-                provider = "helius" if self.config.primary_rpc_provider == "quicknode" else "quicknode"
-                pubkey = Pubkey.from_string(token_address)
-                params = [pubkey, {"encoding": "jsonParsed"}]
-                response = await self._make_request(
-                    self.backup_client,
-                    "getAccountInfo",
-                    params,
-                    provider,
-                )
-                return response
             raise
     
-    async def get_token_supply(self, token_address: str) -> Dict[str, Any]:
+    async def get_token_supply(
+        self,
+        token_address: str,
+        commitment: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Get token supply information.
         
         Args:
             token_address: Token mint address
+            commitment: Commitment level (defaults to rpc_commitment from config)
             
         Returns:
             Token supply info
         """
-        if not self._initialized:
-            await self.initialize()
+        params = [token_address, self._commitment_param(commitment)]
         
         try:
-            pubkey = Pubkey.from_string(token_address)
-            params = [pubkey]
-            response = await self._make_request(
-                self.primary_client,
-                "getTokenSupply",
-                params,
-                self.config.primary_rpc_provider,
-            )
-            return response
+            return await self._coalesced_request("getTokenSupply", params)
         except Exception as e:
             self.logger.error(f"Failed to get token supply: {e}")
-            if self.backup_client:
-                provider = "helius" if self.config.primary_rpc_provider == "quicknode" else "quicknode"
-                pubkey = Pubkey.from_string(token_address)
-                params = [pubkey]
-                response = await self._make_request(
-                    self.backup_client,
-                    "getTokenSupply",
-                    params,
-                    provider,
-                )
-                return response
             raise
     
     async def get_signatures_for_address(
@@ -219,6 +711,8 @@ class RPCClient(LoggerMixin):
         address: str,
         limit: int = 100,
         before: Optional[str] = None,
+        commitment: Optional[str] = None,
+        until: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get transaction signatures for an address.
@@ -227,6 +721,8 @@ class RPCClient(LoggerMixin):
             address: Account address
             limit: Maximum number of signatures to return
             before: Start searching backwards from this signature
+            commitment: Commitment level (defaults to rpc_commitment from config)
+            until: Stop searching at this signature (only newer ones are returned)
             
         Returns:
             List of transaction signatures
@@ -234,40 +730,25 @@ class RPCClient(LoggerMixin):
         if not self._initialized:
             await self.initialize()
         
+        options = {"limit": limit, "commitment": commitment or self.config.rpc_commitment}
+        if before:
+            options["before"] = before
+        if until:
+            options["until"] = until
+        params = [address, options]
+        
         try:
-            pubkey = Pubkey.from_string(address)
-            params = [pubkey, {"limit": limit}]
-            if before:
-                params[1]["before"] = before
-            
-            response = await self._make_request(
-                self.primary_client,
-                "getSignaturesForAddress",
-                params,
-                self.config.primary_rpc_provider,
-            )
+            response = await self._call("getSignaturesForAddress", params)
             return response.get("result", [])
         except Exception as e:
             self.logger.error(f"Failed to get signatures: {e}")
-            if self.backup_client:
-                provider = "helius" if self.config.primary_rpc_provider == "quicknode" else "quicknode"
-                pubkey = Pubkey.from_string(address)
-                params = [pubkey, {"limit": limit}]
-                if before:
-                    params[1]["before"] = before
-                response = await self._make_request(
-                    self.backup_client,
-                    "getSignaturesForAddress",
-                    params,
-                    provider,
-                )
-                return response.get("result", [])
             raise
     
     async def get_transaction(
         self,
         signature: str,
         max_supported_transaction_version: int = 0,
+        commitment: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get transaction details.
@@ -275,6 +756,7 @@ class RPCClient(LoggerMixin):
         Args:
             signature: Transaction signature
             max_supported_transaction_version: Max transaction version to support
+            commitment: Commitment level (defaults to rpc_commitment from config)
             
         Returns:
             Transaction details
@@ -282,70 +764,43 @@ class RPCClient(LoggerMixin):
         if not self._initialized:
             await self.initialize()
         
+        params = [
+            signature,
+            {
+                "encoding": "jsonParsed",
+                "maxSupportedTransactionVersion": max_supported_transaction_version,
+                "commitment": commitment or self.config.rpc_commitment,
+            },
+        ]
+        
         try:
-            params = [
-                signature,
-                {
-                    "encoding": "jsonParsed",
-                    "maxSupportedTransactionVersion": max_supported_transaction_version,
-                },
-            ]
-            response = await self._make_request(
-                self.primary_client,
-                "getTransaction",
-                params,
-                self.config.primary_rpc_provider,
-            )
-            return response
+            return await self._call("getTransaction", params)
         except Exception as e:
             self.logger.error(f"Failed to get transaction: {e}")
-            if self.backup_client:
-                provider = "helius" if self.config.primary_rpc_provider == "quicknode" else "quicknode"
-                response = await self._make_request(
-                    self.backup_client,
-                    "getTransaction",
-                    params,
-                    provider,
-                )
-                return response
             raise
     
-    async def get_token_largest_accounts(self, token_address: str) -> List[Dict[str, Any]]:
+    async def get_token_largest_accounts(
+        self,
+        token_address: str,
+        commitment: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Get largest token accounts.
         
         Args:
             token_address: Token mint address
+            commitment: Commitment level (defaults to rpc_commitment from config)
             
         Returns:
             List of largest token accounts
         """
-        if not self._initialized:
-            await self.initialize()
+        params = [token_address, self._commitment_param(commitment)]
         
         try:
-            pubkey = Pubkey.from_string(token_address)
-            params = [pubkey]
-            response = await self._make_request(
-                self.primary_client,
-                "getTokenLargestAccounts",
-                params,
-                self.config.primary_rpc_provider,
-            )
+            response = await self._coalesced_request("getTokenLargestAccounts", params)
             return response.get("result", {}).get("value", [])
         except Exception as e:
             self.logger.error(f"Failed to get largest accounts: {e}")
-            if self.backup_client:
-                provider = "helius" if self.config.primary_rpc_provider == "quicknode" else "quicknode"
-                pubkey = Pubkey.from_string(token_address)
-                params = [pubkey]
-                response = await self._make_request(
-                    self.backup_client,
-                    "getTokenLargestAccounts",
-                    params,
-                    provider,
-                )
-                return response.get("result", {}).get("value", [])
             raise
     
     async def __aenter__(self):
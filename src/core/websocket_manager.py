@@ -1,18 +1,37 @@
 """WebSocket manager for real-time Solana event monitoring."""
 
 import asyncio
-import json
-from typing import Callable, Dict, List, Optional, Set
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
 from datetime import datetime
 
-import websockets
-from websockets.exceptions import WebSocketException
+import aiohttp
 
 from ..utils.config import get_config
 from ..utils.logger import LoggerMixin
+from ..utils.serialization import json_dumps, json_loads
 from ..utils.metrics import websocket_connections, errors
 
 
+# Events waiting for their callbacks, and the workers that run them
+DISPATCH_QUEUE_MAXSIZE = 1024
+DISPATCH_WORKERS = 4
+
+# Keepalive ping interval in seconds; the connection is dropped if a pong takes longer than half of it
+WEBSOCKET_HEARTBEAT = 20
+
+
+@dataclass(slots=True)
+class Subscription:
+    """A local subscription and what is needed to re-establish it."""
+    type: str
+    callback: Callable
+    program_ids: Optional[List[str]] = None
+    address: Optional[str] = None
+
+
 class WebSocketManager(LoggerMixin):
     """
     Manages WebSocket connections for real-time event monitoring.
@@ -22,13 +41,26 @@ class WebSocketManager(LoggerMixin):
     
     def __init__(self):
         self.config = get_config()
-        self.ws: Optional[websockets.WebSocketClientProtocol] = None
-        self.subscriptions: Dict[int, Dict] = {}
-        self.subscription_id_counter = 0
-        self.callbacks: Dict[int, Callable] = {}
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.ws: Optional[aiohttp.ClientWebSocketResponse[bool]] = None
+        # Indexed by local subscription ID; cancelled slots are None so IDs stay stable
+        self.subscriptions: List[Optional[Subscription]] = []
+        # Server-assigned subscription IDs (used in notifications) -> local subscription IDs
+        self.server_subscriptions: Dict[int, int] = {}
+        # Batch frames awaiting their response array, oldest first
+        self._pending_batches: deque = deque()
+        # Cleared once the node rejects a batch frame; requests are then sent one per frame
+        self._batch_supported = True
         self.running = False
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 10
+        self._max_reconnect_delay = 30.0
+        
+        # (callback, result) pairs, run off the receive loop so slow callbacks don't stall it
+        self._dispatch_queue: asyncio.Queue = asyncio.Queue(maxsize=DISPATCH_QUEUE_MAXSIZE)
+        self._dispatch_workers: List[asyncio.Task] = []
+        # Events shed because the dispatch queue was full
+        self.dropped_events = 0
     
     async def connect(self) -> None:
         """Establish WebSocket connection."""
@@ -43,10 +75,13 @@ class WebSocketManager(LoggerMixin):
             return
         
         try:
-            self.ws = await websockets.connect(
+            if not self.session:
+                self.session = aiohttp.ClientSession()
+            # No frame size limit: notification size is bounded by the provider, not by us
+            self.ws = await self.session.ws_connect(
                 wss_url,
-                ping_interval=20,
-                ping_timeout=10,
+                heartbeat=WEBSOCKET_HEARTBEAT,
+                max_msg_size=0,
             )
             websocket_connections.inc()
             self.logger.info(f"WebSocket connected to {wss_url}")
@@ -58,8 +93,10 @@ class WebSocketManager(LoggerMixin):
     
     async def disconnect(self) -> None:
         """Close WebSocket connection."""
-        if self.ws:
-            await self.ws.close()
+        # Detach first so a concurrent disconnect (stop() vs. listen()) closes it only once
+        ws, self.ws = self.ws, None
+        if ws:
+            await ws.close()
             websocket_connections.dec()
             self.logger.info("WebSocket disconnected")
     
@@ -74,36 +111,17 @@ class WebSocketManager(LoggerMixin):
         Args:
             program_ids: List of program IDs to monitor
             callback: Callback function to handle log events
-            
+        
         Returns:
             Subscription ID
         """
         if not self.ws:
             await self.connect()
         
-        subscription_id = self.subscription_id_counter
-        self.subscription_id_counter += 1
-        
-        for program_id in program_ids:
-            request = {
-                "jsonrpc": "2.0",
-                "id": subscription_id,
-                "method": "logsSubscribe",
-                "params": [
-                    {"mentions": [program_id]},
-                    {"commitment": "confirmed"},
-                ],
-            }
-            
-            await self.ws.send(json.dumps(request))
-            self.logger.info(f"Subscribed to logs for program {program_id}")
-        
-        self.subscriptions[subscription_id] = {
-            "type": "logs",
-            "program_ids": program_ids,
-            "callback": callback,
-        }
-        self.callbacks[subscription_id] = callback
+        subscription_id = self._add_subscription(
+            Subscription(type="logs", callback=callback, program_ids=program_ids)
+        )
+        await self._send_subscribe(subscription_id)
         
         return subscription_id
     
@@ -118,38 +136,195 @@ class WebSocketManager(LoggerMixin):
         Args:
             account_address: Account address to monitor
             callback: Callback function to handle account change events
-            
+        
+        Returns:
+            Subscription ID
+        """
+        if not self.ws:
+            await self.connect()
+        
+        subscription_id = self._add_subscription(
+            Subscription(type="account", callback=callback, address=account_address)
+        )
+        await self._send_subscribe(subscription_id)
+        
+        return subscription_id
+    
+    async def subscribe_transactions(
+        self,
+        program_ids: List[str],
+        callback: Callable,
+    ) -> int:
+        """
+        Subscribe to full transactions mentioning any of the given programs.
+        
+        Uses the Helius Enhanced WebSocket transactionSubscribe method, which
+        pushes parsed transactions so no follow-up getTransaction is needed.
+        
+        Args:
+            program_ids: List of program IDs to monitor
+            callback: Callback function to handle transaction events
+        
+        Returns:
+            Subscription ID
+        """
+        if not self.ws:
+            await self.connect()
+        
+        subscription_id = self._add_subscription(
+            Subscription(type="transactions", callback=callback, program_ids=program_ids)
+        )
+        await self._send_subscribe(subscription_id)
+        
+        return subscription_id
+    
+    async def subscribe_blocks(self, callback: Callable) -> int:
+        """
+        Subscribe to confirmed blocks, without transaction details.
+        
+        blockSubscribe is an unstable method; providers that don't enable it
+        reject the subscription and no events arrive.
+        
+        Args:
+            callback: Callback function to handle block events
+        
         Returns:
             Subscription ID
         """
         if not self.ws:
             await self.connect()
         
-        subscription_id = self.subscription_id_counter
-        self.subscription_id_counter += 1
-        
-        request = {
-            "jsonrpc": "2.0",
-            "id": subscription_id,
-            "method": "accountSubscribe",
-            "params": [
-                account_address,
-                {"encoding": "jsonParsed", "commitment": "confirmed"},
-            ],
-        }
-        
-        await self.ws.send(json.dumps(request))
-        self.logger.info(f"Subscribed to account {account_address}")
-        
-        self.subscriptions[subscription_id] = {
-            "type": "account",
-            "address": account_address,
-            "callback": callback,
-        }
-        self.callbacks[subscription_id] = callback
+        subscription_id = self._add_subscription(Subscription(type="blocks", callback=callback))
+        await self._send_subscribe(subscription_id)
         
         return subscription_id
     
+    def _add_subscription(self, subscription: Subscription) -> int:
+        """Store a subscription and return its local ID."""
+        self.subscriptions.append(subscription)
+        return len(self.subscriptions) - 1
+    
+    def _get_subscription(self, subscription_id: Optional[int]) -> Optional[Subscription]:
+        """Look up an active subscription by local ID."""
+        if isinstance(subscription_id, int) and 0 <= subscription_id < len(self.subscriptions):
+            return self.subscriptions[subscription_id]
+        return None
+    
+    def _subscribe_requests(self, subscription_id: int) -> List[Dict]:
+        """
+        Build the subscribe request(s) for a stored subscription.
+        
+        Args:
+            subscription_id: Local subscription ID, used as the request ID
+        
+        Returns:
+            JSON-RPC request objects
+        """
+        subscription = self.subscriptions[subscription_id]
+        assert subscription is not None
+        
+        if subscription.type == "logs":
+            # logsSubscribe takes a single mention, so subscribe once per program
+            return [
+                {
+                    "jsonrpc": "2.0",
+                    "id": subscription_id,
+                    "method": "logsSubscribe",
+                    "params": [
+                        {"mentions": [program_id]},
+                        {"commitment": "confirmed"},
+                    ],
+                }
+                for program_id in subscription.program_ids or []
+            ]
+        
+        if subscription.type == "account":
+            return [{
+                "jsonrpc": "2.0",
+                "id": subscription_id,
+                "method": "accountSubscribe",
+                "params": [
+                    subscription.address,
+                    {"encoding": "jsonParsed", "commitment": "confirmed"},
+                ],
+            }]
+        
+        if subscription.type == "transactions":
+            return [{
+                "jsonrpc": "2.0",
+                "id": subscription_id,
+                "method": "transactionSubscribe",
+                "params": [
+                    {"accountInclude": subscription.program_ids, "failed": False},
+                    {
+                        "commitment": "confirmed",
+                        "encoding": "jsonParsed",
+                        "transactionDetails": "full",
+                        "maxSupportedTransactionVersion": 0,
+                    },
+                ],
+            }]
+        
+        if subscription.type == "blocks":
+            return [{
+                "jsonrpc": "2.0",
+                "id": subscription_id,
+                "method": "blockSubscribe",
+                "params": [
+                    "all",
+                    {
+                        "commitment": "confirmed",
+                        "encoding": "json",
+                        "transactionDetails": "none",
+                        "showRewards": False,
+                        "maxSupportedTransactionVersion": 0,
+                    },
+                ],
+            }]
+        
+        return []
+    
+    async def _send_requests(self, requests: List[Dict]) -> None:
+        """
+        Send JSON-RPC requests, as a single batch frame when there are several.
+        
+        Args:
+            requests: JSON-RPC request objects
+        """
+        assert self.ws is not None
+        
+        if len(requests) > 1 and self._batch_supported:
+            self._pending_batches.append(requests)
+            await self.ws.send_str(json_dumps(requests))
+            return
+        
+        for request in requests:
+            await self.ws.send_str(json_dumps(request))
+    
+    async def _send_subscribe(self, subscription_id: int) -> None:
+        """
+        Send the subscribe request(s) for a stored subscription.
+        
+        Args:
+            subscription_id: Local subscription ID, used as the request ID
+        """
+        await self._send_requests(self._subscribe_requests(subscription_id))
+        
+        subscription = self.subscriptions[subscription_id]
+        assert subscription is not None
+        if subscription.type == "logs":
+            self.logger.info(
+                f"Subscribed to logs for {len(subscription.program_ids or [])} programs"
+            )
+        elif subscription.type == "account":
+            self.logger.info(f"Subscribed to account {subscription.address}")
+        elif subscription.type == "transactions":
+            self.logger.info(
+                f"Subscribed to transactions for {len(subscription.program_ids or [])} programs"
+            )
+        elif subscription.type == "blocks":
+            self.logger.info("Subscribed to blocks")
+    
     async def unsubscribe(self, subscription_id: int) -> None:
         """
         Unsubscribe from events.
@@ -157,32 +332,44 @@ class WebSocketManager(LoggerMixin):
         Args:
             subscription_id: Subscription ID to cancel
         """
-        if subscription_id not in self.subscriptions:
+        subscription = self._get_subscription(subscription_id)
+        if subscription is None:
             self.logger.warning(f"Subscription {subscription_id} not found")
             return
         
-        subscription = self.subscriptions[subscription_id]
-        
-        if subscription["type"] == "logs":
+        if subscription.type == "logs":
             method = "logsUnsubscribe"
-        elif subscription["type"] == "account":
+        elif subscription.type == "account":
             method = "accountUnsubscribe"
+        elif subscription.type == "transactions":
+            method = "transactionUnsubscribe"
+        elif subscription.type == "blocks":
+            method = "blockUnsubscribe"
         else:
-            self.logger.error(f"Unknown subscription type: {subscription['type']}")
+            self.logger.error(f"Unknown subscription type: {subscription.type}")
             return
         
-        request = {
-            "jsonrpc": "2.0",
-            "id": subscription_id,
-            "method": method,
-            "params": [subscription_id],
-        }
+        # The server knows subscriptions by the IDs it assigned on confirmation
+        server_ids = [
+            server_id
+            for server_id, local_id in self.server_subscriptions.items()
+            if local_id == subscription_id
+        ]
         
-        if self.ws:
-            await self.ws.send(json.dumps(request))
+        for server_id in server_ids:
+            request = {
+                "jsonrpc": "2.0",
+                "id": subscription_id,
+                "method": method,
+                "params": [server_id],
+            }
+            
+            if self.ws:
+                await self.ws.send_str(json_dumps(request))
+            
+            del self.server_subscriptions[server_id]
         
-        del self.subscriptions[subscription_id]
-        del self.callbacks[subscription_id]
+        self.subscriptions[subscription_id] = None
         
         self.logger.info(f"Unsubscribed from {subscription_id}")
     
@@ -196,30 +383,28 @@ class WebSocketManager(LoggerMixin):
             await self.connect()
         
         self.running = True
+        self._dispatch_workers = [
+            asyncio.create_task(self._dispatch_worker())
+            for _ in range(DISPATCH_WORKERS)
+        ]
         self.logger.info("WebSocket listener started")
         
         try:
             while self.running:
                 try:
-                    message = await asyncio.wait_for(self.ws.recv(), timeout=30)
-                    data = json.loads(message)
+                    # Keepalive pings are sent and answered by aiohttp (see WEBSOCKET_HEARTBEAT)
+                    assert self.ws is not None
+                    message = await self.ws.receive()
+                    if message.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        raise ConnectionError(f"WebSocket closed ({message.type.name})")
                     
-                    # Handle subscription confirmations
-                    if "result" in data and "id" in data:
-                        self.logger.debug(f"Subscription confirmed: {data}")
-                        continue
-                    
-                    # Handle subscription events
-                    if "method" in data and "params" in data:
-                        await self._handle_event(data)
-                    
-                except asyncio.TimeoutError:
-                    # Send ping to keep connection alive
-                    if self.ws:
-                        await self.ws.ping()
-                    continue
+                    await self._handle_message(json_loads(message.data))
                 
-                except WebSocketException as e:
+                except (aiohttp.ClientError, ConnectionError) as e:
+                    if not self.running:
+                        # Closed by stop()
+                        break
+                    
                     self.logger.error(f"WebSocket error: {e}")
                     errors.labels(error_type="websocket_error", component="websocket_manager").inc()
                     
@@ -227,7 +412,12 @@ class WebSocketManager(LoggerMixin):
                     if self._reconnect_attempts < self._max_reconnect_attempts:
                         self._reconnect_attempts += 1
                         self.logger.info(f"Reconnecting... (attempt {self._reconnect_attempts})")
-                        await asyncio.sleep(2 ** self._reconnect_attempts)
+                        # Capped exponential backoff, jittered so replicas don't reconnect in lockstep
+                        delay = min(
+                            self._max_reconnect_delay,
+                            random.uniform(0.5, 1.5) * 2 ** self._reconnect_attempts,
+                        )
+                        await asyncio.sleep(delay)
                         await self.disconnect()
                         await self.connect()
                         
@@ -244,8 +434,75 @@ class WebSocketManager(LoggerMixin):
         
         finally:
             self.running = False
+            for worker in self._dispatch_workers:
+                worker.cancel()
+            await asyncio.gather(*self._dispatch_workers, return_exceptions=True)
+            self._dispatch_workers = []
             await self.disconnect()
     
+    async def _handle_message(self, data: Any) -> None:
+        """
+        Route a received message to the response or event handlers.
+        
+        Args:
+            data: Decoded JSON message
+        """
+        # Batched requests are answered with an array of responses
+        if isinstance(data, list):
+            if self._pending_batches:
+                self._pending_batches.popleft()
+            for response in data:
+                self._handle_response(response)
+            return
+        
+        # Errors not tied to a request ID, e.g. a node refusing a batch frame
+        if "error" in data and data.get("id") is None:
+            await self._handle_rejected_batch(data)
+            return
+        
+        # Handle subscription confirmations and failures
+        if "id" in data and ("result" in data or "error" in data):
+            self._handle_response(data)
+            return
+        
+        # Handle subscription events
+        if "method" in data and "params" in data:
+            await self._handle_event(data)
+    
+    async def _handle_rejected_batch(self, data: Dict) -> None:
+        """
+        Log an error response without a request ID and resend the batch it refused.
+        
+        Args:
+            data: JSON-RPC error response
+        """
+        self.logger.error(f"WebSocket request rejected: {data.get('error')}")
+        errors.labels(error_type="websocket_rejected", component="websocket_manager").inc()
+        
+        if not self._pending_batches:
+            return
+        
+        # The node doesn't take batch frames; send this and future requests one at a time
+        requests = self._pending_batches.popleft()
+        self._batch_supported = False
+        self.logger.warning(f"Batch rejected, resending {len(requests)} requests individually")
+        await self._send_requests(requests)
+    
+    def _handle_response(self, data: Dict) -> None:
+        """
+        Record the server ID assigned by a subscription confirmation.
+        
+        Args:
+            data: JSON-RPC response
+        """
+        if "result" not in data:
+            self.logger.warning(f"Subscription request failed: {data.get('error')}")
+            return
+        
+        if self._get_subscription(data.get("id")) and isinstance(data["result"], int):
+            self.server_subscriptions[data["result"]] = data["id"]
+        self.logger.debug(f"Subscription confirmed: {data}")
+    
     async def _handle_event(self, data: Dict) -> None:
         """
         Handle incoming WebSocket events.
@@ -257,21 +514,28 @@ class WebSocketManager(LoggerMixin):
             method = data.get("method")
             params = data.get("params", {})
             
-            if method == "logsNotification":
+            if method in (
+                "logsNotification",
+                "accountNotification",
+                "transactionNotification",
+                "blockNotification",
+            ):
                 result = params.get("result", {})
-                subscription_id = params.get("subscription")
-                
-                if subscription_id in self.callbacks:
-                    callback = self.callbacks[subscription_id]
-                    await callback(result)
-            
-            elif method == "accountNotification":
-                result = params.get("result", {})
-                subscription_id = params.get("subscription")
+                subscription = self._get_subscription(
+                    self.server_subscriptions.get(params.get("subscription"))
+                )
                 
-                if subscription_id in self.callbacks:
-                    callback = self.callbacks[subscription_id]
-                    await callback(result)
+                if subscription is not None:
+                    try:
+                        self._dispatch_queue.put_nowait((subscription.callback, result))
+                    except asyncio.QueueFull:
+                        # Never block the receive loop; shed the event instead
+                        self.dropped_events += 1
+                        self.logger.warning("Dispatch queue full, dropping event")
+                        errors.labels(
+                            error_type="websocket_event_dropped",
+                            component="websocket_manager",
+                        ).inc()
             
             else:
                 self.logger.debug(f"Unhandled event method: {method}")
@@ -280,28 +544,37 @@ class WebSocketManager(LoggerMixin):
             self.logger.error(f"Error handling event: {e}")
             errors.labels(error_type="event_handler", component="websocket_manager").inc()
     
+    async def _dispatch_worker(self) -> None:
+        """Run callbacks for queued events."""
+        while True:
+            callback, result = await self._dispatch_queue.get()
+            try:
+                await callback(result)
+            except Exception as e:
+                self.logger.error(f"Error handling event: {e}")
+                errors.labels(error_type="event_handler", component="websocket_manager").inc()
+    
     async def _resubscribe_all(self) -> None:
-        """Re-establish all subscriptions after reconnection."""
-        subscriptions_copy = list(self.subscriptions.items())
-        self.subscriptions.clear()
-        self.callbacks.clear()
-        
-        for sub_id, subscription in subscriptions_copy:
-            if subscription["type"] == "logs":
-                await self.subscribe_logs(
-                    subscription["program_ids"],
-                    subscription["callback"],
-                )
-            elif subscription["type"] == "account":
-                await self.subscribe_account(
-                    subscription["address"],
-                    subscription["callback"],
-                )
+        """Re-establish all subscriptions after reconnection, keeping their local IDs."""
+        self.server_subscriptions.clear()
+        self._pending_batches.clear()
+        
+        # One batch frame for everything; responses are matched back by request ID
+        requests = []
+        for subscription_id, subscription in enumerate(self.subscriptions):
+            if subscription is not None:
+                requests.extend(self._subscribe_requests(subscription_id))
+        
+        await self._send_requests(requests)
+        self.logger.info(f"Resubscribed {len(requests)} subscription requests")
     
     async def stop(self) -> None:
         """Stop the WebSocket listener."""
         self.running = False
         await self.disconnect()
+        if self.session:
+            await self.session.close()
+            self.session = None
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -11,17 +11,27 @@ from .scoring.moon_score import MoonScoreCalculator
 from .scoring.validators import TokenValidator
 from .alerts.telegram_bot import TelegramAlerter
 from .alerts.discord_bot import DiscordAlerter
-from .alerts.webhook_sender import WebhookSender
+from .alerts.webhook_sender import WebhookSender, close_connector
+from .utils.cache import BoundedSet
 from .utils.config import get_config
+from .utils.event_loop import install_uvloop
 from .utils.logger import LoggerMixin, setup_logger
 from .utils.metrics import (
     start_metrics_server,
     tokens_alerted,
     token_processing_duration,
     tokens_in_memory,
+    tokens_prescreened_out,
 )
 
 
+# Outer deadline for delivering one alert on one channel, including retries (seconds)
+ALERT_TIMEOUT_SECONDS = 15
+
+# Number of recently processed token mints remembered to skip duplicate pairs
+PROCESSED_TOKENS_MAXSIZE = 100_000
+
+
 class MoonScanner(LoggerMixin):
     """
     Main scanner application.
@@ -47,7 +57,8 @@ class MoonScanner(LoggerMixin):
         
         # State
         self.running = False
-        self.processed_tokens = set()
+        self.processed_tokens = BoundedSet(maxsize=PROCESSED_TOKENS_MAXSIZE)
+        self._stop_event = asyncio.Event()
         
         self.logger.info("Moon Scanner initialized")
     
@@ -58,6 +69,7 @@ class MoonScanner(LoggerMixin):
             return
         
         self.running = True
+        self._stop_event.clear()
         self.logger.info("=" * 60)
         self.logger.info("🌙 SOLANA MOON SCANNER STARTING 🌙")
         self.logger.info("=" * 60)
@@ -72,6 +84,9 @@ class MoonScanner(LoggerMixin):
             # Register callback for new pairs
             self.dex_monitor.register_callback(self._on_new_pair)
             
+            # Counted when Prometheus scrapes rather than on a timer
+            tokens_in_memory.set_function(self.dex_monitor.count_active_pairs)
+            
             # Start monitoring
             await self.dex_monitor.start()
             
@@ -81,12 +96,7 @@ class MoonScanner(LoggerMixin):
             self.logger.info("Waiting for new token pairs...")
             
             # Keep running until stopped
-            while self.running:
-                await asyncio.sleep(1)
-                
-                # Update metrics
-                active_pairs = len(self.dex_monitor.get_active_pairs())
-                tokens_in_memory.set(active_pairs)
+            await self._stop_event.wait()
         
         except KeyboardInterrupt:
             self.logger.info("Received shutdown signal")
@@ -104,6 +114,7 @@ class MoonScanner(LoggerMixin):
             return
         
         self.running = False
+        self._stop_event.set()
         self.logger.info("Stopping scanner...")
         
         # Stop components
@@ -116,8 +127,10 @@ class MoonScanner(LoggerMixin):
         if self.validator:
             await self.validator.close()
         
+        await self.telegram.close()
         await self.discord.close()
         await self.webhook.close()
+        await close_connector()
         await self.rpc_client.close()
         
         self.logger.info("Scanner stopped")
@@ -141,7 +154,7 @@ class MoonScanner(LoggerMixin):
         await self.validator.initialize()
         
         # Initialize alert channels
-        self.telegram.initialize()
+        await self.telegram.initialize()
         await self.discord.initialize()
         await self.webhook.initialize()
         
@@ -160,6 +173,20 @@ class MoonScanner(LoggerMixin):
         
         self.processed_tokens.add(pair.token_address)
         
+        # Cheap pre-screen before any RPC/API calls: drop pairs that went stale
+        # while queued, or whose age alone rules out reaching the threshold
+        age_minutes = pair.age_minutes()
+        if (
+            age_minutes > self.config.max_token_age_minutes
+            or self.score_calculator.max_possible_score(age_minutes)
+            < self.config.min_moon_score_threshold
+        ):
+            self.logger.debug(
+                f"Skipping {pair.token_address}: too old to qualify ({age_minutes:.1f} min)"
+            )
+            tokens_prescreened_out.inc()
+            return
+        
         self.logger.info(f"Processing new pair: {pair.token_address} on {pair.dex}")
         
         try:
@@ -250,7 +277,11 @@ class MoonScanner(LoggerMixin):
             tasks.append(self.webhook.send_alert(moon_score, validation, dex))
         
         if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # A channel that misses the deadline counts as failed instead of holding up the rest
+            results = await asyncio.gather(
+                *(asyncio.wait_for(task, timeout=ALERT_TIMEOUT_SECONDS) for task in tasks),
+                return_exceptions=True,
+            )
             
             success_count = sum(1 for r in results if r is True)
             self.logger.info(f"Alerts sent: {success_count}/{len(tasks)} successful")
@@ -315,4 +346,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
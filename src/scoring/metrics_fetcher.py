@@ -1,19 +1,72 @@
 """Fetches on-chain metrics for token analysis."""
 
 import asyncio
-from typing import Dict, List, Optional
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 import aiohttp
 
 from ..core.rpc_client import RPCClient
+from ..utils.cache import TTLCache
 from ..utils.config import get_config
 from ..utils.logger import LoggerMixin
 from ..utils.metrics import rpc_requests
 
 
-@dataclass
+# Bound connect and read separately so one stalled API can't eat the whole budget
+_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_read=10)
+
+# HTTP session shared by every MetricsFetcher on the running event loop, so
+# Solscan/Helius/Twitter connections are reused across fetchers. It is closed
+# when the last fetcher using it closes.
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SESSION_USERS = 0
+
+# Tokens whose fetched metrics are kept for reuse
+METRICS_CACHE_MAXSIZE = 2048
+
+# External API responses kept for reuse
+API_CACHE_MAXSIZE = 4096
+
+
+def _acquire_session() -> aiohttp.ClientSession:
+    """Get the shared session for the running event loop and register a user."""
+    global _SESSION, _SESSION_LOOP, _SESSION_USERS
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        _SESSION = aiohttp.ClientSession(connector=connector, timeout=_FETCH_TIMEOUT)
+        _SESSION_LOOP = loop
+        _SESSION_USERS = 0
+    _SESSION_USERS += 1
+    return _SESSION
+
+
+async def _release_session(session: aiohttp.ClientSession) -> None:
+    """Unregister a user of a shared session, closing it after the last one."""
+    global _SESSION, _SESSION_LOOP, _SESSION_USERS
+    if session is not _SESSION:
+        # Left over from an earlier event loop
+        return
+    
+    _SESSION_USERS -= 1
+    if _SESSION_USERS <= 0:
+        await session.close()
+        _SESSION = None
+        _SESSION_LOOP = None
+        _SESSION_USERS = 0
+
+
+@dataclass(slots=True)
 class TokenMetrics:
     """Container for token metrics."""
     
@@ -95,22 +148,41 @@ class MetricsFetcher(LoggerMixin):
     Combines data from Solana RPC, Helius, Solscan, and other sources.
     """
     
-    def __init__(self, rpc_client: RPCClient):
+    def __init__(self, rpc_client: RPCClient, commitment: Optional[str] = None):
         self.config = get_config()
         self.rpc_client = rpc_client
+        self.commitment = commitment or self.config.rpc_commitment
         self.session: Optional[aiohttp.ClientSession] = None
+        
+        # Mint info and supply change rarely; reuse them across scans of the same token
+        self._token_info_cache = TTLCache(ttl=self.config.token_info_cache_ttl)
+        self._token_supply_cache = TTLCache(ttl=self.config.token_supply_cache_ttl)
+        
+        # Recently fetched metrics and fetches in flight, keyed by (token, pair);
+        # a token listed on several DEXs at once is only fetched once
+        self._metrics_cache = TTLCache(
+            maxsize=METRICS_CACHE_MAXSIZE,
+            ttl=self.config.token_metrics_cache_ttl,
+        )
+        self._inflight: Dict[Tuple[str, Optional[str]], asyncio.Future[TokenMetrics]] = {}
+        
+        # Solscan/Helius/Twitter JSON payloads and requests in flight, keyed by (API, token, ...)
+        self._api_cache = TTLCache(
+            maxsize=API_CACHE_MAXSIZE,
+            ttl=self.config.external_api_cache_ttl,
+        )
+        self._api_inflight: Dict[Tuple[str, ...], asyncio.Future] = {}
     
     async def initialize(self) -> None:
-        """Initialize HTTP session."""
-        if not self.session:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+        """Initialize HTTP session on the shared connection pool."""
+        if self.session is None or self.session.closed:
+            self.session = _acquire_session()
     
     async def close(self) -> None:
-        """Close HTTP session."""
+        """Release HTTP session (closed once no other fetcher is using it)."""
         if self.session:
-            await self.session.close()
-            self.session = None
+            session, self.session = self.session, None
+            await _release_session(session)
     
     async def fetch_metrics(
         self,
@@ -120,6 +192,10 @@ class MetricsFetcher(LoggerMixin):
         """
         Fetch all available metrics for a token.
         
+        Metrics fetched in the last token_metrics_cache_ttl seconds are
+        reused, and concurrent calls for the same token share one fetch.
+        Each caller gets its own copy, metadata dict included.
+        
         Args:
             token_address: Token mint address
             pair_address: Pair/pool address (optional)
@@ -127,16 +203,35 @@ class MetricsFetcher(LoggerMixin):
         Returns:
             TokenMetrics object
         """
-        await self.initialize()
+        key = (token_address, pair_address)
+        metrics: Optional[TokenMetrics] = self._metrics_cache.get(key)
+        
+        if metrics is None:
+            future = self._inflight.get(key)
+            if future is None:
+                future = asyncio.ensure_future(self._fetch_metrics(token_address, pair_address))
+                self._inflight[key] = future
+                future.add_done_callback(lambda _: self._inflight.pop(key, None))
+            
+            # Shielded so one cancelled caller doesn't cancel the fetch for everyone sharing it
+            metrics = await asyncio.shield(future)
+        
+        return replace(metrics, metadata=dict(metrics.metadata))
+    
+    async def _fetch_metrics(
+        self,
+        token_address: str,
+        pair_address: Optional[str],
+    ) -> TokenMetrics:
+        """Fetch metrics for a token, caching them if the RPC batch succeeded."""
+        if self.session is None or self.session.closed:
+            await self.initialize()
         
         metrics = TokenMetrics(token_address=token_address)
         
-        # Fetch metrics in parallel
-        tasks = [
-            self._fetch_token_info(token_address, metrics),
-            self._fetch_holder_metrics(token_address, metrics),
-            self._fetch_transaction_metrics(token_address, metrics),
-            self._fetch_liquidity_metrics(token_address, pair_address, metrics),
+        # On-chain metrics come from one RPC batch; external APIs run alongside it
+        tasks: List[Awaitable[Any]] = [
+            self._fetch_rpc_metrics(token_address, pair_address, metrics)
         ]
         
         # Add external API calls if enabled
@@ -147,19 +242,85 @@ class MetricsFetcher(LoggerMixin):
             tasks.append(self._fetch_helius_data(token_address, metrics))
         
         # Execute all tasks
-        await asyncio.gather(*tasks, return_exceptions=True)
+        rpc_ok, *_ = await asyncio.gather(*tasks, return_exceptions=True)
         
+        # Don't let a failed batch serve empty metrics (no holders, supply or liquidity) from cache
+        if rpc_ok is True:
+            self._metrics_cache.set((token_address, pair_address), metrics)
         return metrics
     
-    async def _fetch_token_info(self, token_address: str, metrics: TokenMetrics) -> None:
-        """Fetch basic token information."""
+    async def _fetch_rpc_metrics(
+        self,
+        token_address: str,
+        pair_address: Optional[str],
+        metrics: TokenMetrics,
+    ) -> bool:
+        """
+        Fetch all on-chain metrics in a single RPC batch request.
+        
+        Args:
+            token_address: Token mint address
+            pair_address: Pair/pool address (optional)
+            metrics: Metrics to fill in
+        
+        Returns:
+            True if every call in the batch returned a result
+        """
+        commitment = {"commitment": self.commitment}
+        parsed = {"encoding": "jsonParsed", "commitment": self.commitment}
+        
+        # Mint info and supply may already be cached from an earlier scan of this token
+        account_info = self._token_info_cache.get(token_address)
+        supply_info = self._token_supply_cache.get(token_address)
+        
+        # Holders and signatures change with every trade, so they are always fetched fresh
+        calls = [
+            ("getTokenLargestAccounts", [token_address, commitment]),
+            ("getSignaturesForAddress", [token_address, {"limit": 100, **commitment}]),
+        ]
+        if account_info is None:
+            calls.append(("getAccountInfo", [token_address, parsed]))
+        if supply_info is None:
+            calls.append(("getTokenSupply", [token_address, commitment]))
+        if pair_address:
+            calls.append(("getAccountInfo", [pair_address, parsed]))
+        
+        try:
+            responses = await self.rpc_client.batch_call(calls)
+        except Exception as e:
+            self.logger.error(f"Error fetching on-chain metrics: {e}")
+            return False
+        
+        largest_accounts, signatures, *rest = responses
+        if account_info is None:
+            account_info = rest.pop(0)
+            if "result" in account_info:
+                self._token_info_cache.set(token_address, account_info)
+        if supply_info is None:
+            supply_info = rest.pop(0)
+            if "result" in supply_info:
+                self._token_supply_cache.set(token_address, supply_info)
+        pair_info = rest.pop(0) if pair_address else None
+        
+        # Holder percentages need decimals and supply, so token info goes first
+        self._parse_token_info(account_info, supply_info, metrics)
+        self._parse_holder_metrics(largest_accounts, metrics)
+        self._parse_transaction_metrics(signatures, metrics)
+        self._parse_liquidity_metrics(pair_info, metrics)
+        
+        return all("result" in response for response in responses)
+    
+    def _parse_token_info(
+        self,
+        account_info: Dict,
+        supply_info: Dict,
+        metrics: TokenMetrics,
+    ) -> None:
+        """Fill in basic token information from getAccountInfo and getTokenSupply responses."""
         try:
-            # Get token account info
-            account_info = await self.rpc_client.get_token_account_info(token_address)
-            
             if account_info and "result" in account_info:
-                result = account_info["result"]
-                value = result.get("value", {})
+                result = account_info["result"] or {}
+                value = result.get("value") or {}
                 data = value.get("data", {})
                 
                 if isinstance(data, dict):
@@ -170,11 +331,8 @@ class MetricsFetcher(LoggerMixin):
                     metrics.metadata["mint_authority"] = info.get("mintAuthority")
                     metrics.metadata["freeze_authority"] = info.get("freezeAuthority")
             
-            # Get token supply
-            supply_info = await self.rpc_client.get_token_supply(token_address)
-            
             if supply_info and "result" in supply_info:
-                result = supply_info["result"]
+                result = supply_info["result"] or {}
                 value = result.get("value", {})
                 
                 amount = float(value.get("amount", 0))
@@ -183,13 +341,12 @@ class MetricsFetcher(LoggerMixin):
                 metrics.circulating_supply = metrics.total_supply
         
         except Exception as e:
-            self.logger.error(f"Error fetching token info: {e}")
+            self.logger.error(f"Error parsing token info: {e}")
     
-    async def _fetch_holder_metrics(self, token_address: str, metrics: TokenMetrics) -> None:
-        """Fetch holder distribution metrics."""
+    def _parse_holder_metrics(self, response: Dict, metrics: TokenMetrics) -> None:
+        """Fill in holder distribution metrics from a getTokenLargestAccounts response."""
         try:
-            # Get largest token accounts
-            largest_accounts = await self.rpc_client.get_token_largest_accounts(token_address)
+            largest_accounts = (response.get("result") or {}).get("value", [])
             
             if largest_accounts:
                 metrics.total_holders = len(largest_accounts)
@@ -205,83 +362,85 @@ class MetricsFetcher(LoggerMixin):
                     )
                 
                 # Assume first holder is dev wallet
-                if largest_accounts:
-                    dev_amount = float(largest_accounts[0].get("amount", 0)) / (10 ** metrics.decimals)
-                    if metrics.total_supply > 0:
-                        metrics.dev_wallet_percent = dev_amount / metrics.total_supply * 100
+                dev_amount = float(largest_accounts[0].get("amount", 0)) / (10 ** metrics.decimals)
+                if metrics.total_supply > 0:
+                    metrics.dev_wallet_percent = dev_amount / metrics.total_supply * 100
         
         except Exception as e:
-            self.logger.error(f"Error fetching holder metrics: {e}")
+            self.logger.error(f"Error parsing holder metrics: {e}")
     
-    async def _fetch_transaction_metrics(self, token_address: str, metrics: TokenMetrics) -> None:
-        """Fetch transaction metrics."""
+    def _parse_transaction_metrics(self, response: Dict, metrics: TokenMetrics) -> None:
+        """Fill in transaction metrics from a getSignaturesForAddress response."""
         try:
-            # Get recent signatures
-            signatures = await self.rpc_client.get_signatures_for_address(
-                token_address,
-                limit=100,
-            )
+            signatures = response.get("result") or []
             
             metrics.total_transactions = len(signatures)
             
-            # Analyze transactions from last 24 hours
-            cutoff_24h = datetime.now() - timedelta(hours=24)
-            
-            buy_count = 0
-            sell_count = 0
-            
-            for sig_info in signatures:
-                block_time = sig_info.get("blockTime")
-                if not block_time:
-                    continue
-                
-                tx_time = datetime.fromtimestamp(block_time)
-                if tx_time < cutoff_24h:
-                    continue
-                
-                # Simple heuristic: check if signature contains certain patterns
-                # In production, you'd parse the full transaction
-                metrics.transactions_24h += 1
-                
-                # Placeholder logic - actual implementation needs transaction parsing
-                # For now, assume 50/50 buy/sell ratio
-                if metrics.transactions_24h % 2 == 0:
-                    buy_count += 1
-                else:
-                    sell_count += 1
+            # Analyze transactions from last 24 hours; blockTime is Unix seconds,
+            # so compare it directly rather than building a datetime per signature
+            cutoff_24h = time.time() - 24 * 60 * 60
+            metrics.transactions_24h = sum(
+                1 for sig_info in signatures if (sig_info.get("blockTime") or 0) >= cutoff_24h
+            )
             
-            metrics.buy_transactions_24h = buy_count
-            metrics.sell_transactions_24h = sell_count
+            # Placeholder logic - actual implementation needs transaction parsing
+            # For now, assume 50/50 buy/sell ratio
+            metrics.buy_transactions_24h = metrics.transactions_24h // 2
+            metrics.sell_transactions_24h = metrics.transactions_24h - metrics.buy_transactions_24h
         
         except Exception as e:
-            self.logger.error(f"Error fetching transaction metrics: {e}")
+            self.logger.error(f"Error parsing transaction metrics: {e}")
     
-    async def _fetch_liquidity_metrics(
-        self,
-        token_address: str,
-        pair_address: Optional[str],
-        metrics: TokenMetrics,
-    ) -> None:
-        """Fetch liquidity metrics from pool."""
-        try:
-            if not pair_address:
-                return
+    def _parse_liquidity_metrics(self, pair_info: Optional[Dict], metrics: TokenMetrics) -> None:
+        """Fill in liquidity metrics from the pool's getAccountInfo response."""
+        # This is a simplified implementation
+        # Actual implementation would parse pool reserves
+        if pair_info and "result" in pair_info:
+            # Placeholder: set default liquidity
+            metrics.liquidity_sol = 10.0  # Would parse from pool reserves
             
-            # Get pair account info
-            pair_info = await self.rpc_client.get_token_account_info(pair_address)
+            # Estimate USD value (assuming SOL = $100)
+            sol_price_usd = 100.0
+            metrics.liquidity_usd = metrics.liquidity_sol * sol_price_usd
+    
+    async def _get_json(self, key: Tuple[str, ...], url: str, **kwargs: Any) -> Optional[Any]:
+        """
+        GET a JSON payload from an external API, cached and shared per key.
+        
+        Concurrent requests for the same key share one HTTP request, and
+        successful payloads are reused for external_api_cache_ttl seconds.
+        
+        Args:
+            key: Cache key, e.g. ("solscan", token_address)
+            url: Request URL
+            **kwargs: Extra arguments for session.get (headers, params)
             
-            # This is a simplified implementation
-            # Actual implementation would parse pool reserves
-            if pair_info and "result" in pair_info:
-                # Placeholder: set default liquidity
-                metrics.liquidity_sol = 10.0  # Would parse from pool reserves
-                
-                # Estimate USD value (assuming SOL = $100)
-                sol_price_usd = 100.0
-                metrics.liquidity_usd = metrics.liquidity_sol * sol_price_usd
+        Returns:
+            Decoded JSON, or None if the API didn't answer with 200
+        """
+        payload = self._api_cache.get(key)
+        if payload is not None:
+            return payload
         
-        except Exception as e:
-            self.logger.error(f"Error fetching liquidity metrics: {e}")
+        future = self._api_inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request_json(key, url, **kwargs))
+            self._api_inflight[key] = future
+            future.add_done_callback(lambda _: self._api_inflight.pop(key, None))
+        
+        # Shielded so one cancelled caller doesn't cancel the request for everyone sharing it
+        return await asyncio.shield(future)
+    
+    async def _request_json(self, key: Tuple[str, ...], url: str, **kwargs: Any) -> Optional[Any]:
+        """Make the request for _get_json and cache a successful payload."""
+        async with self.session.get(url, **kwargs) as response:
+            if response.status != 200:
+                return None
+            payload = await response.json()
+        
+        if payload is not None:
+            self._api_cache.set(key, payload)
+        return payload
     
     async def _fetch_solscan_data(self, token_address: str, metrics: TokenMetrics) -> None:
         """Fetch data from Solscan API."""
@@ -292,16 +451,14 @@ class MetricsFetcher(LoggerMixin):
             url = f"https://api.solscan.io/token/meta?token={token_address}"
             headers = {"token": self.config.solscan_api_key}
             
-            async with self.session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    metrics.symbol = data.get("symbol", "")
-                    metrics.name = data.get("name", "")
-                    metrics.total_holders = data.get("holder", 0)
-                    
-                    # Store additional metadata
-                    metrics.metadata["solscan_data"] = data
+            data = await self._get_json(("solscan", token_address), url, headers=headers)
+            if data:
+                metrics.symbol = data.get("symbol", "")
+                metrics.name = data.get("name", "")
+                metrics.total_holders = data.get("holder", 0)
+                
+                # Store additional metadata
+                metrics.metadata["solscan_data"] = data
         
         except Exception as e:
             self.logger.error(f"Error fetching Solscan data: {e}")
@@ -319,21 +476,18 @@ class MetricsFetcher(LoggerMixin):
                 "mint": token_address,
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if isinstance(data, list) and data:
-                        token_data = data[0]
-                        
-                        account = token_data.get("account", {})
-                        metadata = token_data.get("onChainMetadata", {}).get("metadata", {})
-                        
-                        metrics.symbol = metadata.get("symbol", metrics.symbol)
-                        metrics.name = metadata.get("name", metrics.name)
-                        
-                        # Store metadata
-                        metrics.metadata["helius_data"] = token_data
+            data = await self._get_json(("helius", token_address), url, params=params)
+            if isinstance(data, list) and data:
+                token_data = data[0]
+                
+                account = token_data.get("account", {})
+                metadata = token_data.get("onChainMetadata", {}).get("metadata", {})
+                
+                metrics.symbol = metadata.get("symbol", metrics.symbol)
+                metrics.name = metadata.get("name", metrics.name)
+                
+                # Store metadata
+                metrics.metadata["helius_data"] = token_data
         
         except Exception as e:
             self.logger.error(f"Error fetching Helius data: {e}")
@@ -374,11 +528,15 @@ class MetricsFetcher(LoggerMixin):
                 "start_time": (datetime.now() - timedelta(hours=24)).isoformat() + "Z",
             }
             
-            async with self.session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    meta = data.get("meta", {})
-                    social_metrics["twitter_mentions_24h"] = meta.get("result_count", 0)
+            data = await self._get_json(
+                ("twitter", token_address, symbol),
+                url,
+                headers=headers,
+                params=params,
+            )
+            if data:
+                meta = data.get("meta", {})
+                social_metrics["twitter_mentions_24h"] = meta.get("result_count", 0)
             
             # Calculate growth (simplified - would need historical data)
             social_metrics["twitter_mentions_growth"] = social_metrics["twitter_mentions_24h"] / 10.0
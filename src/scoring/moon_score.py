@@ -1,5 +1,7 @@
 """MoonScore calculation engine for ranking token potential."""
 
+import logging
+from bisect import bisect_right
 from typing import Dict, Optional
 from dataclasses import dataclass
 
@@ -8,7 +10,7 @@ from ..utils.metrics import moon_score_distribution
 from .metrics_fetcher import TokenMetrics
 
 
-@dataclass
+@dataclass(slots=True)
 class MoonScoreComponents:
     """Individual components of MoonScore."""
     
@@ -35,7 +37,7 @@ class MoonScoreComponents:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MoonScoreResult:
     """Result of MoonScore calculation."""
     
@@ -87,6 +89,29 @@ class MoonScoreCalculator(LoggerMixin):
         "market_timing": 0.05,
     }
     
+    # WEIGHTS unpacked once, in the summation order used by calculate()
+    _W_BUY, _W_VOL_LIQ, _W_SOCIAL, _W_HOLDERS, _W_DEV, _W_TECH, _W_TIMING = (
+        WEIGHTS["buy_pressure"],
+        WEIGHTS["volume_liquidity"],
+        WEIGHTS["social_momentum"],
+        WEIGHTS["holder_growth"],
+        WEIGHTS["dev_behavior"],
+        WEIGHTS["technical_pattern"],
+        WEIGHTS["market_timing"],
+    )
+    
+    # Rating buckets: RATINGS[i] applies to scores in [THRESHOLDS[i-1], THRESHOLDS[i])
+    RATING_THRESHOLDS = (40, 50, 60, 70, 80, 90)
+    RATINGS = (
+        "🚫 VERY WEAK",
+        "⚠️ WEAK",
+        "📊 MODERATE",
+        "✨ PROMISING",
+        "💎 STRONG",
+        "🚀 VERY STRONG",
+        "🌕 MOON SHOT",
+    )
+    
     def calculate(
         self,
         metrics: TokenMetrics,
@@ -119,13 +144,13 @@ class MoonScoreCalculator(LoggerMixin):
         
         # Calculate weighted score
         base_score = (
-            components.buy_pressure * self.WEIGHTS["buy_pressure"] +
-            components.volume_liquidity_ratio * self.WEIGHTS["volume_liquidity"] +
-            components.social_momentum * self.WEIGHTS["social_momentum"] +
-            components.holder_growth_rate * self.WEIGHTS["holder_growth"] +
-            components.dev_behavior_score * self.WEIGHTS["dev_behavior"] +
-            components.technical_pattern_score * self.WEIGHTS["technical_pattern"] +
-            components.market_timing_score * self.WEIGHTS["market_timing"]
+            components.buy_pressure * self._W_BUY +
+            components.volume_liquidity_ratio * self._W_VOL_LIQ +
+            components.social_momentum * self._W_SOCIAL +
+            components.holder_growth_rate * self._W_HOLDERS +
+            components.dev_behavior_score * self._W_DEV +
+            components.technical_pattern_score * self._W_TECH +
+            components.market_timing_score * self._W_TIMING
         )
         
         # Apply age multiplier
@@ -137,10 +162,13 @@ class MoonScoreCalculator(LoggerMixin):
         # Track metrics
         moon_score_distribution.observe(total_score)
         
-        self.logger.debug(
-            f"MoonScore for {metrics.token_address}: {total_score:.2f} "
-            f"(base: {base_score:.2f}, multiplier: {components.age_multiplier})"
-        )
+        # Skip building the message unless debug logging is on; this runs per token
+        logger = self.logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"MoonScore for {metrics.token_address}: {total_score:.2f} "
+                f"(base: {base_score:.2f}, multiplier: {components.age_multiplier})"
+            )
         
         return MoonScoreResult(
             token_address=metrics.token_address,
@@ -150,6 +178,33 @@ class MoonScoreCalculator(LoggerMixin):
             social_metrics=social_metrics,
         )
     
+    def max_possible_score(self, age_minutes: float) -> float:
+        """
+        Get the highest MoonScore a token of this age could reach.
+        
+        Only age is known before metrics are fetched, so every other input is
+        assumed to be best-case; calculate() never returns more than this.
+        
+        Args:
+            age_minutes: Token age in minutes
+            
+        Returns:
+            Upper bound on the token's MoonScore
+        """
+        best_case = TokenMetrics(
+            token_address="",
+            age_minutes=age_minutes,
+            liquidity_usd=float("inf"),
+        )
+        base_score = (
+            100.0 * (
+                self._W_BUY + self._W_VOL_LIQ + self._W_SOCIAL +
+                self._W_HOLDERS + self._W_DEV + self._W_TECH
+            ) +
+            self._calculate_market_timing(best_case) * self._W_TIMING
+        )
+        return min(100.0, base_score * self._calculate_age_multiplier(age_minutes))
+    
     def _calculate_buy_pressure(self, metrics: TokenMetrics) -> float:
         """
         Calculate buy pressure score (0-100).
@@ -310,17 +365,4 @@ class MoonScoreCalculator(LoggerMixin):
         Returns:
             Rating string
         """
-        if score >= 90:
-            return "🌕 MOON SHOT"
-        elif score >= 80:
-            return "🚀 VERY STRONG"
-        elif score >= 70:
-            return "💎 STRONG"
-        elif score >= 60:
-            return "✨ PROMISING"
-        elif score >= 50:
-            return "📊 MODERATE"
-        elif score >= 40:
-            return "⚠️ WEAK"
-        else:
-            return "🚫 VERY WEAK"
+        return self.RATINGS[bisect_right(self.RATING_THRESHOLDS, score)]
@@ -21,7 +21,7 @@ class ValidationStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationCheck:
     """Individual validation check result."""
     
@@ -40,7 +40,7 @@ class ValidationCheck:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Complete validation result for a token."""
     
@@ -0,0 +1,108 @@
+"""In-memory caching utilities."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a time-to-live.
+    
+    Intended for single event loop use; no locking is performed.
+    """
+    
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned if the key is missing or expired
+        
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (defaults to the cache TTL)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a key from the cache if present."""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class BoundedSet:
+    """
+    Set that keeps only the most recently added items.
+    
+    Once full, adding a new item evicts the oldest one. Useful for
+    de-duplicating an unbounded stream (e.g. transaction signatures)
+    without growing forever.
+    """
+    
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, None]" = OrderedDict()
+    
+    def add(self, item: Hashable) -> None:
+        """Add an item, evicting the oldest item if full."""
+        self._data[item] = None
+        self._data.move_to_end(item)
+        
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def discard(self, item: Hashable) -> None:
+        """Remove an item if present."""
+        self._data.pop(item, None)
+    
+    def clear(self) -> None:
+        """Remove all items."""
+        self._data.clear()
+    
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
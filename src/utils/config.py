@@ -2,7 +2,7 @@
 
 import os
 from typing import List, Optional
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,11 +20,30 @@ class Config(BaseSettings):
     quicknode_rpc_url: str = Field(default="", description="QuickNode RPC endpoint")
     quicknode_wss_url: str = Field(default="", description="QuickNode WSS endpoint")
     helius_rpc_url: str = Field(default="", description="Helius RPC endpoint")
+    helius_wss_url: str = Field(default="", description="Helius WSS endpoint")
     helius_api_key: str = Field(default="", description="Helius API key")
     primary_rpc_provider: str = Field(default="quicknode", description="Primary RPC provider")
     rpc_timeout: int = Field(default=30, description="RPC request timeout in seconds")
+    rpc_commitment: str = Field(
+        default="confirmed", description="Commitment level for RPC reads"
+    )
     rpc_max_retries: int = Field(default=3, description="Maximum number of RPC retries")
     rpc_retry_delay: int = Field(default=2, description="Delay between retries in seconds")
+    rpc_hedge_delay_ms: int = Field(
+        default=150, description="Delay before racing the backup RPC provider against a slow primary"
+    )
+    token_info_cache_ttl: int = Field(
+        default=3600, description="Cache TTL for mint info (decimals, authorities) in seconds"
+    )
+    token_supply_cache_ttl: int = Field(
+        default=60, description="Cache TTL for token supply in seconds"
+    )
+    token_metrics_cache_ttl: int = Field(
+        default=30, description="Cache TTL for a token's fetched metrics in seconds"
+    )
+    external_api_cache_ttl: int = Field(
+        default=300, description="Cache TTL for Solscan/Helius/Twitter responses in seconds"
+    )
 
     # Monitoring Configuration
     max_token_age_minutes: int = Field(
@@ -37,6 +56,14 @@ class Config(BaseSettings):
     enable_websocket: bool = Field(
         default=True, description="Enable websocket subscriptions"
     )
+    helius_enhanced_websocket: bool = Field(
+        default=False,
+        description="Stream full transactions via Helius Enhanced WebSocket transactionSubscribe",
+    )
+    websocket_blockhash_feed: bool = Field(
+        default=False,
+        description="Serve recent blockhashes from a blockSubscribe feed instead of RPC polling",
+    )
 
     # DEX Configuration
     monitored_dexs: str = Field(
@@ -110,6 +137,9 @@ class Config(BaseSettings):
     max_concurrent_requests: int = Field(
         default=10, description="Maximum concurrent requests"
     )
+    max_concurrent_tx_fetches: int = Field(
+        default=16, description="Maximum concurrent transaction fetches from the DEX monitor"
+    )
 
     @field_validator("log_level")
     @classmethod
@@ -131,6 +161,13 @@ class Config(BaseSettings):
             raise ValueError(f"RPC provider must be one of {valid_providers}")
         return v_lower
 
+    @model_validator(mode="after")
+    def validate_enhanced_websocket(self) -> "Config":
+        """Validate that the Helius Enhanced WebSocket has a Helius endpoint."""
+        if self.enable_websocket and self.helius_enhanced_websocket and not self.helius_wss_url:
+            raise ValueError("HELIUS_ENHANCED_WEBSOCKET requires HELIUS_WSS_URL to be set")
+        return self
+
     def get_monitored_dexs(self) -> List[str]:
         """Get list of monitored DEXs."""
         return [dex.strip().lower() for dex in self.monitored_dexs.split(",")]
@@ -143,9 +180,12 @@ class Config(BaseSettings):
 
     def get_wss_url(self) -> Optional[str]:
         """Get websocket URL if available."""
+        # transactionSubscribe is Helius-only, whichever provider serves RPC
+        if self.helius_enhanced_websocket:
+            return self.helius_wss_url or None
         if self.primary_rpc_provider == "quicknode":
             return self.quicknode_wss_url
-        return None
+        return self.helius_wss_url or None
 
 
 # Global config instance
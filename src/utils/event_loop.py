@@ -0,0 +1,25 @@
+"""Event loop configuration."""
+
+import asyncio
+from types import ModuleType
+from typing import Optional
+
+uvloop: Optional[ModuleType]
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop's event loop for subsequent asyncio.run() calls if available.
+    
+    Returns:
+        True if uvloop was installed
+    """
+    if uvloop is None:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
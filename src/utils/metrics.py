@@ -40,6 +40,11 @@ validation_checks = Counter(
     ["check_type", "result"]
 )
 
+tokens_prescreened_out = Counter(
+    "moon_scanner_tokens_prescreened_out_total",
+    "Total number of new pairs skipped before fetching metrics"
+)
+
 errors = Counter(
     "moon_scanner_errors_total",
     "Total number of errors encountered",
@@ -0,0 +1,47 @@
+"""Fast JSON encoding and decoding backed by orjson."""
+
+from typing import Any
+
+import orjson
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Suitable as aiohttp's ``json_serialize`` hook, which expects ``str``.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(obj).decode()
+
+
+def json_dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+    
+    Args:
+        obj: Object to serialize
+        sort_keys: Emit object keys in sorted order (canonical form for signing)
+        
+    Returns:
+        JSON bytes
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+
+
+def json_loads(data: Any) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+    
+    Args:
+        data: JSON document
+        
+    Returns:
+        Decoded object
+    """
+    return orjson.loads(data)
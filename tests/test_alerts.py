@@ -0,0 +1,96 @@
+"""Tests for alert delivery."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.alerts.discord_bot import DiscordAlerter
+from src.alerts.webhook_sender import WebhookSender
+
+
+@pytest.fixture
+async def discord_alerter():
+    """Create an enabled DiscordAlerter that formats every alert as an empty embed."""
+    alerter = DiscordAlerter()
+    alerter.config = alerter.config.model_copy(
+        update={"discord_enabled": True, "discord_webhook_url": "https://discord.example/hook"}
+    )
+    alerter._format_webhook_payload = MagicMock(return_value={"embeds": [{}]})
+    yield alerter
+    await alerter.close()
+
+
+@pytest.fixture
+async def webhook_sender():
+    """Create an enabled WebhookSender."""
+    sender = WebhookSender()
+    sender.config = sender.config.model_copy(
+        update={"webhook_enabled": True, "webhook_url": "https://hooks.example/alerts"}
+    )
+    yield sender
+    await sender.close()
+
+
+def _send(alerter, token_address: str):
+    return alerter.send_alert(MagicMock(token_address=token_address), MagicMock(), "raydium")
+
+
+class TestDiscordBatching:
+    """Test the Discord alert batch flusher."""
+    
+    @pytest.mark.asyncio
+    async def test_close_mid_post_resolves_alerts(self, discord_alerter):
+        """Test that closing while a batch is posting fails its alerts instead of hanging."""
+        posting = asyncio.Event()
+        
+        async def post_embeds(embeds):
+            posting.set()
+            await asyncio.sleep(60)
+            return True
+        
+        discord_alerter._post_embeds = post_embeds
+        sends = [asyncio.create_task(_send(discord_alerter, f"token{i}")) for i in range(3)]
+        await asyncio.wait_for(posting.wait(), timeout=2)
+        
+        await discord_alerter.close()
+        
+        assert await asyncio.wait_for(asyncio.gather(*sends), timeout=1) == [False] * 3
+    
+    @pytest.mark.asyncio
+    async def test_alerts_share_one_post(self, discord_alerter):
+        """Test that alerts sent together are posted as one message."""
+        posts = []
+        
+        async def post_embeds(embeds):
+            posts.append(len(embeds))
+            return True
+        
+        discord_alerter._post_embeds = post_embeds
+        
+        results = await asyncio.gather(*(_send(discord_alerter, f"token{i}") for i in range(3)))
+        
+        assert results == [True] * 3
+        assert posts == [3]
+
+
+class TestWebhookBatching:
+    """Test the webhook alert burst flusher."""
+    
+    @pytest.mark.asyncio
+    async def test_close_mid_delivery_resolves_alerts(self, webhook_sender):
+        """Test that closing while a burst is delivering fails its alerts instead of hanging."""
+        delivering = asyncio.Event()
+        
+        async def deliver_batch(alerts):
+            delivering.set()
+            await asyncio.sleep(60)
+            return [True] * len(alerts)
+        
+        webhook_sender._deliver_batch = deliver_batch
+        sends = [asyncio.create_task(_send(webhook_sender, f"token{i}")) for i in range(3)]
+        await asyncio.wait_for(delivering.wait(), timeout=2)
+        
+        await webhook_sender.close()
+        
+        assert await asyncio.wait_for(asyncio.gather(*sends), timeout=1) == [False] * 3
@@ -0,0 +1,85 @@
+"""Tests for the in-memory caches."""
+
+from unittest.mock import patch
+
+from src.utils.cache import BoundedSet, TTLCache
+
+
+class TestTTLCache:
+    """Test TTL cache behavior."""
+    
+    def test_get_and_set(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache(ttl=60)
+        cache.set("mint", {"decimals": 9})
+        
+        assert cache.get("mint") == {"decimals": 9}
+        assert "mint" in cache
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+    
+    def test_entries_expire(self):
+        """Test that entries are dropped after their TTL."""
+        cache = TTLCache(ttl=10)
+        
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("mint", 1)
+            cache.set("short", 2, ttl=1)
+        
+        with patch("src.utils.cache.time.monotonic", return_value=105.0):
+            assert cache.get("mint") == 1
+            assert cache.get("short") is None
+        
+        with patch("src.utils.cache.time.monotonic", return_value=111.0):
+            assert cache.get("mint") is None
+            assert len(cache) == 0
+    
+    def test_least_recently_used_evicted(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        # Touch "a" so "b" becomes the eviction candidate
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+    
+    def test_invalidate(self):
+        """Test removing a single entry."""
+        cache = TTLCache()
+        cache.set("mint", 1)
+        cache.invalidate("mint")
+        cache.invalidate("missing")
+        
+        assert "mint" not in cache
+
+
+class TestBoundedSet:
+    """Test bounded set behavior."""
+    
+    def test_membership(self):
+        """Test adding and checking items."""
+        seen = BoundedSet(maxsize=10)
+        seen.add("sig1")
+        seen.add("sig1")
+        
+        assert "sig1" in seen
+        assert "sig2" not in seen
+        assert len(seen) == 1
+    
+    def test_oldest_items_evicted(self):
+        """Test that the oldest items are dropped once full."""
+        seen = BoundedSet(maxsize=2)
+        seen.add("a")
+        seen.add("b")
+        seen.add("a")  # Re-adding refreshes "a"
+        seen.add("c")
+        
+        assert "b" not in seen
+        assert "a" in seen
+        assert "c" in seen
+        assert len(seen) == 2
@@ -0,0 +1,362 @@
+"""Tests for the DEX monitor."""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.dex_monitor import DEX_PROGRAM_IDS, DEXMonitor, TokenPair
+from src.core.rpc_client import RPCClient
+
+from .test_rpc_client import BatchRejectingSession
+
+
+RAYDIUM_V4 = DEX_PROGRAM_IDS["raydium"]
+TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+ATA_PROGRAM = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+
+# Logs of a Raydium AMM v4 swap that first creates the user's token account
+RAYDIUM_V4_SWAP_LOGS = [
+    "Program ComputeBudget111111111111111111111111111111 invoke [1]",
+    "Program ComputeBudget111111111111111111111111111111 success",
+    f"Program {ATA_PROGRAM} invoke [1]",
+    "Program log: Create",
+    f"Program {TOKEN_PROGRAM} invoke [2]",
+    "Program log: Instruction: GetAccountDataSize",
+    f"Program {TOKEN_PROGRAM} consumed 1569 of 394554 compute units",
+    f"Program return: {TOKEN_PROGRAM} pQAAAAAAAAA=",
+    f"Program {TOKEN_PROGRAM} success",
+    "Program 11111111111111111111111111111111 invoke [2]",
+    "Program 11111111111111111111111111111111 success",
+    "Program log: Initialize the associated token account",
+    f"Program {TOKEN_PROGRAM} invoke [2]",
+    "Program log: Instruction: InitializeImmutableOwner",
+    f"Program {TOKEN_PROGRAM} consumed 1405 of 387967 compute units",
+    f"Program {TOKEN_PROGRAM} success",
+    f"Program {TOKEN_PROGRAM} invoke [2]",
+    "Program log: Instruction: InitializeAccount3",
+    f"Program {TOKEN_PROGRAM} consumed 4188 of 384083 compute units",
+    f"Program {TOKEN_PROGRAM} success",
+    f"Program {ATA_PROGRAM} consumed 20345 of 399850 compute units",
+    f"Program {ATA_PROGRAM} success",
+    f"Program {RAYDIUM_V4} invoke [1]",
+    "Program log: ray_log: A0BCDwAAAAAAAAAAAAAAAAACAAAAAAAAAEBCDwAAAAAAAAAAAAAAAAA=",
+    f"Program {TOKEN_PROGRAM} invoke [2]",
+    "Program log: Instruction: Transfer",
+    f"Program {TOKEN_PROGRAM} consumed 4736 of 360502 compute units",
+    f"Program {TOKEN_PROGRAM} success",
+    f"Program {TOKEN_PROGRAM} invoke [2]",
+    "Program log: Instruction: Transfer",
+    f"Program {TOKEN_PROGRAM} consumed 4645 of 352876 compute units",
+    f"Program {TOKEN_PROGRAM} success",
+    f"Program {RAYDIUM_V4} consumed 31594 of 379505 compute units",
+    f"Program {RAYDIUM_V4} success",
+]
+
+# Logs of a Raydium AMM v4 initialize2 (pool creation)
+RAYDIUM_V4_INITIALIZE2_LOGS = [
+    f"Program {RAYDIUM_V4} invoke [1]",
+    "Program log: initialize2: InitializeInstruction2 { nonce: 254, open_time: 1718000000, "
+    "init_pc_amount: 79000000000, init_coin_amount: 206900000000000 }",
+    f"Program {TOKEN_PROGRAM} invoke [2]",
+    "Program log: Instruction: InitializeMint",
+    f"Program {TOKEN_PROGRAM} success",
+    f"Program {RAYDIUM_V4} consumed 153741 of 400000 compute units",
+    f"Program {RAYDIUM_V4} success",
+]
+
+
+class TestLogPrefilter:
+    """Test the pool creation pre-filter on logs notifications."""
+    
+    def test_swap_rejected(self):
+        """Test that token program logs inside a swap don't count as pool creation."""
+        assert not DEXMonitor._logs_mention_pool_creation(RAYDIUM_V4_SWAP_LOGS, RAYDIUM_V4)
+    
+    def test_initialize2_accepted(self):
+        """Test that a Raydium v4 initialize2 passes the filter."""
+        assert DEXMonitor._logs_mention_pool_creation(RAYDIUM_V4_INITIALIZE2_LOGS, RAYDIUM_V4)
+    
+    def test_marker_outside_program_frame_rejected(self):
+        """Test that a matching line logged by another program is ignored."""
+        logs = [
+            f"Program {TOKEN_PROGRAM} invoke [1]",
+            "Program log: initialize2: spoofed",
+            f"Program {TOKEN_PROGRAM} success",
+            f"Program {RAYDIUM_V4} invoke [1]",
+            f"Program {RAYDIUM_V4} success",
+        ]
+        
+        assert not DEXMonitor._logs_mention_pool_creation(logs, RAYDIUM_V4)
+    
+    def test_clmm_and_whirlpool_markers(self):
+        """Test the Anchor instruction log markers of CLMM and Whirlpool."""
+        clmm = DEX_PROGRAM_IDS["raydium_v3"]
+        whirlpool = DEX_PROGRAM_IDS["orca"]
+        
+        assert DEXMonitor._logs_mention_pool_creation(
+            [f"Program {clmm} invoke [1]", "Program log: Instruction: CreatePool"],
+            clmm,
+        )
+        assert DEXMonitor._logs_mention_pool_creation(
+            [f"Program {whirlpool} invoke [1]", "Program log: Instruction: InitializePoolV2"],
+            whirlpool,
+        )
+        assert not DEXMonitor._logs_mention_pool_creation(
+            [f"Program {whirlpool} invoke [1]", "Program log: Instruction: Swap"],
+            whirlpool,
+        )
+
+
+@pytest.fixture
+def monitor():
+    """Create a DEXMonitor with a mocked RPC client."""
+    rpc_client = MagicMock()
+    rpc_client.get_transaction = AsyncMock()
+    return DEXMonitor(rpc_client)
+
+
+def _log_event(signature: str, logs: list) -> dict:
+    return {"value": {"signature": signature, "err": None, "logs": logs}}
+
+
+class TestPollingCoverage:
+    """Test when WebSocket events let polling stand down."""
+    
+    @pytest.mark.asyncio
+    async def test_processed_event_pauses_polling(self, monitor):
+        """Test that a fetched and parsed event counts as coverage."""
+        monitor.rpc_client.get_transaction.return_value = {"result": {"meta": {"err": None}}}
+        
+        await monitor._handle_log_event(
+            _log_event("sig1", RAYDIUM_V4_INITIALIZE2_LOGS),
+            program_id=RAYDIUM_V4,
+        )
+        
+        assert monitor._websocket_covering()
+    
+    @pytest.mark.asyncio
+    async def test_failed_fetch_resumes_polling(self, monitor):
+        """Test that a failed getTransaction leaves the signature to polling."""
+        monitor.rpc_client.get_transaction.side_effect = ConnectionError("timeout")
+        
+        await monitor._handle_log_event(
+            _log_event("sig1", RAYDIUM_V4_INITIALIZE2_LOGS),
+            program_id=RAYDIUM_V4,
+        )
+        
+        assert "sig1" not in monitor.seen_signatures
+        assert not monitor._websocket_covering()
+    
+    @pytest.mark.asyncio
+    async def test_dropped_events_resume_polling(self, monitor):
+        """Test that events shed by the dispatch queue make the next poll run."""
+        await monitor._handle_log_event(
+            _log_event("sig1", RAYDIUM_V4_SWAP_LOGS),
+            program_id=RAYDIUM_V4,
+        )
+        assert monitor._websocket_covering()
+        
+        monitor.ws_manager.dropped_events += 1
+        
+        assert not monitor._websocket_covering()
+        assert monitor._websocket_covering()
+
+
+def _pair(token_address: str, created_at: Optional[datetime] = None) -> TokenPair:
+    return TokenPair(
+        token_address=token_address,
+        pair_address=f"{token_address}-pool",
+        dex="raydium",
+        base_token=token_address,
+        quote_token="So11111111111111111111111111111111111111112",
+        created_at=created_at or datetime.now(),
+        signature=f"{token_address}-sig",
+    )
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    while not condition():
+        await asyncio.sleep(0)
+
+
+class TestCallbackWorkers:
+    """Test handing discovered pairs to the registered callbacks."""
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self, monitor):
+        """Test that a full callback queue sheds its oldest pair, not the new one."""
+        monitor._callback_queue = asyncio.Queue(maxsize=2)
+        
+        for token_address in ("a", "b", "c"):
+            await monitor._handle_new_pair(_pair(token_address))
+        
+        queued = [monitor._callback_queue.get_nowait().token_address for _ in range(2)]
+        assert queued == ["b", "c"]
+        assert set(monitor.discovered_pairs) == {"a", "b", "c"}
+    
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_stop_worker(self, monitor):
+        """Test that one callback raising neither skips the others nor kills the worker."""
+        seen = []
+        
+        async def failing(pair):
+            raise RuntimeError("boom")
+        
+        async def recording(pair):
+            seen.append(pair.token_address)
+        
+        monitor.callbacks = [failing, recording]
+        worker = asyncio.create_task(monitor._callback_worker())
+        
+        with patch.object(monitor.logger, "error") as log_error:
+            await monitor._handle_new_pair(_pair("a"))
+            await monitor._handle_new_pair(_pair("b"))
+            await asyncio.wait_for(_until(lambda: log_error.call_count == 2), timeout=1)
+        
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        assert seen == ["a", "b"]
+        assert log_error.call_count == 2
+
+
+def _polled_chain(method: str, params: list):
+    """Answer polling calls: one new signature per program, and its transaction."""
+    if method == "getSignaturesForAddress":
+        return [{"signature": f"{params[0]}-sig", "err": None}]
+    return {"slot": 1, "transaction": {"signatures": [params[0]]}}
+
+
+class TestPolling:
+    """Test the polling fallback."""
+    
+    @pytest.mark.asyncio
+    async def test_until_cursor(self, monitor):
+        """Test that each poll only asks for signatures newer than the last one seen."""
+        program_ids = monitor._get_program_ids()
+        first, second = program_ids[:2]
+        polls = [
+            {first: [{"signature": "first-2"}, {"signature": "first-1"}]},
+            {second: [{"signature": "second-1"}]},
+            {},
+        ]
+        cursors = []
+        
+        async def get_signatures_for_addresses(addresses, limit, until):
+            cursors.append(dict(until))
+            new_signatures = polls[len(cursors) - 1]
+            return [new_signatures.get(address, []) for address in addresses]
+        
+        monitor.rpc_client.get_signatures_for_addresses = get_signatures_for_addresses
+        monitor.rpc_client.get_transactions_batch = AsyncMock(
+            side_effect=lambda signatures: [{} for _ in signatures]
+        )
+        
+        for _ in polls:
+            await monitor._scan_dexs()
+        
+        assert cursors == [
+            {},
+            {first: "first-2"},
+            {first: "first-2", second: "second-1"},
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_endpoint_without_batches(self):
+        """Test that polling finds transactions on an endpoint that rejects batch requests."""
+        rpc_client = RPCClient()
+        rpc_client._initialized = True
+        rpc_client.session = BatchRejectingSession(_polled_chain)
+        monitor = DEXMonitor(rpc_client)
+        monitor._parse_transaction = MagicMock(return_value=None)
+        program_ids = monitor._get_program_ids()
+        
+        await monitor._scan_dexs()
+        
+        assert monitor._last_signatures == {
+            program_id: f"{program_id}-sig" for program_id in program_ids
+        }
+        parsed = {
+            (tx["transaction"]["signatures"][0], program_id, signature)
+            for tx, program_id, signature in (
+                call.args for call in monitor._parse_transaction.call_args_list
+            )
+        }
+        assert parsed == {
+            (f"{program_id}-sig", program_id, f"{program_id}-sig") for program_id in program_ids
+        }
+
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() is fixed at NOW."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+class TestActivePairIndex:
+    """Test the age index behind active-pair lookups and cleanup."""
+    
+    @pytest.fixture(autouse=True)
+    def frozen_now(self):
+        """Freeze the monitor's clock at NOW."""
+        with patch("src.core.dex_monitor.datetime", FrozenDatetime):
+            yield
+    
+    async def _discover(self, monitor, ages_minutes: dict) -> None:
+        for token_address, age in ages_minutes.items():
+            await monitor._handle_new_pair(_pair(token_address, NOW - timedelta(minutes=age)))
+    
+    @pytest.mark.asyncio
+    async def test_out_of_order_discovery(self, monitor):
+        """Test that pairs discovered out of block-time order are indexed oldest first."""
+        await self._discover(monitor, {"b": 10, "a": 20, "d": 1, "c": 5})
+        
+        assert [token for _, token in monitor._pairs_by_age] == ["a", "b", "c", "d"]
+        assert [pair.token_address for pair in monitor.get_active_pairs()] == ["a", "b", "c", "d"]
+    
+    @pytest.mark.asyncio
+    async def test_max_age_boundary(self, monitor):
+        """Test that a pair exactly max_token_age_minutes old is still active."""
+        max_age = monitor.config.max_token_age_minutes
+        await self._discover(monitor, {
+            "fresh": 1,
+            "at_limit": max_age,
+            "past_limit": max_age + 1 / 60,
+        })
+        
+        active = [pair.token_address for pair in monitor.get_active_pairs()]
+        assert active == ["at_limit", "fresh"]
+        assert monitor.count_active_pairs() == 2
+        assert all(pair.is_eligible(max_age, NOW) for pair in monitor.get_active_pairs())
+        assert not monitor.discovered_pairs["past_limit"].is_eligible(max_age, NOW)
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_expired_prefix(self, monitor):
+        """Test that cleanup drops exactly the pairs past twice the max age from both structures."""
+        max_age = monitor.config.max_token_age_minutes
+        await self._discover(monitor, {
+            "kept_new": 1,
+            "expired_old": max_age * 2 + 30,
+            "kept_at_limit": max_age * 2,
+            "expired_just": max_age * 2 + 1 / 60,
+            "kept_old": max_age + 5,
+        })
+        
+        async def run_once(delay):
+            monitor.running = False
+        
+        monitor.running = True
+        with patch("src.core.dex_monitor.asyncio", MagicMock(sleep=run_once)):
+            await monitor._cleanup_old_pairs()
+        
+        kept = ["kept_at_limit", "kept_old", "kept_new"]
+        assert [token for _, token in monitor._pairs_by_age] == kept
+        assert set(monitor.discovered_pairs) == set(kept)
+        assert monitor.count_active_pairs() == 1
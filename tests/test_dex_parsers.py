@@ -0,0 +1,189 @@
+"""Tests for DEX pool creation instruction parsers."""
+
+import time
+from unittest.mock import MagicMock
+
+from src.core.dex_monitor import DEX_PROGRAM_IDS, DEXMonitor
+from src.core.dex_parsers import (
+    ORCA_WHIRLPOOL_INITIALIZE_POOL,
+    RAYDIUM_CLMM_CREATE_POOL,
+    WRAPPED_SOL_MINT,
+    b58decode,
+    parse_orca_whirlpool,
+    parse_raydium_clmm,
+    parse_raydium_v4,
+)
+
+
+# Base58 instruction data as returned for unparsed instructions
+RAYDIUM_V4_INITIALIZE2_DATA = "4YR6bRMSBHHz4u3DVci2qYZRm6LxFibKzsR"
+RAYDIUM_V4_SWAP_BASE_IN_DATA = "5uc7oSXmeRfemKnj9dBETPu"
+RAYDIUM_CLMM_CREATE_POOL_DATA = "Gimqm3fgf3MxvXUZf5BFZX3UH8WVNTErhFGn3gyxzTnF"
+ORCA_WHIRLPOOL_INITIALIZE_POOL_DATA = "DwDWomq1KHPpVxv6vniX5r84vTXfpeCCeUDCj"
+ORCA_WHIRLPOOL_INITIALIZE_POOL_V2_DATA = "7Lx7n3gh5uBEck2AFw1mVgqMUH2uF569A4Vu"
+
+# Accounts of a Raydium AMM v4 initialize2 instruction
+RAYDIUM_V4_INITIALIZE2_ACCOUNTS = [
+    "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+    "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL",
+    "11111111111111111111111111111111",
+    "SysvarRent111111111111111111111111111111111",
+    "7YkWuKJbWrDvVUV3Fi2ybrpWMbJuJcXrrbMNxU5Gp8Xu",  # amm
+    "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1",  # amm authority
+    "3pUFhN5uFMCDRyHy4ARcH3JwS2ShnNbT6U45nHWuNvgH",  # open orders
+    "CPD1kFqQKhBzZZznYm4HT5c6QrnZC8yRdEEBWbpGDy9T",  # lp mint
+    "Fu9xHGAzLyp7PLeoTqGmBfrPtZLRfPEqQULf7RCzpump",  # coin mint
+    WRAPPED_SOL_MINT,  # pc mint
+    "9hg7XRHFwfPMAmzb1nYGv5Ww58ZfqSB7yxwZT9xkcRyb",  # coin vault
+    "GXhPBrJFfUfWAm1HSjkfcYcXMDA3zEWGzcYHtj4ffRBq",  # pc vault
+    "J2qL6AUXSTwUL2LS8LUTfC3CipPs3HUDAvktqnUrDZQH",  # target orders
+    "9DCxsMizn3H1hprZ7xWe6LDzeUeZBksYFpBWBtSf1PQX",  # amm config
+    "7YttLkHDoNj9wyDur5pM1ejNaAvT9X4eqaYcHQqtj2G5",  # fee destination
+    "srmqPvymJeFKQ4zGQed1GFppgkRHL9kaELCbyksJtPX",  # market program
+    "8BnEgHoWFysVcuFFX7QztDmzuH8r5ZFvyP3sYwn1XTh6",  # market
+    "CvkrQSoF2Cd8Gs6yAN8NdUkGy5EA8ZM9V7UkvBL9VGfN",  # user wallet
+    "4NJVUJ8uqLFtZrRuYxFs8iWMwu8vBtE4pgcS3xyZ6Qpn",  # user coin account
+    "Ba4r9PEUn1EMv9rrWS7VJRf3Kw2EtNCWEkN7mKjcRpzT",  # user pc account
+    "Hs1X5YtXwZACueUtS9azZyXFDWVxAMLvm3tttubpK7ph",  # user lp account
+]
+
+
+def _accounts(count: int) -> list:
+    return [f"account{i}" for i in range(count)]
+
+
+def _instruction(data: str, count: int) -> dict:
+    return {"accounts": _accounts(count), "data": data}
+
+
+def _transaction(instruction: dict) -> dict:
+    """Build a getTransaction result (jsonParsed encoding) around one instruction."""
+    return {
+        "blockTime": int(time.time()),
+        "meta": {"err": None},
+        "transaction": {
+            "message": {
+                "accountKeys": [
+                    {"pubkey": pubkey, "signer": index == 17, "writable": True}
+                    for index, pubkey in enumerate(RAYDIUM_V4_INITIALIZE2_ACCOUNTS)
+                ],
+                "instructions": [instruction],
+            },
+        },
+    }
+
+
+class TestPoolParsers:
+    """Test layout-specific pool account extraction."""
+    
+    def test_raydium_v4(self):
+        """Test reading pool and mints from Raydium AMM v4 positions."""
+        accounts = _accounts(21)
+        accounts[9] = WRAPPED_SOL_MINT
+        instruction = {"accounts": accounts, "data": RAYDIUM_V4_INITIALIZE2_DATA}
+        
+        assert parse_raydium_v4(instruction) == (
+            "account4",
+            "account8",
+            WRAPPED_SOL_MINT,
+        )
+    
+    def test_wrapped_sol_is_quote(self):
+        """Test that wrapped SOL is reported as the quote mint."""
+        accounts = _accounts(21)
+        accounts[8] = WRAPPED_SOL_MINT
+        instruction = {"accounts": accounts, "data": RAYDIUM_V4_INITIALIZE2_DATA}
+        
+        assert parse_raydium_v4(instruction) == (
+            "account4",
+            "account9",
+            WRAPPED_SOL_MINT,
+        )
+    
+    def test_raydium_clmm(self):
+        """Test reading pool and mints from Raydium CLMM positions."""
+        instruction = _instruction(RAYDIUM_CLMM_CREATE_POOL_DATA, 13)
+        
+        assert parse_raydium_clmm(instruction) == (
+            "account2",
+            "account3",
+            "account4",
+        )
+    
+    def test_orca_whirlpool(self):
+        """Test reading pool and mints from Orca Whirlpool positions."""
+        instruction = _instruction(ORCA_WHIRLPOOL_INITIALIZE_POOL_DATA, 11)
+        
+        assert parse_orca_whirlpool(instruction) == (
+            "account4",
+            "account1",
+            "account2",
+        )
+    
+    def test_orca_whirlpool_v2(self):
+        """Test reading the pool from its initialize_pool_v2 position."""
+        instruction = _instruction(ORCA_WHIRLPOOL_INITIALIZE_POOL_V2_DATA, 14)
+        
+        assert parse_orca_whirlpool(instruction) == (
+            "account6",
+            "account1",
+            "account2",
+        )
+    
+    def test_discriminators(self):
+        """Test that fixture data starts with each instruction's discriminator."""
+        assert b58decode(RAYDIUM_V4_INITIALIZE2_DATA)[0] == 1
+        assert b58decode(RAYDIUM_CLMM_CREATE_POOL_DATA).startswith(RAYDIUM_CLMM_CREATE_POOL)
+        assert b58decode(ORCA_WHIRLPOOL_INITIALIZE_POOL_DATA).startswith(
+            ORCA_WHIRLPOOL_INITIALIZE_POOL
+        )
+        assert b58decode("11") == b"\x00\x00"
+    
+    def test_short_or_missing_accounts(self):
+        """Test that instructions not matching the layout are rejected."""
+        assert parse_raydium_v4(_instruction(RAYDIUM_V4_INITIALIZE2_DATA, 9)) is None
+        assert parse_raydium_clmm({}) is None
+        assert parse_orca_whirlpool(_instruction(ORCA_WHIRLPOOL_INITIALIZE_POOL_DATA, 0)) is None
+    
+    def test_other_instructions_rejected(self):
+        """Test that non-creation instructions with enough accounts are rejected."""
+        assert parse_raydium_v4(_instruction(RAYDIUM_V4_SWAP_BASE_IN_DATA, 21)) is None
+        assert parse_raydium_clmm(_instruction(ORCA_WHIRLPOOL_INITIALIZE_POOL_DATA, 13)) is None
+        assert parse_orca_whirlpool(_instruction(RAYDIUM_CLMM_CREATE_POOL_DATA, 11)) is None
+        assert parse_raydium_v4(_instruction("0OIl", 21)) is None
+
+
+class TestParseTransaction:
+    """Test pool creation parsing through the DEX monitor."""
+    
+    def test_unparsed_raydium_initialize2(self):
+        """Test that an unparsed initialize2 instruction is read by its layout."""
+        monitor = DEXMonitor(MagicMock())
+        program_id = DEX_PROGRAM_IDS["raydium"]
+        tx = _transaction({
+            "accounts": RAYDIUM_V4_INITIALIZE2_ACCOUNTS,
+            "data": RAYDIUM_V4_INITIALIZE2_DATA,
+            "programId": program_id,
+            "stackHeight": None,
+        })
+        
+        pair = monitor._parse_transaction(tx, program_id, "sig")
+        
+        assert pair is not None
+        assert pair.dex == "raydium"
+        assert pair.pair_address == RAYDIUM_V4_INITIALIZE2_ACCOUNTS[4]
+        assert pair.token_address == RAYDIUM_V4_INITIALIZE2_ACCOUNTS[8]
+        assert pair.quote_token == WRAPPED_SOL_MINT
+    
+    def test_unparsed_raydium_swap_ignored(self):
+        """Test that a swap with as many accounts isn't taken for a pool creation."""
+        monitor = DEXMonitor(MagicMock())
+        program_id = DEX_PROGRAM_IDS["raydium"]
+        tx = _transaction({
+            "accounts": RAYDIUM_V4_INITIALIZE2_ACCOUNTS,
+            "data": RAYDIUM_V4_SWAP_BASE_IN_DATA,
+            "programId": program_id,
+            "stackHeight": None,
+        })
+        
+        assert monitor._parse_transaction(tx, program_id, "sig") is None
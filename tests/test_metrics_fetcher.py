@@ -0,0 +1,99 @@
+"""Tests for the token metrics fetcher."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.scoring.metrics_fetcher import MetricsFetcher
+
+
+TOKEN = "Fu9xHGAzLyp7PLeoTqGmBfrPtZLRfPEqQULf7RCzpump"
+
+# getTokenLargestAccounts, getSignaturesForAddress, getAccountInfo, getTokenSupply
+BATCH_RESPONSES = [
+    {"result": {"value": [{"amount": "500000000"}, {"amount": "250000000"}]}},
+    {"result": []},
+    {"result": {"value": {"data": {"parsed": {"info": {"decimals": 6, "mintAuthority": None}}}}}},
+    {"result": {"value": {"amount": "1000000000", "decimals": 6}}},
+]
+
+
+@pytest.fixture
+async def fetcher():
+    """Create a MetricsFetcher with a mocked RPC client and no external APIs."""
+    rpc_client = MagicMock()
+    rpc_client.batch_call = AsyncMock()
+    fetcher = MetricsFetcher(rpc_client)
+    fetcher.config = fetcher.config.model_copy(
+        update={"solscan_api_enabled": False, "helius_api_key": ""}
+    )
+    yield fetcher
+    await fetcher.close()
+
+
+class TestMetricsCache:
+    """Test reuse of fetched metrics."""
+    
+    @pytest.mark.asyncio
+    async def test_successful_fetch_cached(self, fetcher):
+        """Test that metrics from a successful batch are reused."""
+        fetcher.rpc_client.batch_call.return_value = BATCH_RESPONSES
+        
+        first = await fetcher.fetch_metrics(TOKEN)
+        second = await fetcher.fetch_metrics(TOKEN)
+        
+        assert first.total_holders == second.total_holders == 2
+        assert fetcher.rpc_client.batch_call.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_not_cached(self, fetcher):
+        """Test that empty metrics from a failed batch are not served from cache."""
+        fetcher.rpc_client.batch_call.side_effect = [
+            ConnectionError("RPC down"),
+            [{}, {}, {}, {}],
+            BATCH_RESPONSES,
+        ]
+        
+        assert (await fetcher.fetch_metrics(TOKEN)).total_holders == 0
+        assert (await fetcher.fetch_metrics(TOKEN)).total_holders == 0
+        assert (await fetcher.fetch_metrics(TOKEN)).total_holders == 2
+    
+    @pytest.mark.asyncio
+    async def test_callers_get_own_metadata(self, fetcher):
+        """Test that changing one caller's metadata doesn't leak into the cache."""
+        fetcher.rpc_client.batch_call.return_value = BATCH_RESPONSES
+        
+        first = await fetcher.fetch_metrics(TOKEN)
+        first.metadata["note"] = "mine"
+        second = await fetcher.fetch_metrics(TOKEN)
+        
+        assert "note" not in second.metadata
+        assert "mint_authority" in second.metadata
+
+
+class TestSingleFlight:
+    """Test sharing of concurrent fetches for the same token."""
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_waiters(self, fetcher):
+        """Test that cancelling one caller leaves the shared fetch running for the others."""
+        release = asyncio.Event()
+        
+        async def batch_call(calls):
+            await release.wait()
+            return BATCH_RESPONSES
+        
+        fetcher.rpc_client.batch_call.side_effect = batch_call
+        first = asyncio.create_task(fetcher.fetch_metrics(TOKEN))
+        second = asyncio.create_task(fetcher.fetch_metrics(TOKEN))
+        await asyncio.sleep(0)
+        
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        
+        assert (await second).total_holders == 2
+        assert first.cancelled()
+        assert fetcher.rpc_client.batch_call.await_count == 1
+        assert not fetcher._inflight
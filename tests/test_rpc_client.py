@@ -0,0 +1,392 @@
+"""Tests for the RPC client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from src.core.rpc_client import RPCClient
+from src.utils.serialization import json_dumps_bytes
+
+
+@pytest.fixture
+def rpc_client():
+    """Create an uninitialized RPCClient with a short hedge delay and no retry backoff."""
+    client = RPCClient()
+    client.config = client.config.model_copy(
+        update={"rpc_hedge_delay_ms": 10, "rpc_retry_delay": 0, "rpc_max_retries": 3}
+    )
+    return client
+
+
+class FakeResponse:
+    """aiohttp response stand-in returning a fixed JSON body."""
+    
+    def __init__(self, body: dict):
+        self.body = body
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def raise_for_status(self) -> None:
+        pass
+    
+    async def read(self) -> bytes:
+        return json_dumps_bytes(self.body)
+
+
+class FakeSession:
+    """aiohttp session stand-in that raises or answers each post in turn."""
+    
+    def __init__(self, outcomes: list):
+        self.outcomes = list(outcomes)
+        self.urls = []
+    
+    def post(self, url: str, json=None):
+        self.urls.append(url)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome)
+
+
+class BatchRejectingSession:
+    """aiohttp session stand-in for an endpoint that answers single calls but rejects batches."""
+    
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+    
+    def post(self, url: str, json=None):
+        self.requests.append(json)
+        if isinstance(json, list):
+            return FakeResponse({
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "Batch requests are not supported"},
+            })
+        return FakeResponse({
+            "jsonrpc": "2.0",
+            "id": json["id"],
+            "result": self.handler(json["method"], json["params"]),
+        })
+
+
+class TestRetries:
+    """Test retrying single RPC requests."""
+    
+    @pytest.mark.asyncio
+    async def test_retry_then_success(self, rpc_client):
+        """Test that transport errors are retried until a response arrives."""
+        rpc_client.session = FakeSession([
+            aiohttp.ClientConnectionError("reset"),
+            asyncio.TimeoutError(),
+            {"jsonrpc": "2.0", "id": 1, "result": 42},
+        ])
+        
+        response = await rpc_client._make_request(
+            "https://rpc.example", "getSlot", [], "quicknode"
+        )
+        
+        assert response["result"] == 42
+        assert rpc_client.session.urls == ["https://rpc.example"] * 3
+    
+    @pytest.mark.asyncio
+    async def test_retries_exhausted(self, rpc_client):
+        """Test that the last transport error is raised after rpc_max_retries attempts."""
+        rpc_client.session = FakeSession([aiohttp.ClientConnectionError("reset")] * 3)
+        
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await rpc_client._make_request("https://rpc.example", "getSlot", [], "quicknode")
+        assert len(rpc_client.session.urls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_not_retried(self, rpc_client):
+        """Test that errors other than transport failures give up immediately."""
+        rpc_client.session = FakeSession([
+            ValueError("bad params"),
+            {"jsonrpc": "2.0", "id": 1, "result": 42},
+        ])
+        
+        with pytest.raises(ValueError):
+            await rpc_client._make_request("https://rpc.example", "getSlot", [], "quicknode")
+        assert len(rpc_client.session.urls) == 1
+
+
+class TestHedging:
+    """Test racing the backup provider against a slow primary."""
+    
+    @pytest.mark.asyncio
+    async def test_slow_primary_cancels_backup_before_send(self, rpc_client):
+        """Test that the backup is cancelled before sending when the primary wins."""
+        sent = []
+        
+        async def primary():
+            await asyncio.sleep(0.05)
+            return "primary"
+        
+        async def backup():
+            await asyncio.sleep(1)  # Connection setup before the request is written
+            sent.append("backup")
+            return "backup"
+        
+        assert await rpc_client._hedged(primary, backup) == "primary"
+        await asyncio.sleep(0)
+        assert sent == []
+    
+    @pytest.mark.asyncio
+    async def test_large_batch_not_hedged(self, rpc_client):
+        """Test that without hedging the backup only runs if the primary fails."""
+        started = []
+        
+        async def primary():
+            await asyncio.sleep(0.05)
+            return "primary"
+        
+        async def backup():
+            started.append("backup")
+            return "backup"
+        
+        assert await rpc_client._hedged(primary, backup, hedge=False) == "primary"
+        assert started == []
+    
+    @pytest.mark.asyncio
+    async def test_send_batch_hedges_only_small_batches(self, rpc_client):
+        """Test that a slow large batch isn't duplicated on the backup."""
+        rpc_client._initialized = True
+        rpc_client.backup_client = MagicMock()
+        providers = []
+        
+        async def make_batch_request(url, calls, provider):
+            providers.append(provider)
+            await asyncio.sleep(0.05)
+            return [{"result": None} for _ in calls]
+        
+        rpc_client._make_batch_request = make_batch_request
+        
+        await rpc_client._send_batch([("getTransaction", [str(i)]) for i in range(100)])
+        assert providers == ["quicknode"]
+        
+        providers.clear()
+        await rpc_client._send_batch([("getAccountInfo", ["mint"])])
+        assert providers == ["quicknode", "helius"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_primary_falls_back(self, rpc_client):
+        """Test that a failed primary is answered by the backup."""
+        async def primary():
+            raise ConnectionError("primary down")
+        
+        async def backup():
+            return "backup"
+        
+        assert await rpc_client._hedged(primary, backup, hedge=False) == "backup"
+
+
+@pytest.fixture
+async def batching_client(rpc_client):
+    """Start the batch flusher of an RPCClient whose _send_batch is mocked."""
+    rpc_client._initialized = True
+    rpc_client._queue = asyncio.Queue()
+    rpc_client._send_batch = AsyncMock(
+        side_effect=lambda calls: [{"result": params} for _, params in calls]
+    )
+    flush_task = asyncio.create_task(rpc_client._flush_loop())
+    yield rpc_client
+    flush_task.cancel()
+    await asyncio.gather(flush_task, return_exceptions=True)
+
+
+class TestBatching:
+    """Test coalescing concurrent calls into batch requests."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self, batching_client):
+        """Test that calls made together go out in one batch and get their own responses."""
+        responses = await asyncio.gather(
+            batching_client._coalesced_request("getBalance", ["a"]),
+            batching_client._coalesced_request("getBalance", ["b"]),
+        )
+        
+        assert responses == [{"result": ["a"]}, {"result": ["b"]}]
+        batching_client._send_batch.assert_awaited_once_with(
+            [("getBalance", ["a"]), ("getBalance", ["b"])]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_fails_every_caller(self, batching_client):
+        """Test that a batch error reaches every caller in the batch."""
+        batching_client._send_batch.side_effect = ConnectionError("RPC down")
+        
+        results = await asyncio.gather(
+            batching_client._coalesced_request("getBalance", ["a"]),
+            batching_client._coalesced_request("getBalance", ["b"]),
+            return_exceptions=True,
+        )
+        
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+
+class TestSingleFlight:
+    """Test sharing identical in-flight calls."""
+    
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_request(self, batching_client):
+        """Test that identical concurrent calls are sent once and all get the response."""
+        responses = await asyncio.gather(
+            *(batching_client._coalesced_request("getSlot", []) for _ in range(5))
+        )
+        
+        assert responses == [{"result": []}] * 5
+        batching_client._send_batch.assert_awaited_once_with([("getSlot", [])])
+        assert not batching_client._inflight
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_waiters(self, batching_client):
+        """Test that cancelling one caller leaves the shared call running for the others."""
+        release = asyncio.Event()
+        
+        async def send_batch(calls):
+            await release.wait()
+            return [{"result": 42} for _ in calls]
+        
+        batching_client._send_batch = AsyncMock(side_effect=send_batch)
+        first = asyncio.create_task(batching_client._coalesced_request("getSlot", []))
+        second = asyncio.create_task(batching_client._coalesced_request("getSlot", []))
+        await asyncio.sleep(0.1)
+        
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        
+        assert await second == {"result": 42}
+        assert first.cancelled()
+        assert batching_client._send_batch.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_call_fails_every_waiter(self, batching_client):
+        """Test that an error reaches every caller sharing the call and isn't kept."""
+        batching_client._send_batch.side_effect = ConnectionError("RPC down")
+        
+        results = await asyncio.gather(
+            batching_client._coalesced_request("getSlot", []),
+            batching_client._coalesced_request("getSlot", []),
+            return_exceptions=True,
+        )
+        
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert not batching_client._inflight
+
+
+def _supply(method: str, params: list) -> dict:
+    return {"value": {"amount": "1000", "decimals": 6, "mint": params[0]}}
+
+
+class TestBatchFallback:
+    """Test sending calls individually when a batch goes unanswered."""
+    
+    @pytest.mark.asyncio
+    async def test_rejected_batch_answered_individually(self, batching_client):
+        """Test that single-call helpers still work on an endpoint that rejects batches."""
+        session = BatchRejectingSession(_supply)
+        batching_client.session = session
+        del batching_client._send_batch  # Use the real one
+        
+        supplies = await asyncio.gather(
+            batching_client.get_token_supply("mint1"),
+            batching_client.get_token_supply("mint2"),
+        )
+        
+        assert [supply["result"]["value"]["mint"] for supply in supplies] == ["mint1", "mint2"]
+        assert isinstance(session.requests[0], list)
+        assert [request["params"][0] for request in session.requests[1:]] == ["mint1", "mint2"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_sent_individually(self, rpc_client):
+        """Test that calls are sent one by one when the batch request itself fails."""
+        rpc_client._initialized = True
+        rpc_client.session = BatchRejectingSession(_supply)
+        rpc_client._make_batch_request = AsyncMock(side_effect=aiohttp.ClientConnectionError())
+        
+        responses = await rpc_client._send_batch([("getTokenSupply", ["mint1"])])
+        
+        assert responses[0]["result"]["value"]["mint"] == "mint1"
+    
+    @pytest.mark.asyncio
+    async def test_batch_error_raised_when_nothing_answers(self, rpc_client):
+        """Test that the batch error is raised if the individual calls fail too."""
+        rpc_client._initialized = True
+        rpc_client._make_batch_request = AsyncMock(side_effect=aiohttp.ClientConnectionError())
+        rpc_client._call = AsyncMock(side_effect=aiohttp.ClientConnectionError())
+        
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await rpc_client._send_batch([("getTokenSupply", ["mint1"])])
+    
+    @pytest.mark.asyncio
+    async def test_call_errors_not_resent(self, rpc_client):
+        """Test that a call answered with its own error isn't sent again."""
+        rpc_client._initialized = True
+        rpc_client._make_batch_request = AsyncMock(return_value=[
+            {"result": {"value": 1}},
+            {"error": {"code": -32602, "message": "Invalid param"}},
+            {},
+        ])
+        rpc_client._call = AsyncMock(return_value={"result": {"value": 3}})
+        
+        responses = await rpc_client._send_batch(
+            [("getBalance", ["a"]), ("getBalance", ["b"]), ("getBalance", ["c"])]
+        )
+        
+        assert responses[1]["error"]["code"] == -32602
+        assert responses[2] == {"result": {"value": 3}}
+        rpc_client._call.assert_awaited_once_with("getBalance", ["c"])
+
+
+class TestBatchCall:
+    """Test batch_call's handling of batches that fail or go unanswered."""
+    
+    @pytest.mark.asyncio
+    async def test_unanswered_calls_sent_individually(self, rpc_client):
+        """Test that calls a rejected batch leaves unanswered are made one by one."""
+        rpc_client._initialized = True
+        rpc_client.session = BatchRejectingSession(_supply)
+        
+        responses = await rpc_client.batch_call(
+            [("getTokenSupply", ["mint1"]), ("getTokenSupply", ["mint2"])]
+        )
+        
+        assert [response["result"]["value"]["mint"] for response in responses] == [
+            "mint1",
+            "mint2",
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_sent_individually(self, rpc_client):
+        """Test that every call is made one by one when the batch request fails."""
+        rpc_client._initialized = True
+        rpc_client.session = BatchRejectingSession(_supply)
+        rpc_client._make_batch_request = AsyncMock(side_effect=asyncio.TimeoutError())
+        
+        responses = await rpc_client.batch_call(
+            [("getTokenSupply", ["mint1"]), ("getTokenSupply", ["mint2"])]
+        )
+        
+        assert all("result" in response for response in responses)
+    
+    @pytest.mark.asyncio
+    async def test_failed_calls_come_back_empty(self, rpc_client):
+        """Test that calls failing both ways get empty responses instead of raising."""
+        rpc_client._initialized = True
+        rpc_client._make_batch_request = AsyncMock(side_effect=asyncio.TimeoutError())
+        rpc_client._call = AsyncMock(side_effect=[{"result": 1}, asyncio.TimeoutError()])
+        
+        responses = await rpc_client.batch_call([("getBalance", ["a"]), ("getBalance", ["b"])])
+        assert responses == [{"result": 1}, {}]
+        
+        rpc_client._call = AsyncMock(side_effect=asyncio.TimeoutError())
+        responses = await rpc_client.batch_call([("getBalance", ["a"]), ("getBalance", ["b"])])
+        assert responses == [{}, {}]
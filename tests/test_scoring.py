@@ -163,6 +163,15 @@ class TestMoonScoreCalculator:
         assert "WEAK" in self.calculator.get_rating(45)
         assert "VERY WEAK" in self.calculator.get_rating(35)
     
+    def test_rating_boundaries(self):
+        """Test that rating thresholds are inclusive lower bounds."""
+        assert self.calculator.get_rating(90) == "🌕 MOON SHOT"
+        assert self.calculator.get_rating(89.99) == "🚀 VERY STRONG"
+        assert self.calculator.get_rating(40) == "⚠️ WEAK"
+        assert self.calculator.get_rating(39.99) == "🚫 VERY WEAK"
+        assert self.calculator.get_rating(100) == "🌕 MOON SHOT"
+        assert self.calculator.get_rating(0) == "🚫 VERY WEAK"
+    
     def test_zero_liquidity_handling(self):
         """Test handling of zero liquidity."""
         metrics = TokenMetrics(
@@ -188,6 +197,33 @@ class TestMoonScoreCalculator:
         
         # Should give neutral score when no data
         assert result.components.buy_pressure == 50.0
+    
+    def test_max_possible_score_bounds_calculate(self):
+        """Test that the age-only upper bound is never exceeded."""
+        for age in (5.0, 20.0, 40.0, 90.0):
+            metrics = TokenMetrics(
+                token_address="test123",
+                buy_transactions_24h=100,
+                volume_24h=1000000,
+                liquidity_usd=20000,
+                total_holders=100,
+                holder_growth_24h=200,
+                transactions_24h=500,
+                price_change_24h=500.0,
+                age_minutes=age,
+            )
+            social_metrics = {
+                "twitter_mentions_24h": 1000,
+                "twitter_mentions_growth": 100.0,
+            }
+            
+            result = self.calculator.calculate(metrics, social_metrics)
+            
+            assert result.total_score <= self.calculator.max_possible_score(age)
+        
+        # Older tokens lose the age bonuses
+        assert self.calculator.max_possible_score(5.0) == 100.0
+        assert self.calculator.max_possible_score(50.0) == pytest.approx(98.5)
 
 
 class TestWeightedScoring:
@@ -0,0 +1,130 @@
+"""Tests for the WebSocket manager."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.core.websocket_manager import Subscription, WebSocketManager
+from src.utils.serialization import json_loads
+
+
+PROGRAM_IDS = [
+    "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",
+    "CAMMCzo5YL8w4VFF8KVHrK22GGUsp5VTaW7grrKgrWqK",
+]
+
+
+@pytest.fixture
+def manager():
+    """Create a WebSocketManager with a mocked socket."""
+    manager = WebSocketManager()
+    manager.ws = MagicMock()
+    manager.ws.send_str = AsyncMock()
+    return manager
+
+
+def _sent_frames(manager) -> list:
+    return [json_loads(call.args[0]) for call in manager.ws.send_str.call_args_list]
+
+
+class TestBatchRejection:
+    """Test recovery when a node refuses batch frames."""
+    
+    @pytest.mark.asyncio
+    async def test_rejected_batch_resent_individually(self, manager):
+        """Test that a batch answered with a single error is resent one request per frame."""
+        await manager.subscribe_logs(PROGRAM_IDS, AsyncMock())
+        assert isinstance(_sent_frames(manager)[0], list)
+        
+        await manager._handle_message({
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32600, "message": "Invalid Request"},
+        })
+        
+        frames = _sent_frames(manager)[1:]
+        assert [frame["params"][0]["mentions"] for frame in frames] == [
+            [program_id] for program_id in PROGRAM_IDS
+        ]
+        
+        # Confirmations for the individual requests register both server IDs
+        for server_id, frame in enumerate(frames, start=10):
+            await manager._handle_message({"id": frame["id"], "result": server_id})
+        assert manager.server_subscriptions == {10: 0, 11: 0}
+    
+    @pytest.mark.asyncio
+    async def test_later_requests_not_batched(self, manager):
+        """Test that requests after a rejection are no longer sent as a batch."""
+        await manager.subscribe_logs(PROGRAM_IDS, AsyncMock())
+        await manager._handle_message({"jsonrpc": "2.0", "id": None, "error": {"code": -32600}})
+        manager.ws.send_str.reset_mock()
+        
+        await manager._resubscribe_all()
+        
+        assert all(isinstance(frame, dict) for frame in _sent_frames(manager))
+        assert len(_sent_frames(manager)) == len(PROGRAM_IDS)
+    
+    @pytest.mark.asyncio
+    async def test_batch_response_accepted(self, manager):
+        """Test that a batch answered with an array keeps batching enabled."""
+        await manager.subscribe_logs(PROGRAM_IDS, AsyncMock())
+        
+        await manager._handle_message([
+            {"jsonrpc": "2.0", "id": 0, "result": 10},
+            {"jsonrpc": "2.0", "id": 0, "result": 11},
+        ])
+        
+        assert manager.server_subscriptions == {10: 0, 11: 0}
+        assert manager._batch_supported
+        assert not manager._pending_batches
+
+
+def _dropped_metric() -> float:
+    return REGISTRY.get_sample_value(
+        "moon_scanner_errors_total",
+        {"error_type": "websocket_event_dropped", "component": "websocket_manager"},
+    ) or 0.0
+
+
+def _notification(server_id: int, slot: int) -> dict:
+    return {
+        "method": "logsNotification",
+        "params": {"subscription": server_id, "result": {"context": {"slot": slot}}},
+    }
+
+
+class TestDispatchQueue:
+    """Test handing notifications to the callback workers."""
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self, manager):
+        """Test that events beyond the queue bound are shed, counted and reported."""
+        manager._dispatch_queue = asyncio.Queue(maxsize=2)
+        callback = AsyncMock()
+        manager.subscriptions.append(Subscription(type="logs", callback=callback))
+        manager.server_subscriptions[10] = 0
+        metric_before = _dropped_metric()
+        
+        for slot in range(5):
+            await manager._handle_event(_notification(10, slot))
+        
+        assert manager._dispatch_queue.qsize() == 2
+        assert manager.dropped_events == 3
+        assert _dropped_metric() == metric_before + 3
+        
+        # The events that were queued still reach the callback, in order
+        worker = asyncio.create_task(manager._dispatch_worker())
+        await asyncio.sleep(0)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        assert [call.args[0]["context"]["slot"] for call in callback.await_args_list] == [0, 1]
+    
+    @pytest.mark.asyncio
+    async def test_unknown_subscription_not_queued(self, manager):
+        """Test that notifications for unknown subscriptions are neither queued nor dropped."""
+        await manager._handle_event(_notification(99, 0))
+        
+        assert manager._dispatch_queue.empty()
+        assert manager.dropped_events == 0